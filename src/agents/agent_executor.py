@@ -3,11 +3,14 @@ Prompt 기반 Agent 실행기
 
 단일 실행기가 모든 Agent 프롬프트를 읽고 실행
 """
-import subprocess
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 import json
 import re
+from utils.resilience import call_gemini
+from utils.template_registry import get_template_registry
+from utils.prompt_builder import get_prompt_builder, json_layout
+from workflow.rule_engine import get_rule_engine
 
 
 class AgentExecutor:
@@ -23,74 +26,40 @@ class AgentExecutor:
         self._load_agents()
     
     def _load_agents(self):
-        """모든 Agent 프롬프트 로드"""
+        """
+        모든 Agent 프롬프트 로드 (공용 템플릿 레지스트리 사용)
+        
+        mtime이 바뀐 파일만 다시 파싱되므로 실행 시마다 호출해도 비용이 작음
+        """
         if not self.prompts_dir.exists():
             print(f"⚠️ Prompts 디렉토리 없음: {self.prompts_dir}")
             return
         
-        for prompt_file in self.prompts_dir.glob("*.md"):
-            agent_config = self._parse_agent_prompt(prompt_file)
-            if agent_config:
-                agent_name = agent_config['name']
-                self.agents[agent_name] = agent_config
-                print(f"✅ Agent 로드: {agent_name} (v{agent_config.get('version', '1.0')})")
-    
-    def _parse_agent_prompt(self, file_path: Path) -> Optional[dict]:
-        """
-        Agent 프롬프트 파싱 (YAML frontmatter + 프롬프트)
-        
-        Args:
-            file_path: 프롬프트 파일 경로
+        agents = {}
+        for template in get_template_registry().get_dir(self.prompts_dir, "agent").values():
+            agent_name = template.metadata['name']
+            previous = self.agents.get(agent_name)
+            if previous and previous['template'] is template:
+                agents[agent_name] = previous
+                continue
             
-        Returns:
-            Agent 설정 딕셔너리
-        """
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            
-            # YAML frontmatter 추출
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    # YAML 파싱 (수동 - yaml 라이브러리 없이)
-                    frontmatter_text = parts[1].strip()
-                    frontmatter = {}
-                    
-                    for line in frontmatter_text.split('\n'):
-                        if ':' in line:
-                            key, value = line.split(':', 1)
-                            key = key.strip()
-                            value = value.strip()
-                            
-                            # 타입 변환
-                            if value.lower() == 'true':
-                                value = True
-                            elif value.lower() == 'false':
-                                value = False
-                            elif value.replace('.', '').isdigit():
-                                value = float(value) if '.' in value else int(value)
-                            
-                            frontmatter[key] = value
-                    
-                    prompt_content = parts[2].strip()
-                    
-                    return {
-                        **frontmatter,
-                        'prompt_template': prompt_content,
-                        'file': str(file_path)
-                    }
-            
-            return None
-            
-        except Exception as e:
-            print(f"⚠️ Agent 파싱 오류 ({file_path}): {e}")
-            return None
+            agent_config = {
+                **template.metadata,
+                'prompt_template': template.text,
+                'file': str(template.path),
+                'template': template
+            }
+            agents[agent_name] = agent_config
+            print(f"✅ Agent 로드: {agent_name} (v{agent_config.get('version', '1.0')})")
+        
+        self.agents = agents
     
     def execute_agent(self, 
                      agent_name: str, 
                      task: str, 
                      context: Dict[str, Any],
-                     use_llm: bool = True) -> Dict[str, Any]:
+                     use_llm: bool = True,
+                     use_cache: bool = True) -> Dict[str, Any]:
         """
         Agent 실행
         
@@ -99,13 +68,15 @@ class AgentExecutor:
             task: 수행할 작업
             context: 컨텍스트 데이터
             use_llm: LLM 사용 여부 (False면 Mock)
+            use_cache: 응답 캐시 사용 여부
             
         Returns:
             실행 결과
         """
         from utils.logger import review_logger
         
-        # Agent 로드
+        # Agent 로드 (변경된 프롬프트 파일만 다시 읽음)
+        self._load_agents()
         if agent_name not in self.agents:
             raise ValueError(f"Agent '{agent_name}' not found. Available: {list(self.agents.keys())}")
         
@@ -125,7 +96,8 @@ class AgentExecutor:
         result = self._call_llm(
             prompt=prompt,
             model=agent_config.get('model', 'gemini-2.0-flash-exp'),
-            temperature=agent_config.get('temperature', 0.7)
+            temperature=agent_config.get('temperature', 0.7),
+            use_cache=use_cache
         )
         
         if 'error' in result:
@@ -140,98 +112,68 @@ class AgentExecutor:
                      agent_config: dict, 
                      task: str, 
                      context: Dict[str, Any]) -> str:
-        """프롬프트 구성"""
-        prompt_template = agent_config['prompt_template']
-        
-        # 컨텍스트 변수 치환
-        for key, value in context.items():
-            placeholder = f"{{{key}}}"
-            if placeholder in prompt_template:
-                prompt_template = prompt_template.replace(placeholder, str(value))
+        """
+        프롬프트 구성
         
-        # Task 추가
-        full_prompt = f"""{prompt_template}
-
----
-
-# Task
-{task}
-
-Context Data:
-{json.dumps(context, indent=2, ensure_ascii=False)}
-"""
-        return full_prompt
+        템플릿에 치환된 컨텍스트 항목은 Context Data에 다시 넣지 않고,
+        토큰 예산을 넘으면 부가 컨텍스트만 축소 (검토 대상 문서 content는 그대로)
+        """
+        built = get_prompt_builder("gemini").build(
+            agent_config['template'],
+            context,
+            layout=json_layout(task),
+            priorities={'content': 100},
+            required=('content',),
+            label=agent_config.get('name', 'agent')
+        )
+        return built.text
     
     def _call_llm(self, 
                  prompt: str, 
                  model: str, 
-                 temperature: float) -> Dict[str, Any]:
-        """LLM 호출 (Gemini CLI)"""
+                 temperature: float,
+                 use_cache: bool = True) -> Dict[str, Any]:
+        """LLM 호출 (공용 call_gemini: 캐시 → 상주 워커 → CLI)"""
         try:
-            result = subprocess.run(
-                ["gemini", "chat", 
-                 "--model", model,
-                 "--temperature", str(temperature),
-                 "--prompt", prompt],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode != 0:
-                return {"error": result.stderr}
-            
-            # JSON 파싱
-            output = result.stdout.strip()
-            
-            # Markdown 코드 블록 제거
-            if "```json" in output:
-                output = output.split("```json")[1].split("```")[0].strip()
-            elif "```" in output:
-                output = output.split("```")[1].split("```")[0].strip()
-            
-            try:
-                return json.loads(output)
-            except json.JSONDecodeError:
-                # JSON이 아니면 텍스트로 반환
-                return {"response": output}
-                
-        except subprocess.TimeoutExpired:
+            output = call_gemini(prompt, model=model, temperature=temperature, timeout=60, use_cache=use_cache)
+        except TimeoutError:
             return {"error": "Timeout (60초 초과)"}
         except FileNotFoundError:
             return {"error": "Gemini CLI not found"}
         except Exception as e:
             return {"error": str(e)}
+        return self._parse_llm_output(output)
+    
+    def _parse_llm_output(self, output: str) -> Dict[str, Any]:
+        """LLM 출력에서 JSON 파싱"""
+        # Markdown 코드 블록 제거
+        if "```json" in output:
+            output = output.split("```json")[1].split("```")[0].strip()
+        elif "```" in output:
+            output = output.split("```")[1].split("```")[0].strip()
+        
+        try:
+            return json.loads(output)
+        except json.JSONDecodeError:
+            # JSON이 아니면 텍스트로 반환
+            return {"response": output}
     
     def _mock_execution(self, agent_config: dict, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Mock 실행 (LLM 없이 기본 검증)
         
-        Review Agent의 경우 간단한 키워드 체크
+        Review Agent의 경우 공용 규칙 엔진으로 구조 검사
         """
         content = context.get('content', '')
         doc_type = context.get('document_type', 'spec')
         
         if agent_config['name'] == 'Review Agent':
-            # 간단한 검증
-            checks = {}
-            
-            if doc_type == 'spec':
-                checks = {
-                    'has_user_stories': 'User Story' in content,
-                    'has_requirements': 'Requirements' in content,
-                    'has_success_criteria': 'Success Criteria' in content,
-                    'min_length': len(content) > 500
-                }
-            elif doc_type == 'plan':
-                checks = {
-                    'has_phases': 'Phase' in content,
-                    'has_structure': 'Project Structure' in content or '구조' in content,
-                    'has_verification': 'Verification' in content or 'Test' in content,
-                    'min_length': len(content) > 800
-                }
+            # 공용 규칙 엔진 구조 검사 (규칙 없는 문서 유형은 0.5)
+            engine = get_rule_engine()
+            evaluation = engine.evaluate(doc_type, content) if doc_type in engine.doc_types else None
+            checks = evaluation.checks if evaluation else {}
             
-            score = sum(checks.values()) / len(checks) if checks else 0.5
+            score = evaluation.score if evaluation else 0.5
             approved = score >= 0.7
             
             issues = [key for key, value in checks.items() if not value]
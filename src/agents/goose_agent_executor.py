@@ -3,11 +3,17 @@ Goose 기반 Agent 실행기
 
 Goose Session에 역할 프롬프트를 전달하여 모든 Agent 작업 처리
 """
-import subprocess
 from pathlib import Path
 from typing import Dict, Any, Optional
 import json
-import tempfile
+from utils.response_cache import get_response_cache
+from utils.prompt_transport import get_prompt_transport
+from utils.resilience import get_resilience
+from utils.output_stream import get_output_hub
+from utils.template_registry import PromptTemplate, get_template_registry
+from utils.prompt_builder import get_prompt_builder
+from integrations.capability_registry import get_capability_registry
+from agents.goose_session_manager import get_goose_session_manager
 
 
 class GooseAgentExecutor:
@@ -20,105 +26,60 @@ class GooseAgentExecutor:
         """
         self.prompts_dir = Path(prompts_dir)
         self.agents = {}
+        self.sessions = get_goose_session_manager()
         self.goose_available = self._check_goose()
         
         if self.goose_available:
             self._load_agents()
     
     def _check_goose(self) -> bool:
-        """Goose CLI 설치 확인"""
-        try:
-            result = subprocess.run(
-                ["goose", "--version"],
-                capture_output=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                print("✅ Goose CLI 활성화")
-                return True
-            else:
-                print("⚠️ Goose CLI not found")
-                return False
-        except Exception as e:
-            print(f"⚠️ Goose CLI check failed: {e}")
+        """Goose CLI 설치 확인 (공용 레지스트리 캐시 사용)"""
+        capability = get_capability_registry().get("goose")
+        if capability.available:
+            print("✅ Goose CLI 활성화")
+            return True
+        else:
+            print(f"⚠️ Goose CLI check failed: {capability.error or 'not found'}")
             return False
     
     def _load_agents(self):
-        """모든 Agent 프롬프트 로드"""
+        """
+        모든 Agent 프롬프트 로드 (공용 템플릿 레지스트리 사용)
+        
+        mtime이 바뀐 파일만 다시 파싱되므로 실행 시마다 호출해도 비용이 작음
+        """
         if not self.prompts_dir.exists():
             print(f"⚠️ Prompts 디렉토리 없음: {self.prompts_dir}")
             self.prompts_dir.mkdir(parents=True, exist_ok=True)
             return
         
-        for prompt_file in self.prompts_dir.glob("*.md"):
-            agent_config = self._parse_agent_prompt(prompt_file)
-            if agent_config:
-                agent_name = agent_config['name']
-                self.agents[agent_name] = agent_config
-                print(f"✅ Agent 로드: {agent_name}")
-    
-    def _parse_agent_prompt(self, file_path: Path) -> Optional[dict]:
-        """
-        Agent 프롬프트 파싱 (YAML frontmatter + 프롬프트)
-        
-        Args:
-            file_path: 프롬프트 파일 경로
+        agents = {}
+        for template in get_template_registry().get_dir(self.prompts_dir, "agent").values():
+            agent_name = template.metadata['name']
+            previous = self.agents.get(agent_name)
+            if previous and previous['template'] is template:
+                agents[agent_name] = previous
+                continue
             
-        Returns:
-            Agent 설정 딕셔너리
-        """
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            
-            # YAML frontmatter 추출
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    # YAML 파싱 (수동)
-                    frontmatter_text = parts[1].strip()
-                    frontmatter = {}
-                    
-                    for line in frontmatter_text.split('\n'):
-                        if ':' in line:
-                            key, value = line.split(':', 1)
-                            key = key.strip()
-                            value = value.strip()
-                            
-                            # 타입 변환
-                            if value.lower() == 'true':
-                                value = True
-                            elif value.lower() == 'false':
-                                value = False
-                            elif value.replace('.', '').isdigit():
-                                value = float(value) if '.' in value else int(value)
-                            
-                            frontmatter[key] = value
-                    
-                    prompt_content = parts[2].strip()
-                    
-                    return {
-                        **frontmatter,
-                        'prompt_template': prompt_content,
-                        'file': str(file_path)
-                    }
-            
-            # frontmatter 없으면 전체를 프롬프트로
-            return {
-                'name': file_path.stem.replace('_', ' ').title(),
-                'prompt_template': content,
-                'file': str(file_path)
+            agent_config = {
+                **template.metadata,
+                'prompt_template': template.text,
+                'file': str(template.path),
+                'template': template
             }
-            
-        except Exception as e:
-            print(f"⚠️ Agent 파싱 오류 ({file_path}): {e}")
-            return None
+            agents[agent_name] = agent_config
+            print(f"✅ Agent 로드: {agent_name}")
+        
+        self.agents = agents
     
     def execute_agent(self,
                      agent_name: str,
                      task: str,
                      context: Dict[str, Any],
                      issue_number: Optional[int] = None,
-                     timeout: int = 120) -> Dict[str, Any]:
+                     timeout: int = 120,
+                     use_cache: bool = True,
+                     workspace: Optional[Path] = None) -> Dict[str, Any]:
         """
         Agent 실행 (Goose Session 활용)
         
@@ -128,6 +89,8 @@ class GooseAgentExecutor:
             context: 컨텍스트 데이터
             issue_number: Issue 번호 (선택)
             timeout: Timeout (초)
+            use_cache: 응답 캐시 사용 여부
+            workspace: Goose 작업 디렉토리 (기본값: 현재 디렉토리)
             
         Returns:
             실행 결과
@@ -138,7 +101,8 @@ class GooseAgentExecutor:
             workflow_logger.warning("⚠️ Goose CLI 미사용 - Fallback 필요")
             return {"error": "Goose CLI not available"}
         
-        # Agent 로드
+        # Agent 로드 (변경된 프롬프트 파일만 다시 읽음)
+        self._load_agents()
         if agent_name not in self.agents:
             available = list(self.agents.keys())
             workflow_logger.error(f"❌ Agent '{agent_name}' not found. Available: {available}")
@@ -147,23 +111,40 @@ class GooseAgentExecutor:
         agent_config = self.agents[agent_name]
         workflow_logger.info(f"🤖 {agent_name} 실행 중...")
         
-        # 역할 프롬프트 로드
-        role_prompt = agent_config['prompt_template']
+        # 전체 프롬프트 구성 (역할 프롬프트 + Task + 템플릿에 없는 컨텍스트)
+        template = agent_config['template']
+        full_prompt = self._build_prompt(template, task, context, label=agent_name)
+        
+        # Issue별 세션 재사용: 역할 프롬프트가 로드된 세션이면 Task + 컨텍스트만 전달
+        session = None
+        if issue_number is not None:
+            session = self.sessions.acquire(agent_name, issue_number, f"{template.path}:{template.mtime_ns}")
         
-        # Session 이름 생성
-        session_name = self._create_session_name(agent_name, issue_number)
-        workflow_logger.debug(f"  Session: {session_name}")
+        session_name = session.name if session else self._create_session_name(agent_name, issue_number)
+        resume = bool(session and session.warm)
+        workflow_logger.debug(f"  Session: {session_name}" + (" (resume)" if resume else ""))
         
         # Goose Session 실행
         try:
             result = self._run_goose_session(
                 session_name=session_name,
-                role_prompt=role_prompt,
-                task=task,
-                context=context,
-                timeout=timeout
+                full_prompt=full_prompt,
+                timeout=timeout,
+                use_cache=use_cache,
+                workspace=workspace,
+                issue_number=issue_number,
+                send_prompt=self._build_prompt(None, task, context, label=f"{agent_name} (resume)") if resume else None,
+                resume=resume
             )
             
+            if session:
+                self.sessions.release(session, bool(result.get('success')), ran=not result.get('cached'))
+                if resume and not result.get('success') and not result.get('timed_out'):
+                    # 세션을 이어가지 못함 → 새 세션에서 역할 프롬프트부터 다시 실행
+                    workflow_logger.warning("  ⚠️ 세션 재사용 실패 - 새 세션으로 재시도")
+                    return self.execute_agent(agent_name, task, context, issue_number,
+                                              timeout, use_cache, workspace)
+            
             if result.get('success'):
                 workflow_logger.info(f"✅ {agent_name} 완료")
             else:
@@ -172,6 +153,8 @@ class GooseAgentExecutor:
             return result
             
         except Exception as e:
+            if session:
+                self.sessions.release(session, False)
             workflow_logger.error(f"❌ {agent_name} 오류: {e}")
             return {"error": str(e)}
     
@@ -186,43 +169,63 @@ class GooseAgentExecutor:
     
     def _run_goose_session(self,
                           session_name: str,
-                          role_prompt: str,
-                          task: str,
-                          context: Dict[str, Any],
-                          timeout: int = 120) -> Dict[str, Any]:
+                          full_prompt: str,
+                          timeout: int = 120,
+                          use_cache: bool = True,
+                          workspace: Optional[Path] = None,
+                          issue_number: Optional[int] = None,
+                          send_prompt: Optional[str] = None,
+                          resume: bool = False) -> Dict[str, Any]:
         """
         Goose Session 실행
         
-        Goose에게 역할 프롬프트 + Task 전달
+        Goose에게 구성된 프롬프트(역할 프롬프트 + Task + 컨텍스트) 전달
+        동일한 프롬프트의 성공 응답은 캐시에서 반환 (use_cache=False면 우회)
+        issue_number가 있으면 출력을 Issue 로그/링 버퍼로 실시간 스트리밍
+        
+        resume=True면 기존 세션을 이어서 send_prompt(역할 프롬프트 제외)만 전달하고,
+        캐시 키는 전송 방식과 관계없이 full_prompt 기준
         """
         from utils.logger import workflow_logger
         
-        # 전체 프롬프트 구성
-        full_prompt = self._build_prompt(role_prompt, task, context)
-        
-        workflow_logger.debug(f"  프롬프트 길이: {len(full_prompt)} 글자")
+        prompt = send_prompt or full_prompt
+        workflow_logger.debug(f"  프롬프트 길이: {len(prompt)} 글자"
+                              + (f" (전체 {len(full_prompt)} 글자)" if send_prompt else ""))
         
-        # 프롬프트를 임시 파일에 저장
-        with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', 
-                                         suffix='.md', delete=False) as f:
-            f.write(full_prompt)
-            prompt_file = f.name
+        cache = get_response_cache()
+        if use_cache:
+            cached = cache.get("goose", None, None, full_prompt)
+            if cached is not None:
+                workflow_logger.debug("  ♻️ 캐시된 Goose 응답 사용")
+                return {
+                    "success": True,
+                    "output": cached,
+                    "session": session_name,
+                    "cached": True
+                }
         
         try:
-            # Goose Session 실행
+            # Goose Session 실행 (프롬프트는 tmpfs 임시 파일로 전달, 실행 후 삭제)
             workflow_logger.debug(f"  Goose 실행 중... (timeout: {timeout}s)")
             
-            result = subprocess.run(
-                ["goose", "session", "start", session_name,
-                 "--plan", prompt_file],
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=str(Path.cwd())
-            )
+            if resume:
+                command, file_flag = ["goose", "run", "--name", session_name, "--resume"], "--instructions"
+            else:
+                command, file_flag = ["goose", "session", "start", session_name], "--plan"
+            
+            with get_prompt_transport().prepare(command, prompt, file_flag=file_flag) as prepared:
+                result = get_resilience().run_sync(
+                    prepared.args,
+                    backend="goose",
+                    prompt=prompt,
+                    timeout=timeout,
+                    cwd=str(workspace or Path.cwd()),
+                    **get_output_hub().callbacks(issue_number, "goose")
+                )
             
-            # 임시 파일 삭제
-            Path(prompt_file).unlink(missing_ok=True)
+            if result.timed_out:
+                workflow_logger.error(f"  ⏱️ Timeout ({timeout}초 초과)")
+                return {"success": False, "error": f"Timeout ({timeout}s)", "timed_out": True}
             
             if result.returncode != 0:
                 workflow_logger.warning(f"  Goose stderr: {result.stderr[:200]}")
@@ -233,6 +236,7 @@ class GooseAgentExecutor:
                 }
             
             workflow_logger.debug(f"  Goose 출력 길이: {len(result.stdout)} 글자")
+            cache.put("goose", None, None, full_prompt, result.stdout)
             
             return {
                 "success": True,
@@ -240,29 +244,23 @@ class GooseAgentExecutor:
                 "session": session_name
             }
             
-        except subprocess.TimeoutExpired:
-            workflow_logger.error(f"  ⏱️ Timeout ({timeout}초 초과)")
-            Path(prompt_file).unlink(missing_ok=True)
-            return {"success": False, "error": f"Timeout ({timeout}s)"}
         except Exception as e:
             workflow_logger.error(f"  ❌ 예외: {e}")
-            Path(prompt_file).unlink(missing_ok=True)
             return {"success": False, "error": str(e)}
     
     def _build_prompt(self,
-                     role_prompt: str,
+                     template: Optional[PromptTemplate],
                      task: str,
-                     context: Dict[str, Any]) -> str:
-        """프롬프트 구성"""
-        # 컨텍스트 변수 치환
-        prompt = role_prompt
-        for key, value in context.items():
-            placeholder = f"{{{key}}}"
-            if placeholder in prompt:
-                prompt = prompt.replace(placeholder, str(value))
+                     context: Dict[str, Any],
+                     label: str = "goose") -> str:
+        """
+        프롬프트 구성
         
-        # Task 추가
-        full_prompt = f"""{prompt}
+        역할 프롬프트에 치환된 컨텍스트 항목은 Context Data에 다시 넣지 않고,
+        토큰 예산을 넘으면 부가 컨텍스트만 축소 (검토 대상 문서 content는 그대로)
+        """
+        def layout(role_prompt: str, extra: Dict[str, Any]) -> str:
+            return f"""{role_prompt}
 
 ---
 
@@ -272,9 +270,13 @@ class GooseAgentExecutor:
 
 # Context Data
 
-{self._format_context(context)}
+{self._format_context(extra)}
 """
-        return full_prompt
+        
+        built = get_prompt_builder("goose").build(
+            template, context, layout=layout, priorities={'content': 100}, required=('content',), label=label
+        )
+        return built.text
     
     def _format_context(self, context: Dict[str, Any]) -> str:
         """컨텍스트를 읽기 쉬운 형식으로 변환"""
@@ -283,8 +285,9 @@ class GooseAgentExecutor:
             lines.append(f"## {key}")
             lines.append("")
             
-            # 파일 경로인 경우
-            if isinstance(value, (str, Path)) and Path(str(value)).exists():
+            # 파일 경로인 경우 (문서 내용 같은 긴 문자열은 stat 시 ENAMETOOLONG이므로 제외)
+            if isinstance(value, (str, Path)) and len(str(value)) < 1024 and '\n' not in str(value) \
+                    and Path(str(value)).exists():
                 lines.append(f"파일: `{value}`")
             else:
                 lines.append(f"```")
@@ -299,7 +302,10 @@ class GooseAgentExecutor:
     def execute_prompt(self,
                       prompt: str,
                       session_name: str = "custom-session",
-                      timeout: int = 120) -> Dict[str, Any]:
+                      timeout: int = 120,
+                      use_cache: bool = True,
+                      workspace: Optional[Path] = None,
+                      issue_number: Optional[int] = None) -> Dict[str, Any]:
         """
         직접 프롬프트 실행 (Agent 설정 없이)
         
@@ -307,6 +313,9 @@ class GooseAgentExecutor:
             prompt: 실행할 프롬프트
             session_name: 세션 이름
             timeout: Timeout
+            use_cache: 응답 캐시 사용 여부
+            workspace: Goose 작업 디렉토리 (기본값: 현재 디렉토리)
+            issue_number: Issue 번호 (출력 스트리밍용)
             
         Returns:
             실행 결과
@@ -320,10 +329,12 @@ class GooseAgentExecutor:
             workflow_logger.info(f"🤖 Goose 프롬프트 실행 중... (Session: {session_name})")
             result = self._run_goose_session(
                 session_name=session_name,
-                role_prompt="", # 역할 프롬프트 없음 (전체 프롬프트에 포함됨)
-                task=prompt,
-                context={}, # 컨텍스트 없음 (전체 프롬프트에 포함됨)
-                timeout=timeout
+                # 역할 프롬프트/컨텍스트 없음 (전체 프롬프트에 포함됨)
+                full_prompt=self._build_prompt(None, prompt, {}, label=session_name),
+                timeout=timeout,
+                use_cache=use_cache,
+                workspace=workspace,
+                issue_number=issue_number
             )
             
             if result.get('success'):
@@ -0,0 +1,157 @@
+"""
+Goose Session Manager
+
+(Agent 역할, Issue)마다 Goose 세션 하나를 유지
+- 첫 호출: 역할 프롬프트를 포함한 전체 프롬프트로 세션 시작
+- 이후 호출: 같은 세션을 이어서(resume) Task + 컨텍스트만 전달
+- 역할 프롬프트 파일이 바뀌면 새 세션으로 교체
+- 오래 쓰지 않은 세션(GOOSE_SESSION_IDLE_SECONDS)과 최대 개수(GOOSE_SESSION_MAX)를
+  넘는 세션은 가장 오래 전에 사용한 것부터 정리 (LRU)
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+
+SessionKey = Tuple[str, int]
+
+
+@dataclass
+class GooseSession:
+    """유지 중인 Goose 세션"""
+    role: str
+    issue_number: int
+    name: str
+    fingerprint: str  # 역할 프롬프트 버전 (템플릿 경로 + mtime)
+    created_at: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.time)
+    turns: int = 0  # 성공한 호출 수 (0이면 아직 역할 프롬프트를 보내지 않음)
+    busy: bool = False
+
+    @property
+    def warm(self) -> bool:
+        """역할 프롬프트가 이미 로드된 세션인지"""
+        return self.turns > 0
+
+
+class GooseSessionManager:
+    """(역할, Issue)별 Goose 세션 수명 관리"""
+
+    def __init__(self, max_sessions: Optional[int] = None, idle_timeout: Optional[float] = None):
+        """
+        Args:
+            max_sessions: 유지할 최대 세션 수 (기본값: GOOSE_SESSION_MAX 또는 16)
+            idle_timeout: 유휴 세션 만료 시간 (초, 기본값: GOOSE_SESSION_IDLE_SECONDS 또는 900)
+        """
+        self.max_sessions = max_sessions or int(os.getenv("GOOSE_SESSION_MAX", "16"))
+        self.idle_timeout = idle_timeout or float(os.getenv("GOOSE_SESSION_IDLE_SECONDS", "900"))
+        self._sessions: 'OrderedDict[SessionKey, GooseSession]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'created': 0, 'reused': 0, 'evicted': 0, 'replaced': 0}
+
+    def acquire(self, role: str, issue_number: int, fingerprint: str) -> Optional[GooseSession]:
+        """
+        세션 대여
+
+        Args:
+            role: Agent 이름
+            issue_number: Issue 번호
+            fingerprint: 역할 프롬프트 버전
+
+        Returns:
+            GooseSession 또는 None (같은 세션이 다른 호출에서 사용 중 → 일회성 세션 사용)
+        """
+        key = (role, issue_number)
+        now = time.time()
+        with self._lock:
+            self._evict_locked(now)
+
+            session = self._sessions.get(key)
+            if session and session.busy:
+                return None
+            if session and session.fingerprint != fingerprint:
+                # 역할 프롬프트가 바뀜 → 새 세션
+                del self._sessions[key]
+                self.stats['replaced'] += 1
+                session = None
+
+            if session is None:
+                slug = role.lower().replace(' ', '-')
+                session = GooseSession(role, issue_number, f"{slug}-issue-{issue_number}-{int(now)}", fingerprint)
+                self._sessions[key] = session
+                self.stats['created'] += 1
+            else:
+                self.stats['reused'] += 1
+
+            session.busy = True
+            self._sessions.move_to_end(key)
+            self._evict_locked(now)
+            return session
+
+    def release(self, session: GooseSession, success: bool, ran: bool = True):
+        """
+        세션 반납
+
+        Args:
+            session: acquire()로 받은 세션
+            success: 호출 성공 여부 (실패하면 세션 폐기 - 다음 호출은 새 세션에서 역할 프롬프트부터)
+            ran: Goose 프로세스가 실제로 실행되었는지 (응답 캐시 적중이면 False - 세션이
+                 만들어지지 않았으므로 warm으로 표시하지 않음)
+        """
+        with self._lock:
+            session.busy = False
+            session.last_used = time.time()
+            if success and ran:
+                session.turns += 1
+            elif not success and self._sessions.get((session.role, session.issue_number)) is session:
+                del self._sessions[(session.role, session.issue_number)]
+
+    def discard_issue(self, issue_number: int):
+        """Issue의 세션 모두 정리 (워크플로우 종료 시)"""
+        with self._lock:
+            for key in [key for key in self._sessions if key[1] == issue_number]:
+                del self._sessions[key]
+
+    def snapshot(self) -> dict:
+        """세션 상태 (health endpoint용)"""
+        now = time.time()
+        with self._lock:
+            return {
+                'max_sessions': self.max_sessions,
+                'idle_timeout': self.idle_timeout,
+                'sessions': [
+                    {'name': s.name, 'turns': s.turns, 'idle_seconds': round(now - s.last_used, 1)}
+                    for s in self._sessions.values()
+                ],
+                **self.stats
+            }
+
+    def _evict_locked(self, now: float):
+        """만료/초과 세션 정리 (_lock 보유 상태에서 호출, 사용 중인 세션은 제외)"""
+        for key, session in list(self._sessions.items()):
+            if not session.busy and now - session.last_used > self.idle_timeout:
+                del self._sessions[key]
+                self.stats['evicted'] += 1
+
+        for key in list(self._sessions):
+            if len(self._sessions) <= self.max_sessions:
+                break
+            if not self._sessions[key].busy:
+                del self._sessions[key]
+                self.stats['evicted'] += 1
+
+
+_session_manager: Optional[GooseSessionManager] = None
+_session_manager_lock = threading.Lock()
+
+
+def get_goose_session_manager() -> GooseSessionManager:
+    """프로세스 공용 GooseSessionManager 인스턴스"""
+    global _session_manager
+    with _session_manager_lock:
+        if _session_manager is None:
+            _session_manager = GooseSessionManager()
+        return _session_manager
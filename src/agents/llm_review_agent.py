@@ -5,9 +5,12 @@ Gemini를 사용한 고도의 문서 리뷰
 """
 from typing import Optional
 from dataclasses import dataclass
-from pathlib import Path
-import subprocess
 import json
+import os
+import threading
+from utils.resilience import call_gemini
+from integrations.capability_registry import get_capability_registry
+from workflow.rule_engine import evaluate
 
 
 @dataclass
@@ -27,31 +30,45 @@ class ReviewResult:
 class LLMReviewAgent:
     """LLM 기반 Review Agent (Gemini 사용)"""
     
-    def __init__(self, use_llm: bool = True, approval_threshold: float = 0.7):
+    def __init__(self, use_llm: bool = True, approval_threshold: float = 0.7,
+                 cascade: Optional[bool] = None,
+                 cascade_reject_below: Optional[float] = None,
+                 cascade_approve_at: Optional[float] = None):
         """
         Args:
             use_llm: LLM 사용 여부 (False면 Mock 모드)
             approval_threshold: 승인 기준 점수
+            cascade: 단계별 리뷰 사용 여부 (기본값: REVIEW_CASCADE 환경변수, 기본 false)
+                     키워드/구조 검사 점수가 명확하면 그 결과로 확정하고
+                     애매한 구간일 때만 LLM 리뷰 수행
+            cascade_reject_below: 이 점수 미만이면 LLM 없이 거부
+                                  (기본값: REVIEW_CASCADE_REJECT_BELOW 또는 0.5)
+            cascade_approve_at: 이 점수 이상이면 LLM 없이 승인
+                                (기본값: REVIEW_CASCADE_APPROVE_AT 또는 1.0)
         """
         self.use_llm = use_llm
         self.approval_threshold = approval_threshold
         self.gemini_available = self._check_gemini_cli()
         
+        if cascade is None:
+            cascade = os.getenv("REVIEW_CASCADE", "false").lower() == "true"
+        self.cascade = cascade
+        self.cascade_reject_below = (cascade_reject_below if cascade_reject_below is not None
+                                     else float(os.getenv("REVIEW_CASCADE_REJECT_BELOW", "0.5")))
+        self.cascade_approve_at = (cascade_approve_at if cascade_approve_at is not None
+                                   else float(os.getenv("REVIEW_CASCADE_APPROVE_AT", "1.0")))
+        
+        # 단계별 확정 횟수 (밴드 조정용)
+        self._tier_counts = {'rule_reject': 0, 'rule_approve': 0, 'llm': 0}
+        self._tier_lock = threading.Lock()
+        
         if use_llm and not self.gemini_available:
             print("⚠️ Gemini CLI 없음 - Mock 모드로 전환")
             self.use_llm = False
     
     def _check_gemini_cli(self) -> bool:
-        """Gemini CLI 설치 확인"""
-        try:
-            result = subprocess.run(
-                ["gemini", "--version"],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except:
-            return False
+        """Gemini CLI 설치 확인 (공용 레지스트리 캐시 사용)"""
+        return get_capability_registry().is_available("gemini")
     
     def review_spec(self, content: str, issue_title: str, issue_body: str = "") -> ReviewResult:
         """
@@ -70,12 +87,61 @@ class LLMReviewAgent:
         review_logger.info(f"📋 Spec 리뷰 시작: '{issue_title}'")
         
         if self.use_llm and self.gemini_available:
+            if self.cascade:
+                return self._cascade_review_spec(content, issue_title, issue_body)
             review_logger.info("  🤖 Gemini LLM으로 고급 리뷰 수행...")
             return self._llm_review_spec(content, issue_title, issue_body)
         else:
             review_logger.info("  📝 Mock 모드로 기본 검증 수행...")
             return self._mock_review_spec(content, issue_title)
     
+    def _cascade_review_spec(self, content: str, issue_title: str, issue_body: str) -> ReviewResult:
+        """
+        단계별 Spec 리뷰
+        
+        1단계: 키워드/구조 검사 (비용 없음)
+          - 점수 < cascade_reject_below: 거부로 확정
+          - 점수 >= cascade_approve_at: 승인으로 확정
+        2단계: 그 사이 애매한 구간만 Gemini LLM 리뷰
+        """
+        from utils.logger import review_logger
+        
+        score = evaluate("spec", content).score
+        
+        if score < self.cascade_reject_below:
+            tier = 'rule_reject'
+        elif score >= self.cascade_approve_at:
+            tier = 'rule_approve'
+        else:
+            tier = 'llm'
+        
+        with self._tier_lock:
+            self._tier_counts[tier] += 1
+        
+        if tier == 'llm':
+            review_logger.info(f"  🤖 구조 검사 점수 {score:.2f} (애매한 구간) - Gemini LLM 리뷰 수행...")
+            return self._llm_review_spec(content, issue_title, issue_body)
+        
+        review_logger.info(f"  ⚡ 구조 검사 점수 {score:.2f}로 확정 ({tier}) - LLM 리뷰 생략")
+        # 확정한 판정으로 코멘트(승인/거부 표시)까지 생성
+        return self._mock_review_spec(content, issue_title, approved=tier == 'rule_approve')
+    
+    def cascade_stats(self) -> dict:
+        """
+        단계별 확정 비율 (밴드 조정용)
+        
+        Returns:
+            {"total", "counts": {단계: 횟수}, "rates": {단계: 비율}}
+        """
+        with self._tier_lock:
+            counts = dict(self._tier_counts)
+        total = sum(counts.values())
+        return {
+            'total': total,
+            'counts': counts,
+            'rates': {tier: round(count / total, 3) if total else 0.0 for tier, count in counts.items()}
+        }
+    
     def _llm_review_spec(self, content: str, issue_title: str, issue_body: str) -> ReviewResult:
         """Gemini LLM으로 Spec 리뷰"""
         from utils.logger import review_logger
@@ -120,21 +186,11 @@ class LLMReviewAgent:
 """
         
         try:
-            # Gemini CLI 호출
-            review_logger.debug("  Gemini CLI 호출 중...")
-            result = subprocess.run(
-                ["gemini", "chat", "--prompt", prompt],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if result.returncode != 0:
-                review_logger.warning(f"  Gemini 오류: {result.stderr}")
-                return self._mock_review_spec(content, issue_title)
+            # 공용 call_gemini (캐시 → 상주 워커 → CLI), Timeout/CLI 오류는 아래에서 Mock 리뷰로 대체
+            review_logger.debug("  Gemini 호출 중...")
+            output = call_gemini(prompt, timeout=30)
             
             # JSON 파싱
-            output = result.stdout.strip()
             review_logger.debug(f"  Gemini 응답 길이: {len(output)}자")
             
             # JSON 추출 (마크다운 코드 블록 제거)
@@ -187,44 +243,39 @@ class LLMReviewAgent:
                 issues=issues
             )
             
+        except TimeoutError:
+            review_logger.warning("  Gemini 타임아웃 (30초 초과)")
+            return self._mock_review_spec(content, issue_title)
         except Exception as e:
             review_logger.error(f"  Gemini 리뷰 오류: {e}")
             return self._mock_review_spec(content, issue_title)
     
-    def _mock_review_spec(self, content: str, issue_title: str) -> ReviewResult:
-        """Mock 모드 Spec 리뷰 (키워드 체크)"""
+    def _mock_review_spec(self, content: str, issue_title: str,
+                          approved: Optional[bool] = None) -> ReviewResult:
+        """
+        Mock 모드 Spec 리뷰 (공용 규칙 엔진 구조 검사)
+        
+        Args:
+            content: Spec 내용
+            issue_title: Issue 제목
+            approved: 판정 (None이면 approval_threshold 기준, 단계별 리뷰가 확정한 판정을 넘길 때 사용)
+        """
         from utils.logger import review_logger
         
         review_logger.debug("  검증 항목 체크...")
         
-        checks = {
-            'has_user_stories': '## User Scenarios' in content or 'User Story' in content,
-            'has_requirements': 'Requirements' in content or 'Functional Requirements' in content,
-            'has_success_criteria': 'Success Criteria' in content,
-            'min_length': len(content) > 500
-        }
+        evaluation = evaluate("spec", content)
+        checks = evaluation.checks
+        
+        for result in evaluation.results:
+            review_logger.debug(f"  [{result.rule.id}]: {'✓' if result.passed else '✗'}")
+        
+        issues = evaluation.issues()
+        suggestions = evaluation.suggestions()
         
-        issues = []
-        suggestions = []
-        
-        for name, passed in checks.items():
-            review_logger.debug(f"  [{name}]: {'✓' if passed else '✗'}")
-            if not passed:
-                if name == 'has_user_stories':
-                    issues.append("User Stories 섹션이 없습니다")
-                    suggestions.append("User Story를 Given-When-Then 형식으로 추가하세요")
-                elif name == 'has_requirements':
-                    issues.append("Requirements 섹션이 없습니다")
-                    suggestions.append("Functional Requirements를 FR-001 형식으로 추가하세요")
-                elif name == 'has_success_criteria':
-                    issues.append("Success Criteria 섹션이 없습니다")
-                    suggestions.append("측정 가능한 성공 기준을 추가하세요")
-                elif name == 'min_length':
-                    issues.append(f"문서가 너무 짧습니다 ({len(content)}자)")
-                    suggestions.append("더 상세한 설명을 추가하세요")
-        
-        score = sum(checks.values()) / len(checks)
-        approved = score >= self.approval_threshold
+        score = evaluation.score
+        if approved is None:
+            approved = score >= self.approval_threshold
         
         review_logger.info(f"  총점: {score:.2f}/1.0")
         
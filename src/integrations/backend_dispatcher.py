@@ -0,0 +1,288 @@
+"""
+Backend Dispatcher
+
+문서 생성 요청을 여러 백엔드(goose, gemini)에 나눠 보내는 정책 엔진
+- fallback: 순서대로 시도, 실패하면 다음 백엔드 (기존 동작)
+- hedged: 1순위 백엔드가 자신의 p90 지연 시간 안에 응답하지 않으면 다음 백엔드도 시작,
+  먼저 성공한 결과 사용
+- race: 모든 백엔드를 동시에 시작, 먼저 성공한 결과 사용
+
+백엔드별 최근 응답 시간을 기록해 hedge 시점과 Timeout을 정함
+(기록이 부족하면 호출자가 지정한 기본 Timeout 사용)
+
+hedged/race에서 한 후보가 성공하면 나머지 후보는 취소 토큰으로 중단
+(실행 중인 프로세스 종료, rate limit/재시도 대기 중단 → 실행 슬롯과 스레드 반환)
+"""
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, CancelledError, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional
+from utils.cancellation import CancelToken, cancel_scope
+
+
+STRATEGIES = ("fallback", "hedged", "race")
+
+# timeout(초)을 받아 결과 또는 None(실패)을 반환하는 호출
+# 후보별 취소 토큰이 연결된 스레드에서 실행됨 (utils.cancellation)
+BackendCall = Callable[[float], Optional[str]]
+
+
+@dataclass
+class Attempt:
+    """백엔드 호출 후보"""
+    backend: str
+    call: BackendCall
+    default_timeout: float
+
+
+class LatencyTracker:
+    """백엔드별 최근 성공 응답 시간"""
+
+    def __init__(self, window: int = 50, min_samples: int = 5):
+        """
+        Args:
+            window: 백엔드별로 보관할 최근 기록 수
+            min_samples: 백분위수를 사용하기 위한 최소 기록 수
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._failures: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, backend: str, duration: float, success: bool):
+        """응답 시간 기록 (실패는 횟수만 기록)"""
+        with self._lock:
+            if success:
+                self._samples.setdefault(backend, deque(maxlen=self.window)).append(duration)
+            else:
+                self._failures[backend] = self._failures.get(backend, 0) + 1
+
+    def percentile(self, backend: str, q: float) -> Optional[float]:
+        """
+        백분위수 응답 시간
+
+        Args:
+            backend: 백엔드 이름
+            q: 0.0 ~ 1.0 (예: 0.9)
+
+        Returns:
+            초 단위 응답 시간 또는 None (기록 부족)
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(backend, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(int(q * len(samples)), len(samples) - 1)]
+
+    def snapshot(self) -> dict:
+        """백엔드별 통계"""
+        with self._lock:
+            backends = set(self._samples) | set(self._failures)
+        return {
+            backend: {
+                'samples': len(self._samples.get(backend, ())),
+                'failures': self._failures.get(backend, 0),
+                'p50': self.percentile(backend, 0.5),
+                'p90': self.percentile(backend, 0.9),
+            }
+            for backend in sorted(backends)
+        }
+
+
+class BackendDispatcher:
+    """fallback / hedged / race 정책 기반 백엔드 호출기"""
+
+    def __init__(self,
+                 strategy: Optional[str] = None,
+                 timeout_factor: Optional[float] = None,
+                 min_timeout: Optional[float] = None,
+                 hedge_delay: Optional[float] = None,
+                 max_workers: int = 8):
+        """
+        Args:
+            strategy: 기본 정책 (기본값: DISPATCH_STRATEGY 또는 "fallback")
+            timeout_factor: Timeout = p90 × factor (기본값: DISPATCH_TIMEOUT_FACTOR 또는 3)
+            min_timeout: 기록 기반 Timeout 하한 (초, 기본값: DISPATCH_MIN_TIMEOUT 또는 30)
+            hedge_delay: 기록이 부족할 때 hedge 시작 대기 시간 (초, 기본값: DISPATCH_HEDGE_DELAY 또는 45)
+            max_workers: 동시에 실행할 최대 백엔드 호출 수
+        """
+        self.strategy = (strategy or os.getenv("DISPATCH_STRATEGY", "fallback")).lower()
+        if self.strategy not in STRATEGIES:
+            raise ValueError(f"Unknown dispatch strategy '{self.strategy}'. Available: {STRATEGIES}")
+        self.timeout_factor = timeout_factor or float(os.getenv("DISPATCH_TIMEOUT_FACTOR", "3"))
+        self.min_timeout = min_timeout or float(os.getenv("DISPATCH_MIN_TIMEOUT", "30"))
+        self.hedge_delay = hedge_delay or float(os.getenv("DISPATCH_HEDGE_DELAY", "45"))
+        self.latency = LatencyTracker()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dispatch")
+        self._lock = threading.Lock()
+        self.stats = {'dispatches': 0, 'hedges': 0, 'backup_wins': 0, 'exhausted': 0, 'cancelled': 0}
+
+    def timeout_for(self, attempt: Attempt) -> float:
+        """
+        백엔드 Timeout (p90 × factor, [min_timeout, 기본 Timeout] 범위)
+
+        기록이 부족하면 기본 Timeout
+        """
+        p90 = self.latency.percentile(attempt.backend, 0.9)
+        if p90 is None:
+            return attempt.default_timeout
+        return min(attempt.default_timeout, max(self.min_timeout, p90 * self.timeout_factor))
+
+    def hedge_delay_for(self, attempt: Attempt) -> float:
+        """hedge 시작 대기 시간 (1순위 백엔드의 p90)"""
+        p90 = self.latency.percentile(attempt.backend, 0.9)
+        return p90 if p90 is not None else min(self.hedge_delay, self.timeout_for(attempt))
+
+    def dispatch(self, attempts: List[Attempt], strategy: Optional[str] = None,
+                 label: str = "request") -> Optional[str]:
+        """
+        백엔드 호출
+
+        Args:
+            attempts: 우선순위 순서의 후보 목록
+            strategy: 정책 (None이면 기본 정책)
+            label: 로그 이름
+
+        Returns:
+            먼저 성공한 결과 또는 None (모든 백엔드 실패 → 호출자가 템플릿 등으로 대체)
+        """
+        strategy = (strategy or self.strategy).lower()
+        if not attempts:
+            return None
+        with self._lock:
+            self.stats['dispatches'] += 1
+
+        if strategy == "fallback" or len(attempts) == 1:
+            result = self._fallback(attempts, label)
+        else:
+            result = self._concurrent(attempts, label, hedged=(strategy == "hedged"))
+
+        if result is None:
+            with self._lock:
+                self.stats['exhausted'] += 1
+        return result
+
+    def snapshot(self) -> dict:
+        """정책/지연 시간 통계 (health endpoint용)"""
+        with self._lock:
+            stats = dict(self.stats)
+        return {'strategy': self.strategy, 'latency': self.latency.snapshot(), **stats}
+
+    def shutdown(self):
+        """스레드 풀 종료 (실행 중인 호출은 기다리지 않음)"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _fallback(self, attempts: List[Attempt], label: str) -> Optional[str]:
+        """순차 시도"""
+        for attempt in attempts:
+            result = self._run(attempt)
+            if result:
+                return result
+            print(f"⚠️ {label}: {attempt.backend} 실패 - 다음 백엔드 시도")
+        return None
+
+    def _concurrent(self, attempts: List[Attempt], label: str, hedged: bool) -> Optional[str]:
+        """
+        hedged / race
+
+        hedged: 실행 중인 후보가 hedge 시점까지 응답하지 않거나 실패하면 다음 후보 시작
+        race: 모든 후보를 즉시 시작
+        먼저 성공한 후보가 나오면 나머지 후보는 취소 (프로세스 종료)
+        """
+        pending: Dict[Future, Attempt] = {}
+        tokens: Dict[Future, CancelToken] = {}
+        remaining = list(attempts)
+
+        def launch():
+            attempt = remaining.pop(0)
+            if pending and hedged:
+                print(f"🏁 {label}: {attempt.backend} 추가 시작 (hedge)")
+                with self._lock:
+                    self.stats['hedges'] += 1
+            token = CancelToken()
+            future = self._pool.submit(self._run, attempt, token)
+            pending[future] = attempt
+            tokens[future] = token
+
+        launch()
+        while remaining and not hedged:
+            launch()
+
+        while pending:
+            wait_timeout = None
+            if remaining:
+                # 가장 최근에 시작한 후보의 p90이 지나면 다음 후보 시작
+                wait_timeout = self.hedge_delay_for(list(pending.values())[-1])
+            done, _ = wait(pending, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                launch()
+                continue
+
+            for future in done:
+                attempt = pending.pop(future)
+                result = future.result()
+                if result:
+                    if attempt is not attempts[0]:
+                        with self._lock:
+                            self.stats['backup_wins'] += 1
+                    print(f"✅ {label}: {attempt.backend} 응답 사용")
+                    self._cancel_losers(pending, tokens, label)
+                    return result
+                print(f"⚠️ {label}: {attempt.backend} 실패")
+
+            if remaining:
+                launch()  # 실패한 후보 대신 다음 후보 즉시 시작
+
+        return None
+
+    def _cancel_losers(self, pending: Dict[Future, Attempt], tokens: Dict[Future, CancelToken], label: str):
+        """결과가 필요 없어진 후보 중단 (시작 전이면 실행하지 않음)"""
+        for future, attempt in pending.items():
+            future.cancel()
+            tokens[future].cancel()
+            print(f"🛑 {label}: {attempt.backend} 호출 취소")
+        with self._lock:
+            self.stats['cancelled'] += len(pending)
+
+    def _run(self, attempt: Attempt, token: Optional[CancelToken] = None) -> Optional[str]:
+        """
+        후보 하나 실행 + 지연 시간 기록
+
+        취소된 호출은 기록하지 않음 - 클라이언트가 취소를 예외 대신 None으로 돌려주는 경우도
+        실패로 집계하면 hedge 시점/Timeout 계산이 왜곡됨
+        """
+        token = token or CancelToken()
+        timeout = self.timeout_for(attempt)
+        started = time.monotonic()
+        try:
+            with cancel_scope(token):
+                result = attempt.call(timeout)
+        except CancelledError:
+            return None
+        except Exception as e:
+            if token.cancelled:
+                return None
+            print(f"⚠️ {attempt.backend} 호출 오류: {e}")
+            result = None
+        if token.cancelled:
+            return None
+        self.latency.record(attempt.backend, time.monotonic() - started, bool(result))
+        return result
+
+
+_dispatcher: Optional[BackendDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_backend_dispatcher() -> BackendDispatcher:
+    """프로세스 공용 BackendDispatcher 인스턴스"""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = BackendDispatcher()
+        return _dispatcher
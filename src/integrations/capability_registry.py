@@ -0,0 +1,165 @@
+"""
+Backend Capability Registry
+
+gemini / goose CLI 설치 여부를 프로세스 전체에서 한 번만 확인하고 캐시
+클라이언트 생성 시마다 `--version`을 실행하지 않도록 함
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from utils.process_runner import get_process_runner
+
+
+# ProcessRunner 동시성 제한 단위 - 실제 백엔드 호출 슬롯(gemini/goose)과 경쟁하지 않도록 분리
+PROBE_RUNNER_BACKEND = "probe"
+
+# 백엔드별 확인 명령
+PROBE_COMMANDS: Dict[str, List[str]] = {
+    "gemini": ["gemini", "--version"],
+    "goose": ["goose", "--version"],
+}
+
+
+@dataclass
+class BackendCapability:
+    """백엔드 확인 결과"""
+    name: str
+    available: bool
+    version: Optional[str] = None
+    error: Optional[str] = None
+    checked_at: float = 0.0
+    probe_duration: float = 0.0
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환"""
+        return {
+            'name': self.name,
+            'available': self.available,
+            'version': self.version,
+            'error': self.error,
+            'checked_at': self.checked_at,
+            'age_seconds': round(time.time() - self.checked_at, 1),
+            'probe_duration': round(self.probe_duration, 3)
+        }
+
+
+class CapabilityRegistry:
+    """CLI 백엔드 가용성 레지스트리"""
+
+    def __init__(self, refresh_interval: Optional[float] = None, probe_timeout: float = 5):
+        """
+        Args:
+            refresh_interval: 재확인 주기 (초, 기본값: CAPABILITY_REFRESH_SECONDS 또는 300)
+            probe_timeout: `--version` 실행 Timeout (초)
+        """
+        self.refresh_interval = refresh_interval or float(os.getenv("CAPABILITY_REFRESH_SECONDS", "300"))
+        self.probe_timeout = probe_timeout
+        self._capabilities: Dict[str, BackendCapability] = {}
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+        self._probe_locks: Dict[str, threading.Lock] = {name: threading.Lock() for name in PROBE_COMMANDS}
+
+    def get(self, name: str) -> BackendCapability:
+        """
+        백엔드 확인 결과 조회
+
+        최초 호출 시에만 확인을 기다리고, 이후 주기가 지난 결과는
+        캐시된 값을 바로 반환하면서 백그라운드에서 재확인
+
+        Args:
+            name: 백엔드 이름 ("gemini", "goose")
+
+        Returns:
+            BackendCapability
+        """
+        if name not in PROBE_COMMANDS:
+            raise ValueError(f"Unknown backend '{name}'. Available: {list(PROBE_COMMANDS)}")
+
+        capability = self._capabilities.get(name)
+        if capability is None:
+            with self._probe_locks[name]:
+                capability = self._capabilities.get(name)
+                if capability is None:
+                    capability = self._probe(name)
+            return capability
+
+        if time.time() - capability.checked_at > self.refresh_interval:
+            self._refresh_in_background(name)
+
+        return capability
+
+    def is_available(self, name: str) -> bool:
+        """백엔드 사용 가능 여부"""
+        return self.get(name).available
+
+    def refresh(self, name: Optional[str] = None):
+        """
+        즉시 재확인
+
+        Args:
+            name: 백엔드 이름 (None이면 전체)
+        """
+        for backend in ([name] if name else list(PROBE_COMMANDS)):
+            with self._probe_locks[backend]:
+                self._probe(backend)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """전체 백엔드 상태 (health endpoint용)"""
+        return {name: self.get(name).to_dict() for name in PROBE_COMMANDS}
+
+    def _probe(self, name: str) -> BackendCapability:
+        """`--version` 실행 후 결과 저장 (백엔드 호출 슬롯 밖에서 실행)"""
+        started = time.monotonic()
+        try:
+            result = get_process_runner().run_sync(
+                PROBE_COMMANDS[name],
+                backend=PROBE_RUNNER_BACKEND,
+                timeout=self.probe_timeout
+            )
+            if result.timed_out:
+                capability = BackendCapability(name, False, error=f"Timeout ({self.probe_timeout}s)")
+            elif result.returncode == 0:
+                capability = BackendCapability(name, True, version=result.stdout.strip() or None)
+            else:
+                capability = BackendCapability(name, False, error=result.stderr.strip() or None)
+        except Exception as e:
+            capability = BackendCapability(name, False, error=str(e))
+
+        capability.checked_at = time.time()
+        capability.probe_duration = time.monotonic() - started
+
+        with self._lock:
+            self._capabilities[name] = capability
+        return capability
+
+    def _refresh_in_background(self, name: str):
+        """백그라운드 재확인 (백엔드당 하나만)"""
+        with self._lock:
+            if name in self._refreshing:
+                return
+            self._refreshing.add(name)
+
+        def run():
+            try:
+                with self._probe_locks[name]:
+                    self._probe(name)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(name)
+
+        threading.Thread(target=run, name=f"capability-{name}", daemon=True).start()
+
+
+_capability_registry: Optional[CapabilityRegistry] = None
+_capability_registry_lock = threading.Lock()
+
+
+def get_capability_registry() -> CapabilityRegistry:
+    """프로세스 공용 CapabilityRegistry 인스턴스"""
+    global _capability_registry
+    with _capability_registry_lock:
+        if _capability_registry is None:
+            _capability_registry = CapabilityRegistry()
+        return _capability_registry
@@ -3,11 +3,14 @@ Gemini CLI Client
 
 Gemini CLI를 Python에서 호출하여 AI 문서 생성
 """
-import subprocess
 import os
 from pathlib import Path
 from typing import Optional
 from models.issue import GitHubIssue
+from utils.resilience import call_gemini
+from integrations.capability_registry import get_capability_registry
+from utils.template_registry import get_template_registry
+from utils.prompt_builder import get_prompt_builder
 
 
 class GeminiClient:
@@ -25,25 +28,19 @@ class GeminiClient:
         self.gemini_available = self._check_gemini_cli()
     
     def _check_gemini_cli(self) -> bool:
-        """Gemini CLI 설치 여부 확인"""
-        try:
-            result = subprocess.run(
-                ["gemini", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            print("⚠️ Gemini CLI not found. Using template fallback.")
-            return False
+        """Gemini CLI 설치 여부 확인 (공용 레지스트리 캐시 사용)"""
+        if get_capability_registry().is_available("gemini"):
+            return True
+        print("⚠️ Gemini CLI not found. Using template fallback.")
+        return False
     
-    def generate_spec(self, issue: GitHubIssue) -> Optional[str]:
+    def generate_spec(self, issue: GitHubIssue, use_cache: bool = True) -> Optional[str]:
         """
         Issue → Spec 생성
         
         Args:
             issue: GitHub Issue
+            use_cache: 응답 캐시 사용 여부
             
         Returns:
             생성된 Spec 내용 또는 None
@@ -55,15 +52,16 @@ class GeminiClient:
         prompt = self._create_spec_prompt(issue)
         
         # Gemini CLI 호출
-        return self._call_gemini_cli(prompt)
+        return self._call_gemini_cli(prompt, use_cache=use_cache, issue_number=issue.number)
     
-    def generate_plan(self, spec_content: str, issue_title: str) -> Optional[str]:
+    def generate_plan(self, spec_content: str, issue_title: str, use_cache: bool = True) -> Optional[str]:
         """
         Spec → Plan 생성
         
         Args:
             spec_content: Spec 내용
             issue_title: Issue 제목
+            use_cache: 응답 캐시 사용 여부
             
         Returns:
             생성된 Plan 내용 또는 None
@@ -72,15 +70,16 @@ class GeminiClient:
             return None
         
         prompt = self._create_plan_prompt(spec_content, issue_title)
-        return self._call_gemini_cli(prompt)
+        return self._call_gemini_cli(prompt, use_cache=use_cache)
     
-    def generate_tasks(self, plan_content: str, spec_content: str) -> Optional[str]:
+    def generate_tasks(self, plan_content: str, spec_content: str, use_cache: bool = True) -> Optional[str]:
         """
         Plan → Tasks 생성
         
         Args:
             plan_content: Plan 내용
             spec_content: Spec 내용 (참고용)
+            use_cache: 응답 캐시 사용 여부
             
         Returns:
             생성된 Tasks 내용 또는 None
@@ -89,34 +88,24 @@ class GeminiClient:
             return None
         
         prompt = self._create_tasks_prompt(plan_content, spec_content)
-        return self._call_gemini_cli(prompt)
+        return self._call_gemini_cli(prompt, use_cache=use_cache)
     
-    def _call_gemini_cli(self, prompt: str) -> Optional[str]:
+    def _call_gemini_cli(self, prompt: str, use_cache: bool = True,
+                         issue_number: Optional[int] = None) -> Optional[str]:
         """
-        Gemini CLI 호출
+        Gemini CLI 호출 (공용 call_gemini: 캐시 → 상주 워커 → CLI)
         
         Args:
             prompt: 프롬프트 내용
+            use_cache: 응답 캐시 사용 여부 (False면 항상 새로 생성)
+            issue_number: Issue 번호 (출력 스트리밍용)
             
         Returns:
             Gemini 응답 또는 None
         """
         try:
-            # Gemini CLI 실행
-            result = subprocess.run(
-                ["gemini", prompt],
-                capture_output=True,
-                text=True,
-                timeout=60  # 1분 타임아웃
-            )
-            
-            if result.returncode == 0:
-                return result.stdout.strip()
-            else:
-                print(f"Gemini CLI 오류: {result.stderr}")
-                return None
-                
-        except subprocess.TimeoutExpired:
+            return call_gemini(prompt, timeout=60, use_cache=use_cache, issue_number=issue_number)
+        except TimeoutError:
             print("Gemini CLI 타임아웃")
             return None
         except Exception as e:
@@ -125,15 +114,16 @@ class GeminiClient:
     
     def _create_spec_prompt(self, issue: GitHubIssue) -> str:
         """Spec 생성 프롬프트 생성"""
-        template_path = self.prompts_dir / "spec_generation.md"
+        template = get_template_registry().get(self.prompts_dir / "spec_generation.md", "prompt")
         
-        if template_path.exists():
-            template = template_path.read_text(encoding='utf-8')
-            return template.format(
-                issue_title=issue.title,
-                issue_body=issue.body,
-                issue_number=issue.number
-            )
+        if template:
+            # Issue 본문은 길이 제한이 없으므로 예산 초과 시 본문만 축소
+            return get_prompt_builder("gemini").build(
+                template,
+                {'issue_title': issue.title, 'issue_body': issue.body, 'issue_number': issue.number},
+                required=('issue_title',),
+                label="spec_generation"
+            ).text
         
         # 기본 프롬프트
         return f"""당신은 소프트웨어 요구사항 분석가입니다.
@@ -180,14 +170,15 @@ Issue #{issue.number}: {issue.title}
     
     def _create_plan_prompt(self, spec_content: str, issue_title: str) -> str:
         """Plan 생성 프롬프트 생성"""
-        template_path = self.prompts_dir / "plan_generation.md"
+        template = get_template_registry().get(self.prompts_dir / "plan_generation.md", "prompt")
         
-        if template_path.exists():
-            template = template_path.read_text(encoding='utf-8')
-            return template.format(
-                spec_content=spec_content,
-                issue_title=issue_title
-            )
+        if template:
+            return get_prompt_builder("gemini").build(
+                template,
+                {'spec_content': spec_content, 'issue_title': issue_title},
+                required=('spec_content',),
+                label="plan_generation"
+            ).text
         
         return f"""당신은 소프트웨어 아키텍트입니다.
 다음 Spec 문서를 기반으로 Implementation Plan을 작성하세요.
@@ -227,14 +218,17 @@ Spec 문서:
     
     def _create_tasks_prompt(self, plan_content: str, spec_content: str) -> str:
         """Tasks 생성 프롬프트 생성"""
-        template_path = self.prompts_dir / "tasks_generation.md"
+        template = get_template_registry().get(self.prompts_dir / "tasks_generation.md", "prompt")
         
-        if template_path.exists():
-            template = template_path.read_text(encoding='utf-8')
-            return template.format(
-                plan_content=plan_content,
-                spec_content=spec_content
-            )
+        if template:
+            # 예산 초과 시 참고용 Spec만 축소 (Plan은 그대로)
+            return get_prompt_builder("gemini").build(
+                template,
+                {'plan_content': plan_content, 'spec_content': spec_content},
+                priorities={'plan_content': 100, 'spec_content': 10},
+                required=('plan_content',),
+                label="tasks_generation"
+            ).text
         
         return f"""당신은 프로젝트 매니저입니다.
 다음 Implementation Plan을 기반으로 상세한 Task 목록을 작성하세요.
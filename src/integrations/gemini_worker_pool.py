@@ -0,0 +1,447 @@
+"""
+Gemini Worker Pool
+
+매 호출마다 `gemini` 프로세스를 새로 띄우면 런타임 로딩/인증에 수 초가 걸리므로
+상주 프로세스 N개를 유지하고 요청을 나눠 처리 (opt-in: GEMINI_POOL_ENABLED)
+
+- 워커: `gemini --experimental-acp` (Agent Client Protocol, stdio 위 줄 단위 JSON-RPC)
+  요청마다 새 세션(session/new)을 만들어 이전 대화 맥락이 섞이지 않음
+- 모델별로 워커를 분리 (모델은 프로세스 시작 옵션)
+- 대여 시 프로세스 생존 확인, GEMINI_POOL_MAX_REQUESTS 처리 후 또는 오류/Timeout 시 교체
+- 풀을 쓸 수 없으면 run()이 None을 반환하고 호출자는 기존 1회성 CLI 호출로 진행
+  (워커 Timeout은 이미 전체 시간을 쓴 것이므로 TimeoutError → 호출자는 CLI로 다시 시도하지 않음)
+- 요청 처리 중인 워커는 ProcessRunner의 gemini/전체 동시 실행 수 제한에 포함,
+  결과는 gemini Circuit Breaker에 기록 (차단 중이면 풀을 쓰지 않음)
+"""
+import json
+import os
+import shlex
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from utils.cancellation import current_token
+from utils.process_runner import LineCallback, get_process_runner
+from utils.rate_limiter import get_rate_limiter
+from utils.resilience import CircuitOpenError, get_resilience, is_transient_message
+
+
+ACP_PROTOCOL_VERSION = 1
+
+
+class WorkerError(Exception):
+    """워커 통신 실패 (워커는 폐기됨)"""
+
+
+class WorkerTimeout(WorkerError):
+    """워커가 Timeout 안에 응답하지 않음"""
+
+
+class GeminiWorker:
+    """상주 gemini 프로세스 하나 (한 번에 요청 하나만 처리)"""
+
+    def __init__(self, command: List[str], model: Optional[str], cwd: Optional[str] = None):
+        """
+        Args:
+            command: 워커 실행 명령 (예: ["gemini", "--experimental-acp"])
+            model: 모델 이름 (None이면 CLI 기본값)
+            cwd: 세션 작업 디렉토리
+        """
+        self.model = model
+        self.cwd = str(Path(cwd or Path.cwd()).resolve())
+        self.args = [*command, *(["--model", model] if model else [])]
+        self.requests_served = 0
+        self.started_at = 0.0
+        self._proc: Optional[subprocess.Popen] = None
+        self._next_id = 0
+        self._pending: Dict[int, Future] = {}
+        self._chunks: Dict[str, List[str]] = {}
+        self._write_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+
+    def start(self, timeout: float = 30):
+        """프로세스 시작 + ACP 초기화"""
+        self._proc = subprocess.Popen(
+            self.args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.cwd
+        )
+        self.started_at = time.time()
+        threading.Thread(target=self._read_loop, name=f"gemini-worker-{self._proc.pid}", daemon=True).start()
+        self._request("initialize", {
+            "protocolVersion": ACP_PROTOCOL_VERSION,
+            "clientCapabilities": {"fs": {"readTextFile": False, "writeTextFile": False}}
+        }, timeout)
+
+    @property
+    def alive(self) -> bool:
+        """프로세스 생존 여부 (health check)"""
+        return self._proc is not None and self._proc.poll() is None
+
+    def prompt(self, text: str, timeout: float) -> str:
+        """
+        프롬프트 실행 (새 세션)
+
+        Raises:
+            WorkerError: 통신 실패, 오류 응답, Timeout
+        """
+        deadline = time.monotonic() + timeout
+        session = self._request("session/new", {"cwd": self.cwd, "mcpServers": []}, timeout)
+        session_id = session["sessionId"]
+
+        with self._state_lock:
+            self._chunks[session_id] = []
+        try:
+            self._request("session/prompt", {
+                "sessionId": session_id,
+                "prompt": [{"type": "text", "text": text}]
+            }, max(deadline - time.monotonic(), 0.1))
+            with self._state_lock:
+                output = "".join(self._chunks[session_id])
+        finally:
+            with self._state_lock:
+                self._chunks.pop(session_id, None)
+
+        self.requests_served += 1
+        return output
+
+    def close(self):
+        """프로세스 종료"""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        self._fail_pending(WorkerError("worker closed"))
+
+    def _request(self, method: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """
+        JSON-RPC 요청 후 응답 대기
+
+        Raises:
+            WorkerError: 통신 실패, 오류 응답, Timeout
+            CancelledError: 현재 취소 토큰이 취소된 경우 (호출자가 워커를 교체)
+        """
+        future: Future = Future()
+        with self._state_lock:
+            self._next_id += 1
+            request_id = self._next_id
+            self._pending[request_id] = future
+        token = current_token()
+        unregister = token.on_cancel(future.cancel) if token else None
+
+        try:
+            self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise WorkerTimeout(f"{method} timeout ({timeout:.0f}s)")
+        finally:
+            if unregister:
+                unregister()
+            with self._state_lock:
+                self._pending.pop(request_id, None)
+
+    def _send(self, message: Dict[str, Any]):
+        """메시지 한 줄 전송"""
+        if not self.alive:
+            raise WorkerError("worker not running")
+        data = (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+        try:
+            with self._write_lock:
+                self._proc.stdin.write(data)
+                self._proc.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise WorkerError(f"write failed: {e}")
+
+    def _read_loop(self):
+        """stdout 메시지 처리 (워커 전용 스레드)"""
+        proc = self._proc
+        for raw in proc.stdout:
+            try:
+                message = json.loads(raw)
+            except ValueError:
+                continue  # 프로토콜 외 출력 무시
+
+            if "method" in message:
+                self._handle_agent_message(message)
+                continue
+
+            with self._state_lock:
+                future = self._pending.get(message.get("id"))
+            if future is None or future.done():
+                continue
+            try:
+                if "error" in message:
+                    future.set_exception(WorkerError(str(message["error"].get("message", message["error"]))))
+                else:
+                    future.set_result(message.get("result") or {})
+            except InvalidStateError:
+                pass  # 응답 직전에 취소된 요청
+
+        self._fail_pending(WorkerError(f"worker exited ({proc.poll()})"))
+
+    def _handle_agent_message(self, message: Dict[str, Any]):
+        """워커가 보낸 알림/요청 처리"""
+        method = message["method"]
+        params = message.get("params") or {}
+
+        if method == "session/update":
+            update = params.get("update") or {}
+            content = update.get("content") or {}
+            if update.get("sessionUpdate") == "agent_message_chunk" and content.get("type") == "text":
+                with self._state_lock:
+                    chunks = self._chunks.get(params.get("sessionId"))
+                    if chunks is not None:
+                        chunks.append(content.get("text", ""))
+            return
+
+        if "id" not in message:
+            return
+
+        # 도구 실행 권한/파일 접근 요청은 허용하지 않음 (문서 생성 전용)
+        try:
+            if method == "session/request_permission":
+                self._send({"jsonrpc": "2.0", "id": message["id"],
+                            "result": {"outcome": {"outcome": "cancelled"}}})
+            else:
+                self._send({"jsonrpc": "2.0", "id": message["id"],
+                            "error": {"code": -32601, "message": f"Method not supported: {method}"}})
+        except WorkerError:
+            pass
+
+    def _fail_pending(self, error: Exception):
+        """대기 중인 요청 모두 실패 처리"""
+        with self._state_lock:
+            pending = list(self._pending.values())
+        for future in pending:
+            try:
+                future.set_exception(error)
+            except InvalidStateError:
+                pass  # 이미 응답을 받았거나 취소된 요청
+
+
+class GeminiWorkerPool:
+    """상주 gemini 워커 풀 (opt-in)"""
+
+    def __init__(self,
+                 enabled: Optional[bool] = None,
+                 size: Optional[int] = None,
+                 max_requests: Optional[int] = None,
+                 command: Optional[str] = None,
+                 acquire_timeout: float = 30):
+        """
+        Args:
+            enabled: 사용 여부 (기본값: GEMINI_POOL_ENABLED 환경변수, 기본 false)
+            size: 최대 워커 수 (기본값: GEMINI_POOL_SIZE 또는 2)
+            max_requests: 워커 교체 전 최대 처리 요청 수 (기본값: GEMINI_POOL_MAX_REQUESTS 또는 50)
+            command: 워커 실행 명령 (기본값: GEMINI_POOL_COMMAND 또는 "gemini --experimental-acp")
+            acquire_timeout: 빈 워커 대기 시간 (초과 시 풀을 쓰지 않고 None 반환)
+        """
+        if enabled is None:
+            enabled = os.getenv("GEMINI_POOL_ENABLED", "false").lower() == "true"
+        self.enabled = enabled
+        self.size = size or int(os.getenv("GEMINI_POOL_SIZE", "2"))
+        self.max_requests = max_requests or int(os.getenv("GEMINI_POOL_MAX_REQUESTS", "50"))
+        self.command = shlex.split(command or os.getenv("GEMINI_POOL_COMMAND", "gemini --experimental-acp"))
+        self.acquire_timeout = acquire_timeout
+        self._idle: Dict[Optional[str], List[GeminiWorker]] = {}
+        self._total = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self.stats = {'requests': 0, 'failures': 0, 'timeouts': 0, 'spawned': 0, 'recycled': 0,
+                      'busy_fallbacks': 0}
+
+    def run(self, prompt: str, model: Optional[str] = None, timeout: float = 60,
+            on_stdout: Optional[LineCallback] = None) -> Optional[str]:
+        """
+        상주 워커로 프롬프트 실행
+
+        Args:
+            prompt: 프롬프트
+            model: 모델 이름
+            timeout: Timeout (초)
+            on_stdout: 응답 라인 콜백 (Issue 출력 스트리밍용, 응답 완료 후 호출)
+
+        Returns:
+            응답 텍스트 또는 None (풀 미사용/빈 워커 없음/워커 오류 → 호출자가 1회성 CLI로 대체)
+
+        Raises:
+            TimeoutError: 워커가 timeout 안에 응답하지 않은 경우 (CLI로 대체하지 않음)
+            concurrent.futures.CancelledError: 현재 취소 토큰이 취소된 경우 (진행 중인 세션이 남지 않도록 워커 교체)
+        """
+        if not self.enabled or self._closed:
+            return None
+
+        with get_rate_limiter().limit("gemini", prompt):
+            output = self._run_on_worker(prompt, model, timeout)
+        if output is None:
+            return None
+
+        if on_stdout:
+            for line in output.splitlines():
+                on_stdout(line)
+        return output
+
+    def _run_on_worker(self, prompt: str, model: Optional[str], timeout: float) -> Optional[str]:
+        """빈 워커를 빌려 프롬프트 실행 (rate limit 구간 안에서 호출)"""
+        breaker = get_resilience().breaker("gemini")
+        try:
+            breaker.before_call()
+        except CircuitOpenError:
+            return None  # 차단 응답은 호출자의 CLI 경로에서 처리
+
+        worker = self._acquire(model)
+        if worker is None:
+            breaker.record_neutral()
+            return None
+
+        healthy = False
+        try:
+            with get_process_runner().slot("gemini"):
+                output = worker.prompt(prompt, timeout).strip()
+            healthy = True
+            breaker.record_success()
+            with self._condition:
+                self.stats['requests'] += 1
+        except WorkerTimeout as e:
+            breaker.record_failure()
+            with self._condition:
+                self.stats['failures'] += 1
+                self.stats['timeouts'] += 1
+            print(f"⏱️ Gemini 워커 응답 없음 - 워커 교체: {e}")
+            raise TimeoutError(f"Gemini worker timeout ({timeout:.0f}s)") from e
+        except WorkerError as e:
+            if is_transient_message(str(e)):
+                breaker.record_failure()
+            else:
+                breaker.record_neutral()
+            print(f"⚠️ Gemini 워커 오류 - 워커 교체 후 CLI로 대체: {e}")
+            with self._condition:
+                self.stats['failures'] += 1
+            return None
+        except BaseException:
+            breaker.record_neutral()
+            raise
+        finally:
+            self._release(worker, healthy)
+        return output
+
+    def warm(self, model: Optional[str] = None, count: int = 1):
+        """워커 미리 시작 (서버 시작 시)"""
+        if not self.enabled:
+            return
+        for _ in range(count):
+            worker = self._acquire(model)
+            if worker is None:
+                return
+            self._release(worker, True)
+
+    def snapshot(self) -> dict:
+        """풀 상태 (health endpoint용)"""
+        with self._condition:
+            return {
+                'enabled': self.enabled,
+                'size': self.size,
+                'workers': self._total,
+                'idle': {model or 'default': len(workers) for model, workers in self._idle.items()},
+                'max_requests': self.max_requests,
+                **self.stats
+            }
+
+    def shutdown(self):
+        """모든 워커 종료"""
+        with self._condition:
+            self._closed = True
+            workers = [worker for idle in self._idle.values() for worker in idle]
+            self._idle.clear()
+            self._total -= len(workers)
+            self._condition.notify_all()
+        for worker in workers:
+            worker.close()
+
+    def _acquire(self, model: Optional[str]) -> Optional[GeminiWorker]:
+        """빈 워커 대여 (없으면 생성, 풀이 가득 차면 대기)"""
+        deadline = time.monotonic() + self.acquire_timeout
+        victim: Optional[GeminiWorker] = None
+        with self._condition:
+            while True:
+                idle = self._idle.get(model, [])
+                while idle:
+                    worker = idle.pop()
+                    if worker.alive:
+                        return worker
+                    self._total -= 1  # 죽은 워커 정리
+
+                if self._total < self.size:
+                    self._total += 1
+                    break
+
+                # 다른 모델의 유휴 워커를 정리해 자리 확보 (슬롯을 그대로 넘겨받음)
+                other = next((workers for key, workers in self._idle.items() if workers and key != model), None)
+                if other:
+                    victim = other.pop()
+                    self.stats['recycled'] += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._closed:
+                    self.stats['busy_fallbacks'] += 1
+                    return None
+                self._condition.wait(remaining)
+
+        if victim is not None:
+            victim.close()
+
+        worker = GeminiWorker(self.command, model)
+        try:
+            worker.start()
+        except (OSError, WorkerError) as e:
+            print(f"⚠️ Gemini 워커 시작 실패: {e}")
+            worker.close()
+            with self._condition:
+                self._total -= 1
+                self.stats['failures'] += 1
+                self._condition.notify()
+            return None
+
+        with self._condition:
+            self.stats['spawned'] += 1
+        print(f"🔥 Gemini 워커 시작 (model={model or 'default'}, pid={worker._proc.pid})")
+        return worker
+
+    def _release(self, worker: GeminiWorker, healthy: bool):
+        """워커 반납 (오류/최대 요청 수 도달 시 교체)"""
+        recycle = not healthy or not worker.alive or worker.requests_served >= self.max_requests
+        with self._condition:
+            if recycle or self._closed:
+                self._total -= 1
+                self.stats['recycled'] += 1
+            else:
+                self._idle.setdefault(worker.model, []).append(worker)
+            self._condition.notify()
+        if recycle or self._closed:
+            worker.close()
+
+
+_gemini_pool: Optional[GeminiWorkerPool] = None
+_gemini_pool_lock = threading.Lock()
+
+
+def get_gemini_pool() -> GeminiWorkerPool:
+    """프로세스 공용 GeminiWorkerPool 인스턴스"""
+    global _gemini_pool
+    with _gemini_pool_lock:
+        if _gemini_pool is None:
+            _gemini_pool = GeminiWorkerPool()
+        return _gemini_pool
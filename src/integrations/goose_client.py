@@ -3,43 +3,51 @@ Goose CLI Client
 
 Goose CLI를 Python에서 호출하여 Tasks 자동 실행
 """
-import subprocess
-import re
+import os
+import threading
 from pathlib import Path
 from typing import Optional, List, Dict
+from utils.process_runner import get_process_runner
+from utils.prompt_transport import get_prompt_transport
+from utils.resilience import get_resilience
+from utils.output_stream import get_output_hub
+from integrations.capability_registry import get_capability_registry
+from models.markdown_document import load_document
+from workflow.task_graph import TaskGraph, TaskGraphExecutor, TaskNode, mark_task_completed
 
 
 class GooseClient:
     """Goose CLI 클라이언트"""
     
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: str = ".", max_concurrency: Optional[int] = None):
         """
         Args:
             project_root: 프로젝트 루트 디렉토리
+            max_concurrency: 동시에 실행할 최대 태스크 수
+                             (기본값: GOOSE_TASK_CONCURRENCY 환경변수 또는 2)
         """
         self.project_root = Path(project_root)
+        self.max_concurrency = max_concurrency or int(os.getenv("GOOSE_TASK_CONCURRENCY", "2"))
         
         # Goose CLI 설치 확인
         self.goose_available = self._check_goose_cli()
     
     def _check_goose_cli(self) -> bool:
-        """Goose CLI 설치 여부 확인"""
-        try:
-            result = subprocess.run(
-                ["goose", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            print("⚠️ Goose CLI not found. Tasks execution will be skipped.")
-            return False
+        """Goose CLI 설치 여부 확인 (공용 레지스트리 캐시 사용)"""
+        if get_capability_registry().is_available("goose"):
+            return True
+        print("⚠️ Goose CLI not found. Tasks execution will be skipped.")
+        return False
     
     def execute_tasks(self, tasks_path: Path, issue_number: int) -> Dict[str, any]:
         """
         Tasks 파일을 읽고 Goose로 실행
         
+        Phase / [P] 표시 / 명시적 의존성으로 만든 DAG를 따라
+        독립 태스크는 max_concurrency까지 동시에 실행
+        완료된 태스크는 tasks.md 체크박스에 즉시 기록되므로
+        재시도 시 이미 완료된 태스크는 건너뜀
+        
         Args:
             tasks_path: Tasks 파일 경로
             issue_number: Issue 번호
@@ -54,43 +62,61 @@ class GooseClient:
             }
         
         try:
-            # Tasks 파싱
-            tasks = self._parse_tasks(tasks_path)
+            # Tasks 파싱 (의존성 그래프)
+            graph = self._parse_task_graph(tasks_path)
+            tasks = graph.pending() if graph else []
             
             if not tasks:
+                if graph and graph.tasks:
+                    print("✅ 모든 태스크가 이미 완료됨")
+                    return {
+                        'status': 'success',
+                        'completed_tasks': 0,
+                        'skipped_tasks': len(graph.tasks),
+                        'results': []
+                    }
                 return {
                     'status': 'error',
                     'message': 'No tasks found'
                 }
             
-            print(f"📋 총 {len(tasks)}개 태스크 발견")
+            skipped = len(graph.tasks) - len(tasks)
+            if skipped:
+                print(f"⏭️ 이전 실행에서 완료된 태스크 {skipped}개 건너뜀")
+            print(f"📋 총 {len(tasks)}개 태스크 발견 (최대 동시 실행: {self.max_concurrency})")
             
-            # Goose 세션 생성
+            checkpoint_lock = threading.Lock()
+            
+            # Goose 세션 이름 (동시 실행 시 태스크별 세션 사용)
             session_name = f"issue-{issue_number}"
             
-            # Tasks 실행
-            results = []
-            for i, task in enumerate(tasks, 1):
-                print(f"\n🔨 Task {i}/{len(tasks)}: {task['description']}")
-                
-                result = self._run_goose_task(task, session_name)
-                results.append(result)
-                
-                if not result['success']:
-                    print(f"❌ Task 실패: {task['description']}")
-                    return {
-                        'status': 'failed',
-                        'task': task['description'],
-                        'results': results
-                    }
-                
-                print(f"✅ Task 완료: {task['description']}")
+            def run_task(node: TaskNode) -> Dict[str, any]:
+                print(f"\n🔨 Task {node.id}: {node.description}")
+                task_session = session_name if self.max_concurrency == 1 else f"{session_name}-{node.id.lower()}"
+                return self._run_goose_task(node.to_dict(), task_session, issue_number)
             
-            return {
-                'status': 'success',
-                'completed_tasks': len(results),
-                'results': results
-            }
+            def on_task_done(node: TaskNode, result: Dict[str, any]):
+                if result.get('success'):
+                    with checkpoint_lock:
+                        self._checkpoint_task(tasks_path, node.id)
+                    print(f"✅ Task 완료: {node.description}")
+                else:
+                    print(f"❌ Task 실패: {node.description}")
+            
+            executor = TaskGraphExecutor(run_task, self.max_concurrency, on_task_done=on_task_done)
+            result = executor.execute(graph)
+            result['skipped_tasks'] = skipped
+            
+            print(f"⏱️ 소요 시간: {result['wall_clock']:.1f}s "
+                  f"(임계 경로 {result['critical_path_length']:.1f}s: {' → '.join(result['critical_path'])})")
+            
+            if result['status'] != 'success':
+                failed = result['failed_tasks']
+                result['task'] = failed[0] if failed else None
+                result['message'] = (f"실패한 태스크: {', '.join(failed) or '없음'}, "
+                                     f"실행되지 않은 태스크: {', '.join(result['blocked_tasks']) or '없음'}")
+            
+            return result
             
         except Exception as e:
             print(f"Goose 실행 오류: {e}")
@@ -99,44 +125,72 @@ class GooseClient:
                 'message': str(e)
             }
     
-    def _parse_tasks(self, tasks_path: Path) -> List[Dict[str, str]]:
+    def _checkpoint_task(self, tasks_path: Path, task_id: str):
         """
-        Tasks 파일 파싱
+        완료한 태스크를 tasks.md에 체크 (- [ ] → - [x])
         
         Args:
             tasks_path: Tasks 파일 경로
-            
-        Returns:
-            태스크 목록
+            task_id: 완료한 태스크 ID
         """
         try:
             content = tasks_path.read_text(encoding='utf-8')
+            updated = mark_task_completed(content, task_id)
+            if updated == content:
+                return
             
-            # 체크박스 형식의 태스크 추출
-            # 예: - [ ] T001 프로젝트 구조 생성
-            pattern = r'- \[ \] (T\d+)(.*?)(?=\n|$)'
-            matches = re.findall(pattern, content, re.MULTILINE)
-            
-            tasks = []
-            for task_id, description in matches:
-                tasks.append({
-                    'id': task_id.strip(),
-                    'description': description.strip()
-                })
-            
-            return tasks
+            # 쓰기 도중 중단되어도 파일이 깨지지 않도록 임시 파일 교체
+            tmp_path = tasks_path.with_suffix(tasks_path.suffix + '.tmp')
+            tmp_path.write_text(updated, encoding='utf-8')
+            os.replace(tmp_path, tasks_path)
+        except Exception as e:
+            print(f"⚠️ 태스크 체크포인트 저장 실패 ({task_id}): {e}")
+    
+    def _parse_task_graph(self, tasks_path: Path) -> Optional[TaskGraph]:
+        """
+        Tasks 파일을 의존성 그래프로 파싱
+        
+        Args:
+            tasks_path: Tasks 파일 경로
             
+        Returns:
+            TaskGraph 또는 None (파싱 실패)
+        """
+        try:
+            document = load_document(tasks_path)
+            if document is None:
+                print(f"Tasks 파일 없음: {tasks_path}")
+                return None
+            return TaskGraph.from_document(document)
         except Exception as e:
             print(f"Tasks 파싱 오류: {e}")
-            return []
+            return None
     
-    def _run_goose_task(self, task: Dict[str, str], session_name: str) -> Dict[str, any]:
+    def _parse_tasks(self, tasks_path: Path) -> List[Dict[str, str]]:
+        """
+        Tasks 파일 파싱
+        
+        Args:
+            tasks_path: Tasks 파일 경로
+            
+        Returns:
+            미완료 태스크 목록 (예: - [ ] T001 프로젝트 구조 생성)
+        """
+        graph = self._parse_task_graph(tasks_path)
+        return [task.to_dict() for task in graph.pending()] if graph else []
+    
+    def _run_goose_task(self, task: Dict[str, str], session_name: str,
+                        issue_number: Optional[int] = None) -> Dict[str, any]:
         """
         Goose로 단일 태스크 실행
         
+        출력은 라인 단위로 Issue 로그 파일/링 버퍼에 스트리밍되고,
+        결과에는 마지막 OUTPUT_CAPTURE_CHARS(기본값 4000)글자만 보관
+        
         Args:
             task: 태스크 정보
             session_name: Goose 세션 이름
+            issue_number: Issue 번호 (출력 스트리밍용)
             
         Returns:
             실행 결과
@@ -147,27 +201,34 @@ class GooseClient:
             
             # Goose 실행
             # goose session start [session_name] --prompt [prompt]
-            result = subprocess.run(
-                ["goose", "session", "run", session_name, "--prompt", prompt],
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5분 타임아웃
-                cwd=self.project_root
-            )
+            with get_prompt_transport().prepare(
+                ["goose", "session", "run", session_name], prompt, prompt_flag="--prompt"
+            ) as prepared:
+                result = get_resilience().run_sync(
+                    prepared.args,
+                    backend="goose",
+                    prompt=prompt,
+                    timeout=300,  # 5분 타임아웃
+                    cwd=str(self.project_root),
+                    input_text=prepared.input_text,
+                    max_capture=int(os.getenv("OUTPUT_CAPTURE_CHARS", "4000")),
+                    **get_output_hub().callbacks(issue_number, f"goose[{task['id']}]")
+                )
+            
+            if result.timed_out:
+                return {
+                    'success': False,
+                    'task_id': task['id'],
+                    'error': 'Timeout (5분 초과)'
+                }
             
             return {
                 'success': result.returncode == 0,
                 'task_id': task['id'],
-                'output': result.stdout[:500] if result.stdout else '',  # 처음 500자만
-                'error': result.stderr[:500] if result.stderr else ''
+                'output': result.stdout,  # 마지막 부분만 (전체는 Issue 로그 파일)
+                'error': result.stderr
             }
             
-        except subprocess.TimeoutExpired:
-            return {
-                'success': False,
-                'task_id': task['id'],
-                'error': 'Timeout (5분 초과)'
-            }
         except Exception as e:
             return {
                 'success': False,
@@ -191,11 +252,11 @@ class GooseClient:
         
         try:
             # Goose 세션 시작
-            subprocess.run(
+            get_process_runner().run_sync(
                 ["goose", "session", "start", session_name],
-                capture_output=True,
+                backend="goose",
                 timeout=10,
-                cwd=self.project_root
+                cwd=str(self.project_root)
             )
             
             return True
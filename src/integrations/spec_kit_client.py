@@ -4,11 +4,13 @@ Spec-kit Client
 .gemini/commands/*.toml 파일에서 프롬프트를 읽고 
 Gemini CLI를 통해 문서를 생성하는 클라이언트
 """
-import subprocess
 from pathlib import Path
 from typing import Dict, Any, Optional
-import tomllib
 from models.issue import GitHubIssue
+from utils.resilience import call_gemini
+from integrations.backend_dispatcher import Attempt, get_backend_dispatcher
+from utils.template_registry import PromptTemplate, get_template_registry
+from utils.prompt_builder import get_prompt_builder
 
 
 from agents.goose_agent_executor import GooseAgentExecutor
@@ -25,6 +27,22 @@ class SpecKitClient:
         self.commands_dir = Path(commands_dir)
         self.goose_executor = goose_executor
     
+    def _get_template(self, command_name: str) -> Optional[PromptTemplate]:
+        """
+        TOML 명령 템플릿 조회 (공용 템플릿 레지스트리 캐시 사용)
+        
+        Args:
+            command_name: 명령어 이름 (예: "speckit.clarify")
+            
+        Returns:
+            PromptTemplate 또는 None
+        """
+        toml_file = self.commands_dir / f"{command_name}.toml"
+        template = get_template_registry().get(toml_file, "command")
+        if template is None:
+            print(f"⚠️ TOML 파일 없음 또는 파싱 오류: {toml_file}")
+        return template
+    
     def _read_prompt_from_toml(self, command_name: str) -> Optional[str]:
         """
         TOML 파일에서 프롬프트 읽기
@@ -35,92 +53,110 @@ class SpecKitClient:
         Returns:
             프롬프트 텍스트
         """
-        toml_file = self.commands_dir / f"{command_name}.toml"
-        if not toml_file.exists():
-            print(f"⚠️ TOML 파일 없음: {toml_file}")
-            return None
-            
-        try:
-            with open(toml_file, "rb") as f:
-                data = tomllib.load(f)
-                return data.get("prompt")
-        except Exception as e:
-            print(f"⚠️ TOML 파싱 오류: {e}")
-            return None
+        template = self._get_template(command_name)
+        return template.text if template else None
     
-    def _call_gemini(self, prompt: str, model: str = "gemini-2.0-flash-exp") -> Optional[str]:
-        """Gemini CLI 또는 Goose 호출"""
-        # 1. Goose Executor 우선 사용
+    def _backend(self) -> str:
+        """프롬프트를 실행할 백엔드 (토큰 추정 기준)"""
         if self.goose_executor and self.goose_executor.goose_available:
-            print("🤖 Goose로 문서 생성 시도...")
-            # 임의의 세션 이름 생성
-            import time
-            session_name = f"spec-kit-{int(time.time())}"
-            
-            result = self.goose_executor.execute_prompt(
-                prompt=prompt,
-                session_name=session_name,
-                timeout=180
-            )
-            if result.get('success'):
-                return result.get('output')
-            else:
-                print(f"⚠️ Goose 실행 실패: {result.get('error')}")
+            return "goose"
+        return "gemini"
+    
+    def _call_gemini(self, prompt: str, model: str = "gemini-2.0-flash-exp",
+                     use_cache: bool = True, issue_number: Optional[int] = None) -> Optional[str]:
+        """
+        Gemini CLI 또는 Goose 호출
+        
+        백엔드 선택(순차 fallback / hedged / race)과 Timeout은 공용 BackendDispatcher 정책을 따름
+        use_cache=False면 응답 캐시 우회, issue_number가 있으면 출력을 Issue 로그로 스트리밍
+        """
+        attempts = []
+        if self.goose_executor and self.goose_executor.goose_available:
+            attempts.append(Attempt(
+                "goose",
+                lambda timeout: self._call_goose(prompt, timeout, use_cache, issue_number),
+                default_timeout=180
+            ))
+        attempts.append(Attempt(
+            "gemini",
+            lambda timeout: self._call_gemini_cli(prompt, model, timeout, use_cache, issue_number),
+            default_timeout=60
+        ))
+        return get_backend_dispatcher().dispatch(attempts, label="Spec-kit")
+    
+    def _call_goose(self, prompt: str, timeout: float, use_cache: bool,
+                    issue_number: Optional[int]) -> Optional[str]:
+        """Goose로 문서 생성"""
+        print("🤖 Goose로 문서 생성 시도...")
+        # 임의의 세션 이름 생성
+        import time
+        session_name = f"spec-kit-{int(time.time())}"
+        
+        result = self.goose_executor.execute_prompt(
+            prompt=prompt,
+            session_name=session_name,
+            timeout=int(timeout),
+            use_cache=use_cache,
+            issue_number=issue_number
+        )
+        if result.get('success'):
+            return result.get('output')
         
-        # 2. Gemini CLI 시도 (Fallback)
+        print(f"⚠️ Goose 실행 실패: {result.get('error')}")
+        return None
+    
+    def _call_gemini_cli(self, prompt: str, model: str, timeout: float, use_cache: bool,
+                         issue_number: Optional[int]) -> Optional[str]:
+        """Gemini(공용 call_gemini: 캐시 → 상주 워커 → CLI)로 문서 생성"""
         try:
-            print("🤖 Gemini CLI로 문서 생성 시도...")
-            result = subprocess.run(
-                ["gemini", "chat", 
-                 "--model", model,
-                 "--prompt", prompt],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode != 0:
-                print(f"⚠️ Gemini 오류: {result.stderr}")
-                return None
-            
-            return result.stdout.strip()
-            
+            print("🤖 Gemini로 문서 생성 시도...")
+            return call_gemini(prompt, model=model, timeout=timeout, use_cache=use_cache,
+                               issue_number=issue_number)
+        except TimeoutError:
+            print(f"⚠️ Gemini 타임아웃 ({timeout:.0f}초 초과)")
+            return None
         except Exception as e:
             print(f"⚠️ Gemini 실행 오류: {e}")
             return None
 
-    def generate_spec(self, issue: GitHubIssue) -> Optional[str]:
+    def generate_spec(self, issue: GitHubIssue, use_cache: bool = True) -> Optional[str]:
         """Spec 생성 (speckit.clarify 사용)"""
-        prompt_template = self._read_prompt_from_toml("speckit.clarify")
-        if not prompt_template:
+        template = self._get_template("speckit.clarify")
+        if not template:
             return None
             
         # 프롬프트 변수 치환
-        prompt = prompt_template.replace("{issue_body}", f"{issue.title}\n\n{issue.body}")
+        prompt = template.render(issue_body=f"{issue.title}\n\n{issue.body}")
         
         print("🤖 Spec-kit (speckit.clarify)로 Spec 생성 중...")
-        return self._call_gemini(prompt)
+        return self._call_gemini(prompt, use_cache=use_cache, issue_number=issue.number)
 
-    def generate_plan(self, spec_content: str) -> Optional[str]:
+    def generate_plan(self, spec_content: str, use_cache: bool = True,
+                      issue_number: Optional[int] = None) -> Optional[str]:
         """Plan 생성 (speckit.plan 사용)"""
-        prompt_template = self._read_prompt_from_toml("speckit.plan")
-        if not prompt_template:
+        template = self._get_template("speckit.plan")
+        if not template:
             return None
             
         # 프롬프트 변수 치환
-        prompt = prompt_template.replace("{spec}", spec_content)
+        prompt = get_prompt_builder(self._backend()).build(
+            template, {'spec': spec_content}, required=('spec',), label="speckit.plan"
+        ).text
         
         print("🤖 Spec-kit (speckit.plan)으로 Plan 생성 중...")
-        return self._call_gemini(prompt)
+        return self._call_gemini(prompt, use_cache=use_cache, issue_number=issue_number)
 
-    def generate_tasks(self, plan_content: str) -> Optional[str]:
+    def generate_tasks(self, plan_content: str, use_cache: bool = True,
+                       issue_number: Optional[int] = None) -> Optional[str]:
         """Tasks 생성 (speckit.task 사용)"""
-        prompt_template = self._read_prompt_from_toml("speckit.task")
-        if not prompt_template:
+        template = self._get_template("speckit.task")
+        if not template:
             return None
             
         # 프롬프트 변수 치환
-        prompt = prompt_template.replace("{plan}", plan_content)
+        prompt = get_prompt_builder(self._backend()).build(
+            template, {'plan': plan_content}, required=('plan',), label="speckit.task"
+        ).text
         
         print("🤖 Spec-kit (speckit.task)로 Tasks 생성 중...")
-        return self._call_gemini(prompt)
+        return self._call_gemini(prompt, use_cache=use_cache, issue_number=issue_number)
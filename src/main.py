@@ -1,25 +1,37 @@
 """
 FastAPI 서버 - Slack & GitHub Webhook Integration
 """
+import asyncio
 import json
 import os
-from typing import Dict, Any
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import uvicorn
 from dotenv import load_dotenv
 
 # 프로젝트 모듈
 from integrations.slack_bot import SlackBot
 from integrations.github_client import GitHubClient
-from integrations.gemini_client import GeminiClient
 from integrations.spec_kit_client import SpecKitClient
 from agents.goose_agent_executor import GooseAgentExecutor
+from agents.goose_session_manager import get_goose_session_manager
+from integrations.capability_registry import get_capability_registry
+from integrations.gemini_worker_pool import get_gemini_pool
+from integrations.backend_dispatcher import get_backend_dispatcher
 from models.issue import GitHubIssue
+from models.workflow_state import ApprovalStatus
 from utils.file_manager import FileManager
+from utils.state_store import WorkflowStateStore
+from utils.workspace_manager import WorkspaceManager
+from utils.output_stream import get_output_hub
 from workflow.review_agent import ReviewAgent
+from agents.llm_review_agent import LLMReviewAgent
 from workflow.stage_executor import StageExecutor
 from workflow.orchestrator import WorkflowOrchestrator
+from workflow.job_queue import QueueFullError, WorkflowJobQueue
+from utils.process_runner import get_process_runner
+from utils.rate_limiter import get_rate_limiter
+from utils.resilience import get_resilience
 
 load_dotenv()
 
@@ -44,7 +56,11 @@ except Exception as e:
 
 # FileManager, ReviewAgent, StageExecutor는 항상 생성 가능
 file_manager = FileManager()
-review_agent = ReviewAgent(auto_approve=False)
+state_store = WorkflowStateStore()
+workspace_manager = WorkspaceManager()
+# Spec 리뷰를 LLM Review Agent(단계별 리뷰 포함)에 맡길지 여부 (REVIEW_LLM_ENABLED)
+spec_reviewer = LLMReviewAgent() if os.getenv("REVIEW_LLM_ENABLED", "false").lower() == "true" else None
+review_agent = ReviewAgent(auto_approve=False, spec_reviewer=spec_reviewer)
 print("✅ 기본 컴포넌트 초기화 완료")
 
 # Spec-kit Client 초기화
@@ -68,19 +84,52 @@ stage_executor = StageExecutor(
 
 # Orchestrator는 SlackBot이 있으면 생성
 if bot:
-    orchestrator = WorkflowOrchestrator(stage_executor, bot)
+    orchestrator = WorkflowOrchestrator(
+        stage_executor, bot,
+        state_store=state_store,
+        workspace_manager=workspace_manager
+    )
     print("✅ WorkflowOrchestrator 초기화 완료")
 else:
     print("⚠️ WorkflowOrchestrator 초기화 실패 (SlackBot 필요)")
 
-# 승인 상태 저장 (실제로는 DB나 파일로 저장)
-approval_status: Dict[str, str] = {}
+# 워크플로우 작업 큐 (Webhook은 즉시 응답, 실행은 백그라운드 워커)
+job_queue = WorkflowJobQueue()
+
+# 같은 Issue의 연속 Webhook 이벤트(opened, labeled...)를 하나로 합치는 대기 시간
+WEBHOOK_DEBOUNCE_SECONDS = float(os.getenv("WEBHOOK_DEBOUNCE_SECONDS", "3"))
+
+# 완료된 워크플로우를 처음부터 다시 실행하려면 Issue에 붙이는 라벨 (그 외 이벤트는 duplicate 처리)
+WORKFLOW_RERUN_LABEL = os.getenv("WORKFLOW_RERUN_LABEL", "rerun")
+
+# Goose / Gemini 실시간 출력 (Issue별 로그 파일 + 링 버퍼)
+output_hub = get_output_hub()
+
+def priority_class_for(issue_number: int) -> str:
+    """저장된 Issue 라벨 기준 우선순위 클래스 (Issue 정보가 없으면 기본 클래스)"""
+    issue = state_store.load_issue(issue_number)
+    return job_queue.classify(issue.labels if issue else [])
+
+
+def queue_full_response(error: QueueFullError, issue_number: int) -> JSONResponse:
+    """대기열 포화 응답 (429 + Retry-After)"""
+    print(f"⏳ 작업 대기열 포화 ({error.pending}/{error.limit}) - Issue #{issue_number} 거부")
+    return JSONResponse(
+        status_code=429,
+        headers={"Retry-After": str(error.retry_after)},
+        content={
+            "status": "rejected",
+            "reason": str(error),
+            "issue_number": issue_number,
+            "retry_after": error.retry_after
+        }
+    )
 
 
 def on_approval_decision(callback_id: str) -> None:
     """승인/거부 콜백 핸들러"""
     def callback(action: str):
-        approval_status[callback_id] = action
+        state_store.set_approval(callback_id, action)
         print(f"[INFO] {callback_id}: {action}")
         
         # 여기에 추가 로직 (예: 다음 Phase 자동 시작)
@@ -92,12 +141,53 @@ def on_approval_decision(callback_id: str) -> None:
     return callback
 
 
+@app.on_event("startup")
+async def start_job_queue():
+    """작업 큐 워커 시작 + 중단된 워크플로우 재개"""
+    job_queue.start()
+    workspace_manager.start_gc()
+    asyncio.get_running_loop().run_in_executor(None, get_gemini_pool().warm)
+    
+    if orchestrator:
+        channel = os.getenv("SLACK_CHANNEL", "#dev-team")
+        for state in orchestrator.unfinished_workflows():
+            job_queue.submit(state.issue_number, orchestrator.resume_workflow, state.issue_number, channel,
+                             priority_class=priority_class_for(state.issue_number), admit=False)
+
+
+@app.on_event("shutdown")
+async def stop_job_queue():
+    """작업 큐 워커 종료"""
+    job_queue.shutdown(wait=False)
+    workspace_manager.stop_gc()
+    stage_executor.speculator.shutdown()
+    get_gemini_pool().shutdown()
+    get_backend_dispatcher().shutdown()
+
+
 @app.get("/")
 async def root():
     """Health check"""
     return {"status": "ok", "service": "Virtual Dev Team Slack Bot"}
 
 
+@app.get("/api/health")
+def health():
+    """백엔드(CLI) 가용성 포함 상세 Health check"""
+    return {
+        "status": "ok",
+        "backends": get_capability_registry().snapshot(),
+        "speculation": stage_executor.speculator.snapshot(),
+        "review_cascade": spec_reviewer.cascade_stats() if spec_reviewer else None,
+        "gemini_pool": get_gemini_pool().snapshot(),
+        "goose_sessions": get_goose_session_manager().snapshot(),
+        "dispatch": get_backend_dispatcher().snapshot(),
+        "queue": job_queue.snapshot(),
+        "rate_limits": get_rate_limiter().snapshot(),
+        "circuit_breakers": get_resilience().snapshot()
+    }
+
+
 @app.post("/slack/interactive")
 async def slack_interactive(request: Request):
     """
@@ -173,7 +263,7 @@ async def send_approval(request: ApprovalRequest):
 @app.get("/api/approval-status/{callback_id}")
 async def get_approval_status(callback_id: str):
     """승인 상태 조회"""
-    status = approval_status.get(callback_id, "pending")
+    status = state_store.get_approval(callback_id) or "pending"
     return {"callback_id": callback_id, "status": status}
 
 
@@ -209,20 +299,80 @@ async def github_webhook(request: Request):
         # GitHubIssue 모델로 변환
         issue = GitHubIssue.from_github_api(issue_data)
         
-        # 워크플로우 시작
-        channel = os.getenv("SLACK_CHANNEL", "#dev-team")
-        success = orchestrator.start_workflow(issue, channel)
+        # GitHub 재전송(같은 X-GitHub-Delivery)은 한 번만 처리
+        delivery_id = request.headers.get("X-GitHub-Delivery")
+        if delivery_id:
+            previous = state_store.claim_delivery(delivery_id, issue.number)
+            if previous is not None:
+                return {
+                    "status": "duplicate",
+                    "reason": f"Delivery {delivery_id} already processed",
+                    "job_id": previous.get("job_id"),
+                    "issue_number": issue.number
+                }
         
-        if success:
+        # 이미 진행 중인 워크플로우가 있으면 새로 시작하지 않음 (labeled 이벤트 등)
+        # 거부되어 사용자 승인을 기다리는 워크플로우도 다시 시작하지 않음 (/api/approve로 진행)
+        state = orchestrator.get_state(issue.number)
+        if state and not state.is_completed and state.approval_status == ApprovalStatus.REJECTED:
+            return JSONResponse(
+                status_code=409,
+                content={
+                    "status": "awaiting_approval",
+                    "message": f"Workflow for issue #{issue.number} is waiting for approval",
+                    "issue_number": issue.number,
+                    "stage": state.current_stage.value
+                }
+            )
+        if state and not state.is_completed:
             return {
-                "status": "success",
-                "message": f"Workflow started for issue #{issue.number}",
+                "status": "attached",
+                "message": f"Workflow already running for issue #{issue.number}",
                 "issue_number": issue.number,
-                "issue_title": issue.title
+                "stage": state.current_stage.value
             }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to start workflow")
+        
+        # 완료된 워크플로우는 재실행 라벨이 붙은 경우에만 다시 시작 (Issue당 한 번 실행)
+        rerun = action == "labeled" and (payload.get("label") or {}).get("name") == WORKFLOW_RERUN_LABEL
+        if state and not rerun:
+            return {
+                "status": "duplicate",
+                "reason": (f"Workflow for issue #{issue.number} already completed "
+                           f"(add the '{WORKFLOW_RERUN_LABEL}' label to rerun)"),
+                "issue_number": issue.number,
+                "stage": state.current_stage.value
+            }
+        
+        # 워크플로우 작업 등록 (실행은 백그라운드 워커에서)
+        # opened → labeled 이벤트가 연달아 오면 debounce 구간 안에서 하나의 작업으로 합침
+        channel = os.getenv("SLACK_CHANNEL", "#dev-team")
+        try:
+            job, coalesced = job_queue.submit_single_flight(
+                f"start:{issue.number}", issue.number, orchestrator.start_workflow, issue, channel,
+                debounce=WEBHOOK_DEBOUNCE_SECONDS, priority_class=job_queue.classify(issue.labels)
+            )
+        except QueueFullError as e:
+            if delivery_id:
+                state_store.release_delivery(delivery_id)  # 재전송 시 다시 처리
+            return queue_full_response(e, issue.number)
+        if delivery_id:
+            state_store.set_delivery_job(delivery_id, job.job_id)
+        
+        return JSONResponse(
+            status_code=202,
+            content={
+                "status": "attached" if coalesced else "accepted",
+                "message": (f"Event merged into queued workflow for issue #{issue.number}" if coalesced
+                            else f"Workflow queued for issue #{issue.number}"),
+                "job_id": job.job_id,
+                "issue_number": issue.number,
+                "issue_title": issue.title,
+                "priority_class": job.priority_class
+            }
+        )
     
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"GitHub Webhook 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -239,13 +389,83 @@ async def approve_issue(issue_number: int):
     if not orchestrator:
         raise HTTPException(status_code=503, detail="Orchestrator not initialized")
     
+    if not orchestrator.get_state(issue_number):
+        raise HTTPException(status_code=404, detail=f"Workflow not found for issue #{issue_number}")
+    
+    # 연달아 들어온 승인은 대기/실행 중인 승인 작업에 합침 (같은 단계를 두 번 실행하지 않음)
     channel = os.getenv("SLACK_CHANNEL", "#dev-team")
-    success = orchestrator.approve_and_continue(issue_number, channel)
+    try:
+        job, coalesced = job_queue.submit_single_flight(
+            f"approve:{issue_number}", issue_number, orchestrator.approve_and_continue, issue_number, channel,
+            priority_class=priority_class_for(issue_number)
+        )
+    except QueueFullError as e:
+        return queue_full_response(e, issue_number)
     
-    if success:
-        return {"status": "approved", "issue_number": issue_number}
-    else:
-        raise HTTPException(status_code=404, detail=f"Workflow not found for issue #{issue_number}")
+    return JSONResponse(
+        status_code=202,
+        content={"status": "approved", "issue_number": issue_number, "job_id": job.job_id,
+                 "coalesced": coalesced}
+    )
+
+
+@app.get("/api/metrics/queue")
+def queue_metrics():
+    """작업 대기열 점유율 + CLI 프로세스 실행/대기 수 (제한값 조정용)"""
+    return {
+        "workflows": job_queue.snapshot(),
+        "processes": get_process_runner().snapshot(),
+        "rate_limits": get_rate_limiter().snapshot(),
+        "gemini_pool": get_gemini_pool().snapshot()
+    }
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    """워크플로우 작업 상태 조회"""
+    job = job_queue.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    
+    return job.to_dict()
+
+
+@app.get("/api/workflows/{issue_number}/stream")
+async def stream_workflow_output(issue_number: int, request: Request, since: int = 0):
+    """
+    Goose / Gemini 실시간 출력 스트림 (Server-Sent Events)
+    
+    메모리 링 버퍼의 최근 출력부터 전송하고 이후 새 라인을 계속 전송
+    워크플로우가 완료/거부/실패로 멈추면 `event: end`를 보내고 연결 종료
+    (버퍼에서 밀려난 출력은 logs/issues/issue-<번호>.log 참고)
+    
+    Example:
+        curl -N http://localhost:8000/api/workflows/42/stream
+    """
+    last_seq = int(request.headers.get("Last-Event-ID") or since)
+    
+    async def events():
+        nonlocal last_seq
+        idle = 0.0
+        while not await request.is_disconnected():
+            entries = output_hub.tail(issue_number, since=last_seq)
+            for entry in entries:
+                last_seq = entry['seq']
+                yield f"id: {entry['seq']}\ndata: {json.dumps(entry, ensure_ascii=False)}\n\n"
+            
+            if not entries and output_hub.is_closed(issue_number):
+                yield f"event: end\ndata: {json.dumps({'issue_number': issue_number})}\n\n"
+                return
+            
+            idle = 0.0 if entries else idle + 0.5
+            if idle >= 15:
+                # 프록시 연결 유지용 주석 이벤트
+                yield ": keep-alive\n\n"
+                idle = 0.0
+            await asyncio.sleep(0.5)
+    
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 """Models package"""
 from .issue import GitHubIssue
 from .workflow_state import WorkflowState, WorkflowStage, ApprovalStatus
+from .markdown_document import MarkdownDocument, parse_document, load_document
 
-__all__ = ['GitHubIssue', 'WorkflowState', 'WorkflowStage', 'ApprovalStatus']
+__all__ = ['GitHubIssue', 'WorkflowState', 'WorkflowStage', 'ApprovalStatus',
+           'MarkdownDocument', 'parse_document', 'load_document']
@@ -45,6 +45,29 @@ class GitHubIssue:
             author=issue_data['user']['login']
         )
     
+    @classmethod
+    def from_dict(cls, data: dict) -> 'GitHubIssue':
+        """
+        to_dict() 결과에서 GitHubIssue 인스턴스 복원
+        
+        Args:
+            data: to_dict()로 만든 딕셔너리
+            
+        Returns:
+            GitHubIssue 인스턴스
+        """
+        return cls(
+            number=data['number'],
+            title=data['title'],
+            body=data.get('body', ''),
+            state=data['state'],
+            labels=list(data.get('labels', [])),
+            created_at=datetime.fromisoformat(data['created_at']),
+            updated_at=datetime.fromisoformat(data['updated_at']),
+            url=data['url'],
+            author=data['author']
+        )
+    
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
         return {
@@ -0,0 +1,183 @@
+"""
+Markdown Document Model
+
+spec.md / plan.md / tasks.md를 한 번만 파싱한 문서 모델
+- 섹션 트리 (헤더 계층)
+- FR-### / SC-### ID
+- 태스크 ID + 체크박스 상태 + 소속 Phase
+- Phase 헤더
+
+같은 내용(문서 버전)은 캐시된 객체를 공유하므로 리뷰어, 태스크 파서,
+프롬프트 빌더가 원문을 반복해서 다시 스캔하지 않음
+"""
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+TASK_PATTERN = re.compile(r'^\s*- \[( |x|X)\] (T\d+)\b(.*)$')
+PHASE_TITLE_PATTERN = re.compile(r'^Phase\s+(\d+)\b', re.IGNORECASE)
+REQUIREMENT_ID_PATTERN = re.compile(r'\bFR-\d+\b')
+SUCCESS_CRITERIA_ID_PATTERN = re.compile(r'\bSC-\d+\b')
+
+
+@dataclass
+class Section:
+    """헤더 하나와 그 하위 섹션"""
+    level: int
+    title: str
+    line: int  # 헤더 줄 번호 (0부터)
+    children: List['Section'] = field(default_factory=list)
+
+
+@dataclass
+class TaskItem:
+    """tasks.md 체크박스 태스크"""
+    id: str
+    description: str
+    completed: bool
+    phase: int
+    line: int
+
+
+@dataclass
+class PhaseHeader:
+    """## Phase N 헤더"""
+    number: int
+    title: str
+    line: int
+
+
+@dataclass
+class MarkdownDocument:
+    """파싱된 Markdown 문서 (읽기 전용으로 공유)"""
+    text: str
+    lines: List[str]
+    sections: List[Section]
+    headings: List[Section]
+    requirement_ids: List[str]
+    success_criteria_ids: List[str]
+    tasks: List[TaskItem]
+    phases: List[PhaseHeader]
+
+    @classmethod
+    def parse(cls, text: str) -> 'MarkdownDocument':
+        """
+        문서 파싱 (한 번의 라인 순회)
+
+        코드 블록(``` / ~~~) 안의 '#' 줄은 헤더로 보지 않음
+
+        Args:
+            text: Markdown 원문
+
+        Returns:
+            MarkdownDocument
+        """
+        lines = text.splitlines()
+        roots: List[Section] = []
+        headings: List[Section] = []
+        stack: List[Section] = []
+        tasks: List[TaskItem] = []
+        phases: List[PhaseHeader] = []
+        requirement_ids: Dict[str, None] = {}
+        success_ids: Dict[str, None] = {}
+        in_fence = False
+        phase = 0
+
+        for index, line in enumerate(lines):
+            if FENCE_PATTERN.match(line):
+                in_fence = not in_fence
+                continue
+
+            heading = None if in_fence else HEADING_PATTERN.match(line)
+            if heading:
+                section = Section(level=len(heading.group(1)), title=heading.group(2), line=index)
+                while stack and stack[-1].level >= section.level:
+                    stack.pop()
+                (stack[-1].children if stack else roots).append(section)
+                stack.append(section)
+                headings.append(section)
+
+                phase_match = PHASE_TITLE_PATTERN.match(section.title)
+                if phase_match and section.level in (2, 3):
+                    phase = int(phase_match.group(1))
+                    phases.append(PhaseHeader(phase, section.title, index))
+                continue
+
+            task = TASK_PATTERN.match(line)
+            if task:
+                checked, task_id, rest = task.groups()
+                tasks.append(TaskItem(task_id, rest.strip(), checked.lower() == 'x', phase, index))
+
+            if 'FR-' in line:
+                requirement_ids.update(dict.fromkeys(REQUIREMENT_ID_PATTERN.findall(line)))
+            if 'SC-' in line:
+                success_ids.update(dict.fromkeys(SUCCESS_CRITERIA_ID_PATTERN.findall(line)))
+
+        return cls(
+            text=text,
+            lines=lines,
+            sections=roots,
+            headings=headings,
+            requirement_ids=list(requirement_ids),
+            success_criteria_ids=list(success_ids),
+            tasks=tasks,
+            phases=phases
+        )
+
+
+@lru_cache(maxsize=64)
+def parse_document(text: str) -> MarkdownDocument:
+    """
+    문서 파싱 (같은 내용은 캐시된 객체 반환)
+
+    Args:
+        text: Markdown 원문
+
+    Returns:
+        MarkdownDocument
+    """
+    return MarkdownDocument.parse(text)
+
+
+_file_cache: 'OrderedDict[Path, Tuple[int, int, MarkdownDocument]]' = OrderedDict()
+_file_cache_lock = threading.Lock()
+_FILE_CACHE_SIZE = 64
+
+
+def load_document(path) -> Optional[MarkdownDocument]:
+    """
+    파일에서 문서 로드 (mtime/크기가 같으면 디스크를 다시 읽지 않음)
+
+    Args:
+        path: Markdown 파일 경로
+
+    Returns:
+        MarkdownDocument 또는 None (파일 없음)
+    """
+    path = Path(path).resolve()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    with _file_cache_lock:
+        cached = _file_cache.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _file_cache.move_to_end(path)
+            return cached[2]
+
+    document = parse_document(path.read_text(encoding='utf-8'))
+
+    with _file_cache_lock:
+        _file_cache[path] = (stat.st_mtime_ns, stat.st_size, document)
+        _file_cache.move_to_end(path)
+        while len(_file_cache) > _FILE_CACHE_SIZE:
+            _file_cache.popitem(last=False)
+    return document
@@ -66,6 +66,12 @@ class WorkflowState:
         except ValueError:
             return False
     
+    @property
+    def is_completed(self) -> bool:
+        """마지막 단계(구현)까지 완료되었는지 여부"""
+        return (self.current_stage == WorkflowStage.IMPLEMENTATION
+                and self.implementation_status in ('success', 'skipped'))
+
     def approve(self):
         """현재 단계 승인"""
         self.approval_status = ApprovalStatus.APPROVED
@@ -88,5 +94,30 @@ class WorkflowState:
             'spec_path': self.spec_path,
             'plan_path': self.plan_path,
             'tasks_path': self.tasks_path,
+            'implementation_status': self.implementation_status,
             'error_message': self.error_message
         }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'WorkflowState':
+        """
+        딕셔너리에서 WorkflowState 복원
+        
+        Args:
+            data: to_dict()로 만든 딕셔너리
+            
+        Returns:
+            WorkflowState 인스턴스
+        """
+        return cls(
+            issue_number=data['issue_number'],
+            current_stage=WorkflowStage(data['current_stage']),
+            approval_status=ApprovalStatus(data['approval_status']),
+            created_at=datetime.fromisoformat(data['created_at']),
+            updated_at=datetime.fromisoformat(data['updated_at']),
+            spec_path=data.get('spec_path'),
+            plan_path=data.get('plan_path'),
+            tasks_path=data.get('tasks_path'),
+            implementation_status=data.get('implementation_status'),
+            error_message=data.get('error_message')
+        )
@@ -0,0 +1,112 @@
+"""
+Cancellation
+
+결과가 필요 없어진 백엔드 호출(hedged/race에서 진 후보)을 중단하기 위한 취소 토큰
+- BackendDispatcher가 후보마다 CancelToken을 만들고 cancel_scope()로 호출 스레드에 연결
+- 같은 스레드의 ProcessRunner.run_sync, 재시도 대기, rate limit 대기, 상주 워커 요청이
+  현재 토큰을 확인 → 취소되면 프로세스를 종료하고 CancelledError 발생
+
+사용 예:
+    token = CancelToken()
+    with cancel_scope(token):
+        result = runner.run_sync(args, backend="gemini")  # 다른 스레드에서 token.cancel() 시 중단
+"""
+import threading
+import time
+from concurrent.futures import CancelledError
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+
+class CancelToken:
+    """취소 요청 전달 (한 번 취소되면 되돌릴 수 없음)"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """취소 여부"""
+        return self._event.is_set()
+
+    def cancel(self):
+        """취소 (등록된 콜백 실행)"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"⚠️ 취소 콜백 오류: {e}")
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        취소 시 실행할 콜백 등록 (이미 취소됐으면 즉시 실행)
+
+        Returns:
+            콜백 등록 해제 함수
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove(callback)
+        callback()
+        return lambda: None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        취소되거나 timeout이 지날 때까지 대기
+
+        Returns:
+            취소 여부
+        """
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self):
+        """취소됐으면 CancelledError"""
+        if self._event.is_set():
+            raise CancelledError()
+
+    def _remove(self, callback: Callable[[], None]):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+
+_local = threading.local()
+
+
+@contextmanager
+def cancel_scope(token: CancelToken) -> Iterator[CancelToken]:
+    """현재 스레드의 호출을 token에 연결"""
+    previous = getattr(_local, 'token', None)
+    _local.token = token
+    try:
+        yield token
+    finally:
+        _local.token = previous
+
+
+def current_token() -> Optional[CancelToken]:
+    """현재 스레드에 연결된 취소 토큰 (없으면 None)"""
+    return getattr(_local, 'token', None)
+
+
+def sleep(seconds: float):
+    """
+    취소 가능한 time.sleep
+
+    Raises:
+        CancelledError: 대기 중 현재 토큰이 취소된 경우
+    """
+    token = current_token()
+    if token is None:
+        time.sleep(seconds)
+        return
+    if token.wait(seconds):
+        raise CancelledError()
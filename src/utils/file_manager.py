@@ -6,6 +6,7 @@ File Manager Utility
 import os
 from pathlib import Path
 from typing import Optional
+from models.markdown_document import MarkdownDocument, load_document
 
 
 class FileManager:
@@ -97,6 +98,18 @@ class FileManager:
         except FileNotFoundError:
             return None
     
+    def read_document(self, file_path: Path) -> Optional[MarkdownDocument]:
+        """
+        Markdown 문서 읽기 + 파싱 (파일이 바뀌지 않았으면 캐시된 문서 반환)
+        
+        Args:
+            file_path: 파일 경로
+            
+        Returns:
+            MarkdownDocument (실패 시 None)
+        """
+        return load_document(file_path)
+    
     def file_exists(self, file_path: Path) -> bool:
         """
         파일 존재 여부 확인
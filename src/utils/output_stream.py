@@ -0,0 +1,174 @@
+"""
+Process Output Stream
+
+Goose / Gemini 프로세스 출력을 라인 단위로 Issue별 로그 파일과
+메모리 링 버퍼(최근 N줄)에 기록
+- 프로세스 종료를 기다리지 않고 진행 상황 확인 (SSE endpoint)
+- 전체 출력은 로그 파일에만 남기고 메모리 사용량은 버퍼 크기로 제한
+- 워크플로우가 끝나고(close) OUTPUT_RETENTION_SECONDS가 지난 스트림은 메모리에서 제거
+"""
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+from utils.process_runner import LineCallback
+
+
+class IssueOutputStream:
+    """단일 Issue의 출력 스트림"""
+
+    def __init__(self, issue_number: int, log_path: Path, max_lines: int):
+        """
+        Args:
+            issue_number: Issue 번호
+            log_path: 로그 파일 경로 (append)
+            max_lines: 메모리에 유지할 최근 라인 수
+        """
+        self.issue_number = issue_number
+        self.log_path = log_path
+        self.lines: Deque[Dict[str, Any]] = deque(maxlen=max_lines)
+        self.last_seq = 0
+        self.closed_at: Optional[float] = None  # 마지막 close() 시각 (이후 write가 있으면 None)
+        self._file = None
+        self._lock = threading.Lock()
+
+    def write(self, source: str, line: str):
+        """
+        한 줄 기록
+
+        Args:
+            source: 출력 출처 (예: "goose:stdout")
+            line: 출력 라인
+        """
+        now = time.time()
+        with self._lock:
+            self.last_seq += 1
+            self.lines.append({'seq': self.last_seq, 'time': now, 'source': source, 'line': line})
+            self.closed_at = None
+
+            if self._file is None:
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.log_path, 'a', encoding='utf-8')
+            stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+            self._file.write(f"{stamp} | {source} | {line}\n")
+            self._file.flush()
+
+    def since(self, seq: int = 0) -> List[Dict[str, Any]]:
+        """seq 이후의 라인 (버퍼에서 밀려난 라인은 로그 파일에만 존재)"""
+        with self._lock:
+            return [entry for entry in self.lines if entry['seq'] > seq]
+
+    def close(self):
+        """로그 파일 닫기 (버퍼는 유지, 다음 write 시 다시 열림)"""
+        with self._lock:
+            self.closed_at = time.time()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class OutputStreamHub:
+    """Issue별 출력 스트림 관리자"""
+
+    def __init__(self, log_dir: Optional[str] = None, max_lines: Optional[int] = None,
+                 retention_seconds: Optional[float] = None):
+        """
+        Args:
+            log_dir: Issue별 로그 디렉토리 (기본값: OUTPUT_LOG_DIR 또는 logs/issues)
+            max_lines: Issue별 링 버퍼 크기 (기본값: OUTPUT_BUFFER_LINES 또는 1000)
+            retention_seconds: close() 후 버퍼를 유지할 시간 (초, 기본값: OUTPUT_RETENTION_SECONDS 또는 3600)
+        """
+        self.log_dir = Path(log_dir or os.getenv("OUTPUT_LOG_DIR", "logs/issues"))
+        self.max_lines = max_lines or int(os.getenv("OUTPUT_BUFFER_LINES", "1000"))
+        if retention_seconds is None:
+            retention_seconds = float(os.getenv("OUTPUT_RETENTION_SECONDS", "3600"))
+        self.retention_seconds = retention_seconds
+        self._streams: Dict[int, IssueOutputStream] = {}
+        self._lock = threading.Lock()
+
+    def stream(self, issue_number: int) -> IssueOutputStream:
+        """Issue 출력 스트림 (없으면 생성)"""
+        with self._lock:
+            self._evict_locked(time.time())
+            stream = self._streams.get(issue_number)
+            if stream is None:
+                stream = self._streams[issue_number] = IssueOutputStream(
+                    issue_number,
+                    self.log_dir / f"issue-{issue_number}.log",
+                    self.max_lines
+                )
+            return stream
+
+    def callbacks(self, issue_number: Optional[int], backend: str) -> Dict[str, LineCallback]:
+        """
+        ProcessRunner 라인 콜백 생성
+
+        사용 예: runner.run_sync(args, backend="goose", **hub.callbacks(issue_number, "goose"))
+
+        Args:
+            issue_number: Issue 번호 (None이면 스트리밍하지 않음)
+            backend: 출력 출처 이름
+
+        Returns:
+            {"on_stdout": ..., "on_stderr": ...} 또는 빈 딕셔너리
+        """
+        if issue_number is None:
+            return {}
+
+        stream = self.stream(issue_number)
+        return {
+            'on_stdout': lambda line: stream.write(f"{backend}:stdout", line),
+            'on_stderr': lambda line: stream.write(f"{backend}:stderr", line)
+        }
+
+    def tail(self, issue_number: int, since: int = 0) -> List[Dict[str, Any]]:
+        """
+        Issue 출력 조회
+
+        Args:
+            issue_number: Issue 번호
+            since: 이 seq 이후의 라인만 반환
+
+        Returns:
+            [{"seq", "time", "source", "line"}, ...]
+        """
+        with self._lock:
+            stream = self._streams.get(issue_number)
+        return stream.since(since) if stream else []
+
+    def is_closed(self, issue_number: int) -> bool:
+        """워크플로우가 멈춰(close) 더 이상 출력이 없는 스트림인지 여부 (스트림이 없으면 False)"""
+        with self._lock:
+            stream = self._streams.get(issue_number)
+        return stream is not None and stream.closed_at is not None
+
+    def close(self, issue_number: int):
+        """Issue 로그 파일 닫기 (버퍼는 retention_seconds 동안 유지 후 제거)"""
+        with self._lock:
+            stream = self._streams.get(issue_number)
+        if stream:
+            stream.close()
+        with self._lock:
+            self._evict_locked(time.time())
+
+    def _evict_locked(self, now: float):
+        """닫힌 지 retention_seconds가 지난 스트림 제거 (_lock 보유 상태에서 호출)"""
+        expired = [number for number, stream in self._streams.items()
+                   if stream.closed_at is not None and now - stream.closed_at >= self.retention_seconds]
+        for number in expired:
+            del self._streams[number]
+
+
+_output_hub: Optional[OutputStreamHub] = None
+_output_hub_lock = threading.Lock()
+
+
+def get_output_hub() -> OutputStreamHub:
+    """프로세스 공용 OutputStreamHub 인스턴스"""
+    global _output_hub
+    with _output_hub_lock:
+        if _output_hub is None:
+            _output_hub = OutputStreamHub()
+        return _output_hub
@@ -0,0 +1,399 @@
+"""
+Async Process Runner
+
+asyncio.create_subprocess_exec 기반 공용 프로세스 실행기
+- 모든 CLI 프로세스(gemini, goose)를 하나의 백그라운드 이벤트 루프에서 실행
+- Timeout / 취소 시 프로세스 종료
+- 백엔드별 동시 실행 수 제한 + 전체 동시 실행 수 제한 (PROCESS_LIMIT_TOTAL)
+  (직접 띄운 상주 프로세스의 요청 처리 구간도 slot()으로 같은 제한에 포함)
+- 실행/대기 중인 프로세스 수 통계 (snapshot)
+- stdout/stderr 라인 단위 스트리밍 콜백
+- 결과에 보관하는 출력 크기 제한 (max_capture)
+- run_sync는 호출 스레드의 취소 토큰(utils.cancellation)이 취소되면 프로세스 종료
+"""
+import asyncio
+import codecs
+import concurrent.futures
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterator, List, Optional
+from utils.cancellation import current_token
+
+
+LineCallback = Callable[[str], None]
+
+
+@dataclass
+class ProcessResult:
+    """프로세스 실행 결과"""
+    args: List[str]
+    returncode: Optional[int]
+    stdout: str
+    stderr: str
+    duration: float
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """정상 종료(exit 0) 여부"""
+        return not self.timed_out and self.returncode == 0
+
+
+class _TailBuffer:
+    """출력 누적 버퍼 (max_chars 지정 시 마지막 max_chars 글자만 유지)"""
+
+    def __init__(self, max_chars: Optional[int] = None):
+        self.max_chars = max_chars
+        self.chunks: Deque[str] = deque()
+        self.size = 0
+
+    def append(self, text: str):
+        self.chunks.append(text)
+        self.size += len(text)
+        if self.max_chars is None:
+            return
+        while len(self.chunks) > 1 and self.size - len(self.chunks[0]) >= self.max_chars:
+            self.size -= len(self.chunks.popleft())
+
+    def text(self) -> str:
+        joined = "".join(self.chunks)
+        if self.max_chars is not None and len(joined) > self.max_chars:
+            return joined[-self.max_chars:]
+        return joined
+
+
+class ProcessRunner:
+    """백엔드별 동시성 제한이 있는 비동기 프로세스 실행기"""
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None, default_limit: Optional[int] = None,
+                 total_limit: Optional[int] = None):
+        """
+        Args:
+            limits: 백엔드별 최대 동시 프로세스 수 (예: {"gemini": 4, "goose": 2})
+                    지정하지 않은 백엔드는 PROCESS_LIMIT_<BACKEND> 환경변수를 사용
+            default_limit: 기본 최대 동시 프로세스 수 (기본값: PROCESS_LIMIT_DEFAULT 또는 4)
+            total_limit: 모든 백엔드를 합한 최대 동시 프로세스 수
+                         (기본값: PROCESS_LIMIT_TOTAL 또는 0 = 제한 없음)
+        """
+        self.limits = dict(limits or {})
+        self.default_limit = default_limit or int(os.getenv("PROCESS_LIMIT_DEFAULT", "4"))
+        if total_limit is None:
+            total_limit = int(os.getenv("PROCESS_LIMIT_TOTAL", "0"))
+        self.total_limit = total_limit
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._total_semaphore: Optional[asyncio.Semaphore] = None
+        self._active: Dict[str, int] = {}  # 백엔드별 실행 중인 프로세스 수
+        self._waiting: Dict[str, int] = {}  # 백엔드별 실행 슬롯 대기 수
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """프로세스를 실행하는 백그라운드 이벤트 루프 (필요 시 시작)"""
+        with self._start_lock:
+            if self._loop is None:
+                ready = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._loop_main,
+                    args=(ready,),
+                    name="process-runner",
+                    daemon=True
+                )
+                self._thread.start()
+                ready.wait()
+            return self._loop
+
+    def _loop_main(self, ready: threading.Event):
+        """백그라운드 이벤트 루프 스레드"""
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        ready.set()
+        self._loop.run_forever()
+
+    def limit_for(self, backend: str) -> int:
+        """백엔드의 최대 동시 프로세스 수"""
+        if backend not in self.limits:
+            env_value = os.getenv(f"PROCESS_LIMIT_{backend.upper().replace('-', '_')}")
+            self.limits[backend] = int(env_value) if env_value else self.default_limit
+        return self.limits[backend]
+
+    def snapshot(self) -> dict:
+        """백엔드별 실행/대기 프로세스 수 (metrics endpoint용)"""
+        backends = set(self._active) | set(self._waiting)
+        return {
+            'total_limit': self.total_limit or None,
+            'active': sum(self._active.values()),
+            'waiting': sum(self._waiting.values()),
+            'backends': {
+                backend: {
+                    'limit': self.limit_for(backend),
+                    'active': self._active.get(backend, 0),
+                    'waiting': self._waiting.get(backend, 0),
+                }
+                for backend in sorted(backends)
+            }
+        }
+
+    async def run(self,
+                  args: List[str],
+                  backend: str,
+                  timeout: Optional[float] = None,
+                  cwd: Optional[str] = None,
+                  input_text: Optional[str] = None,
+                  on_stdout: Optional[LineCallback] = None,
+                  on_stderr: Optional[LineCallback] = None,
+                  max_capture: Optional[int] = None) -> ProcessResult:
+        """
+        프로세스 실행 (코루틴)
+
+        호출한 이벤트 루프와 관계없이 실제 실행은 공용 백그라운드 루프에서 이루어짐
+
+        Args:
+            args: 실행할 명령 (예: ["gemini", "--version"])
+            backend: 동시성 제한 단위 (예: "gemini", "goose")
+            timeout: Timeout (초, None이면 무제한)
+            cwd: 작업 디렉토리
+            input_text: stdin으로 전달할 텍스트
+            on_stdout: stdout 라인 콜백
+            on_stderr: stderr 라인 콜백
+            max_capture: 결과에 보관할 stdout/stderr 최대 글자 수 (초과 시 마지막 부분만 유지,
+                         None이면 전체 보관)
+
+        Returns:
+            ProcessResult
+
+        Raises:
+            FileNotFoundError: 실행 파일이 없는 경우
+            asyncio.CancelledError: 실행 중 취소된 경우 (프로세스는 종료됨)
+        """
+        coro = self._run(args, backend, timeout, cwd, input_text, on_stdout, on_stderr, max_capture)
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self.loop:
+            return await coro
+
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        return await asyncio.wrap_future(future)
+
+    def submit(self, args: List[str], backend: str, **kwargs) -> concurrent.futures.Future:
+        """
+        프로세스 실행 예약 (동기 코드용)
+
+        반환된 Future를 cancel()하면 실행 중인 프로세스도 종료됨
+
+        Returns:
+            ProcessResult를 결과로 갖는 concurrent.futures.Future
+        """
+        return asyncio.run_coroutine_threadsafe(self._run(args, backend, **kwargs), self.loop)
+
+    def run_sync(self, args: List[str], backend: str, **kwargs) -> ProcessResult:
+        """
+        프로세스 실행 후 결과 대기 (동기 코드용)
+
+        인자는 run()과 동일
+
+        Raises:
+            concurrent.futures.CancelledError: 현재 취소 토큰이 취소된 경우 (대기 중이면 실행 안 함,
+                                               실행 중이면 프로세스 종료)
+        """
+        token = current_token()
+        if token is not None:
+            token.raise_if_cancelled()
+        future = self.submit(args, backend, **kwargs)
+        if token is None:
+            return future.result()
+
+        unregister = token.on_cancel(future.cancel)
+        try:
+            return future.result()
+        finally:
+            unregister()
+
+    @contextmanager
+    def slot(self, backend: str) -> Iterator[None]:
+        """
+        ProcessRunner 밖에서 실행하는 작업(예: 상주 gemini 워커 요청)의 실행 구간 (동기 코드용)
+
+        run()과 같은 백엔드/전체 동시 실행 수 제한을 사용하고 snapshot()의 실행/대기 수에 포함
+
+        Args:
+            backend: 동시성 제한 단위
+        """
+        asyncio.run_coroutine_threadsafe(self._acquire(backend), self.loop).result()
+        try:
+            yield
+        finally:
+            self.loop.call_soon_threadsafe(self._release, backend)
+
+    async def _acquire(self, backend: str):
+        """백엔드 → 전체 순서로 실행 슬롯 획득 (항상 같은 순서라 교착 없음)"""
+        semaphore = self._semaphores.get(backend)
+        if semaphore is None:
+            semaphore = self._semaphores[backend] = asyncio.Semaphore(self.limit_for(backend))
+        if self.total_limit and self._total_semaphore is None:
+            self._total_semaphore = asyncio.Semaphore(self.total_limit)
+
+        self._waiting[backend] = self._waiting.get(backend, 0) + 1
+        try:
+            await semaphore.acquire()
+            if self._total_semaphore is not None:
+                try:
+                    await self._total_semaphore.acquire()
+                except BaseException:
+                    semaphore.release()
+                    raise
+        finally:
+            self._waiting[backend] -= 1
+        self._active[backend] = self._active.get(backend, 0) + 1
+
+    def _release(self, backend: str):
+        """실행 슬롯 반환 (백그라운드 루프에서 호출)"""
+        self._active[backend] -= 1
+        if self._total_semaphore is not None:
+            self._total_semaphore.release()
+        self._semaphores[backend].release()
+
+    async def _run(self,
+                   args: List[str],
+                   backend: str,
+                   timeout: Optional[float] = None,
+                   cwd: Optional[str] = None,
+                   input_text: Optional[str] = None,
+                   on_stdout: Optional[LineCallback] = None,
+                   on_stderr: Optional[LineCallback] = None,
+                   max_capture: Optional[int] = None) -> ProcessResult:
+        """실제 실행 (백그라운드 루프에서 동작)"""
+        await self._acquire(backend)
+        try:
+            return await self._execute(args, timeout, cwd, input_text, on_stdout, on_stderr, max_capture)
+        finally:
+            self._release(backend)
+
+    async def _execute(self,
+                       args: List[str],
+                       timeout: Optional[float],
+                       cwd: Optional[str],
+                       input_text: Optional[str],
+                       on_stdout: Optional[LineCallback],
+                       on_stderr: Optional[LineCallback],
+                       max_capture: Optional[int]) -> ProcessResult:
+        """실행 슬롯을 얻은 뒤 프로세스 실행"""
+        started = time.monotonic()
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=asyncio.subprocess.PIPE if input_text is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd
+        )
+
+        stdout_buffer = _TailBuffer(max_capture)
+        stderr_buffer = _TailBuffer(max_capture)
+        io_task = asyncio.gather(
+            self._feed_stdin(proc, input_text),
+            self._read_stream(proc.stdout, stdout_buffer, on_stdout),
+            self._read_stream(proc.stderr, stderr_buffer, on_stderr),
+            proc.wait()
+        )
+
+        timed_out = False
+        try:
+            await asyncio.wait_for(asyncio.shield(io_task), timeout=timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            await self._terminate(proc, io_task)
+        except asyncio.CancelledError:
+            await self._terminate(proc, io_task)
+            raise
+
+        return ProcessResult(
+            args=list(args),
+            returncode=proc.returncode,
+            stdout=stdout_buffer.text(),
+            stderr=stderr_buffer.text(),
+            duration=time.monotonic() - started,
+            timed_out=timed_out
+        )
+
+    @staticmethod
+    async def _feed_stdin(proc: asyncio.subprocess.Process, input_text: Optional[str]):
+        """stdin 전달 후 닫기"""
+        if input_text is None or proc.stdin is None:
+            return
+        try:
+            proc.stdin.write(input_text.encode("utf-8"))
+            await proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            proc.stdin.close()
+
+    @staticmethod
+    async def _read_stream(stream: asyncio.StreamReader, buffer: '_TailBuffer',
+                           on_line: Optional[LineCallback]):
+        """
+        스트림을 청크 단위로 읽어 누적하고 완성된 라인마다 콜백 호출
+
+        청크 경계에서 잘린 멀티바이트 문자(한글 등)가 깨지지 않도록 증분 디코더 사용
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        while True:
+            data = await stream.read(65536)
+            text = decoder.decode(data, final=not data)
+            if text:
+                buffer.append(text)
+
+                if on_line:
+                    pending += text
+                    *lines, pending = pending.split("\n")
+                    for line in lines:
+                        ProcessRunner._emit(on_line, line)
+            if not data:
+                break
+
+        if on_line and pending:
+            ProcessRunner._emit(on_line, pending)
+
+    @staticmethod
+    def _emit(on_line: LineCallback, line: str):
+        """콜백 예외가 프로세스 실행을 중단시키지 않도록 보호"""
+        try:
+            on_line(line.rstrip("\r"))
+        except Exception as e:
+            print(f"⚠️ 출력 콜백 오류: {e}")
+
+    @staticmethod
+    async def _terminate(proc: asyncio.subprocess.Process, io_task: asyncio.Future):
+        """프로세스 강제 종료 후 I/O 정리"""
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+        try:
+            await asyncio.wait_for(io_task, timeout=5)
+        except (asyncio.TimeoutError, asyncio.CancelledError, Exception):
+            io_task.cancel()
+
+
+_process_runner: Optional[ProcessRunner] = None
+_process_runner_lock = threading.Lock()
+
+
+def get_process_runner() -> ProcessRunner:
+    """프로세스 공용 ProcessRunner 인스턴스"""
+    global _process_runner
+    with _process_runner_lock:
+        if _process_runner is None:
+            _process_runner = ProcessRunner()
+        return _process_runner
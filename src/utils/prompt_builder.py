@@ -0,0 +1,283 @@
+"""
+Token-budgeted Prompt Builder
+
+템플릿 + 컨텍스트로 프롬프트를 구성
+- 템플릿 placeholder로 이미 들어간 컨텍스트 항목은 Context Data에 다시 넣지 않음
+- 같은 값(예: 같은 문서)을 가진 항목은 한 번만 포함
+- 백엔드별 글자/토큰 비율로 토큰 수를 추정하고, 예산(PROMPT_TOKEN_BUDGET)을 넘으면
+  우선순위가 낮은 항목부터 축소 (Markdown 헤더 구조는 유지)
+- 주 입력 문서(required, 예: Plan 생성 시 spec)는 축소하지 않음 → 나머지를 줄여도 넘으면 경고
+- 축소 전/후 토큰 수를 로그로 남김
+"""
+import json
+import math
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from models.markdown_document import parse_document
+from utils.template_registry import PromptTemplate
+
+
+# 백엔드: (ASCII 글자/토큰, 비ASCII 글자/토큰) - 한글은 ASCII보다 토큰 밀도가 높음
+TOKEN_RATIOS = {
+    "gemini": (4.0, 1.5),
+    "goose": (3.5, 1.2),
+}
+DEFAULT_TOKEN_RATIO = (3.5, 1.2)
+
+DEFAULT_PRIORITY = 50
+MIN_SECTION_CHARS = 400  # 축소하더라도 남길 최소 길이
+DEDUP_MIN_CHARS = 200  # 이보다 짧은 값은 중복 제거 대상에서 제외
+
+Layout = Callable[[str, Dict[str, Any]], str]
+
+
+def estimate_tokens(text: str, backend: str = "gemini") -> int:
+    """
+    토큰 수 추정 (토크나이저 없이 글자 종류별 비율 사용)
+
+    Args:
+        text: 프롬프트
+        backend: 백엔드 이름 ("gemini", "goose")
+
+    Returns:
+        추정 토큰 수
+    """
+    ascii_per_token, other_per_token = TOKEN_RATIOS.get(backend, DEFAULT_TOKEN_RATIO)
+    ascii_chars = len(text.encode('ascii', 'ignore'))
+    other_chars = len(text) - ascii_chars
+    return math.ceil(ascii_chars / ascii_per_token + other_chars / other_per_token)
+
+
+def shrink_text(text: str, max_chars: int) -> str:
+    """
+    문서를 max_chars 안팎으로 축소
+
+    Markdown 헤더가 있으면 모든 헤더를 유지하고 각 섹션 앞부분만 남김 (문서 개요 보존),
+    헤더가 없으면 앞부분만 남김
+
+    Args:
+        text: 원문
+        max_chars: 목표 길이
+
+    Returns:
+        축소된 문서 (생략 표시 포함)
+    """
+    if len(text) <= max_chars:
+        return text
+
+    document = parse_document(text)
+    lines = document.lines
+    starts = [heading.line for heading in document.headings]
+    heading_chars = sum(len(lines[index]) + 1 for index in starts)
+
+    if not starts or heading_chars >= max_chars:
+        kept = text[:max_chars]
+    else:
+        boundaries = ([0] if starts[0] != 0 else []) + starts + [len(lines)]
+        blocks = list(zip(boundaries, boundaries[1:]))
+        share = (max_chars - heading_chars) // len(blocks)
+
+        output: List[str] = []
+        for start, end in blocks:
+            body_start = start
+            if start in starts:
+                output.append(lines[start])
+                body_start = start + 1
+
+            used = 0
+            for index in range(body_start, end):
+                line = lines[index]
+                if used + len(line) + 1 > share:
+                    output.append("…")
+                    break
+                output.append(line)
+                used += len(line) + 1
+        kept = "\n".join(output)
+
+    return f"{kept}\n\n… (원문 {len(text)}자 중 {len(text) - len(kept)}자 생략)\n"
+
+
+def json_layout(task: str) -> Layout:
+    """'# Task' + JSON Context Data 레이아웃 (AgentExecutor 형식)"""
+    def layout(body: str, extra: Dict[str, Any]) -> str:
+        return f"""{body}
+
+---
+
+# Task
+{task}
+
+Context Data:
+{json.dumps(extra, indent=2, ensure_ascii=False)}
+"""
+    return layout
+
+
+@dataclass
+class BuiltPrompt:
+    """구성된 프롬프트와 크기 정보"""
+    text: str
+    tokens_before: int  # 중복 제거/축소 전 (컨텍스트를 모두 그대로 넣었을 때)
+    tokens_after: int
+    budget: int
+    deduplicated: List[str] = field(default_factory=list)
+    trimmed: Dict[str, Tuple[int, int]] = field(default_factory=dict)  # key: (원래 글자 수, 축소 후)
+
+    @property
+    def over_budget(self) -> bool:
+        return bool(self.budget) and self.tokens_after > self.budget
+
+
+class PromptBuilder:
+    """백엔드별 토큰 예산을 적용하는 프롬프트 빌더"""
+
+    def __init__(self, backend: str = "gemini", budget_tokens: Optional[int] = None):
+        """
+        Args:
+            backend: 백엔드 이름 (토큰 추정 비율 선택)
+            budget_tokens: 토큰 예산 (기본값: PROMPT_TOKEN_BUDGET_<BACKEND>,
+                PROMPT_TOKEN_BUDGET 또는 32000, 0이면 제한 없음)
+        """
+        self.backend = backend
+        if budget_tokens is None:
+            env_value = (os.getenv(f"PROMPT_TOKEN_BUDGET_{backend.upper().replace('-', '_')}")
+                         or os.getenv("PROMPT_TOKEN_BUDGET", "32000"))
+            budget_tokens = int(env_value)
+        self.budget_tokens = budget_tokens
+
+    def estimate(self, text: str) -> int:
+        """이 백엔드 기준 토큰 수 추정"""
+        return estimate_tokens(text, self.backend)
+
+    def build(self,
+              template: Optional[PromptTemplate],
+              context: Dict[str, Any],
+              layout: Optional[Layout] = None,
+              priorities: Optional[Dict[str, int]] = None,
+              required: Iterable[str] = (),
+              label: str = "prompt") -> BuiltPrompt:
+        """
+        프롬프트 구성
+
+        Args:
+            template: 프롬프트 템플릿 (None이면 본문 없음)
+            context: 컨텍스트 값 (템플릿 placeholder 값 + 추가 컨텍스트)
+            layout: (렌더링된 본문, 템플릿에 없는 컨텍스트) -> 최종 프롬프트
+                (기본값: 본문 + 남은 컨텍스트 JSON)
+            priorities: {key: 우선순위} - 예산 초과 시 낮은 값부터 축소 (기본값: 50)
+            required: 축소하지 않을 주 입력 항목 (예: ('spec',))
+            label: 로그에 표시할 이름
+
+        Returns:
+            BuiltPrompt
+        """
+        layout = layout or _default_layout
+        priorities = priorities or {}
+        required = frozenset(required)
+        placeholders = template.placeholders if template else frozenset()
+
+        def compose(values: Dict[str, Any], extra_keys: List[str]) -> str:
+            body = template.render(values) if template else ""
+            return layout(body, {key: values[key] for key in extra_keys})
+
+        # 중복 제거 전 크기 (템플릿 본문 + 전체 컨텍스트)
+        tokens_before = self.estimate(compose(context, list(context)))
+
+        extra_keys, deduplicated = self._select_extra(context, placeholders)
+        values = dict(context)
+        text = compose(values, extra_keys)
+        tokens_after = self.estimate(text)
+
+        trimmed: Dict[str, Tuple[int, int]] = {}
+        if self.budget_tokens and tokens_after > self.budget_tokens:
+            included = [key for key in context if key in placeholders or key in extra_keys]
+            candidates = sorted(
+                (key for key in included
+                 if key not in required
+                 and isinstance(values[key], str) and len(values[key]) > MIN_SECTION_CHARS),
+                key=lambda key: (priorities.get(key, DEFAULT_PRIORITY), -len(values[key]))
+            )
+            for key in candidates:
+                original = values[key]
+                excess = tokens_after - self.budget_tokens
+                chars_per_token = len(original) / max(self.estimate(original), 1)
+                target = max(MIN_SECTION_CHARS, len(original) - math.ceil(excess * chars_per_token) - 100)
+                shrunk = shrink_text(original, target)
+                if len(shrunk) >= len(original):
+                    continue
+                values[key] = shrunk
+                trimmed[key] = (len(original), len(shrunk))
+
+                text = compose(values, extra_keys)
+                tokens_after = self.estimate(text)
+                if tokens_after <= self.budget_tokens:
+                    break
+
+        built = BuiltPrompt(text, tokens_before, tokens_after, self.budget_tokens, deduplicated, trimmed)
+        self._log(label, built, sorted(required & set(context)))
+        return built
+
+    def _select_extra(self, context: Dict[str, Any],
+                      placeholders) -> Tuple[List[str], List[str]]:
+        """
+        템플릿에 없는 컨텍스트 중 추가로 넣을 항목 선택
+
+        Returns:
+            (추가할 key 목록, 중복이라 제외한 key 목록)
+        """
+        seen = {str(context[key]) for key in context
+                if key in placeholders and len(str(context[key])) >= DEDUP_MIN_CHARS}
+        extra: List[str] = []
+        deduplicated: List[str] = []
+        for key, value in context.items():
+            if key in placeholders:
+                deduplicated.append(key)
+                continue
+            text = str(value)
+            if len(text) >= DEDUP_MIN_CHARS:
+                if text in seen:
+                    deduplicated.append(key)
+                    continue
+                seen.add(text)
+            extra.append(key)
+        return extra, deduplicated
+
+    def _log(self, label: str, built: BuiltPrompt, required: List[str]):
+        """축소 전/후 크기 로그"""
+        from utils.logger import workflow_logger
+
+        message = (f"📏 {label} 프롬프트 ({self.backend}): "
+                   f"{built.tokens_before} → {built.tokens_after} 토큰")
+        if built.trimmed:
+            details = ", ".join(f"{key} {before}→{after}자" for key, (before, after) in built.trimmed.items())
+            message += f" (예산 {built.budget}, 축소: {details})"
+
+        if built.over_budget:
+            kept = f" (축소하지 않은 주 입력: {', '.join(required)})" if required else ""
+            workflow_logger.warning(f"{message} - 축소 후에도 예산 초과{kept}")
+        elif built.trimmed or built.tokens_after < built.tokens_before:
+            workflow_logger.info(message)
+        else:
+            workflow_logger.debug(message)
+
+
+def _default_layout(body: str, extra: Dict[str, Any]) -> str:
+    """본문 + 남은 컨텍스트 (JSON)"""
+    if not extra:
+        return body
+    return f"{body}\n\nContext Data:\n{json.dumps(extra, indent=2, ensure_ascii=False)}\n"
+
+
+_builders: Dict[str, PromptBuilder] = {}
+_builders_lock = threading.Lock()
+
+
+def get_prompt_builder(backend: str = "gemini") -> PromptBuilder:
+    """백엔드별 공용 PromptBuilder 인스턴스"""
+    with _builders_lock:
+        builder = _builders.get(backend)
+        if builder is None:
+            builder = _builders[backend] = PromptBuilder(backend)
+        return builder
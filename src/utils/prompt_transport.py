@@ -0,0 +1,117 @@
+"""
+Prompt Transport
+
+CLI에 프롬프트를 전달하는 방식을 프롬프트 크기로 자동 선택
+- argv: 작은 프롬프트 (PROMPT_ARGV_MAX_BYTES 이하) - 기존 방식 그대로
+- stdin: 큰 프롬프트 - ARG_MAX(E2BIG) 제한이 없고 `ps`에 프롬프트가 노출되지 않음
+- file: 파일 경로로만 프롬프트를 받는 CLI (GooseAgentExecutor의 goose --plan / --instructions)
+  - tmpfs(/dev/shm) 임시 파일, with 블록 종료 시 삭제
+
+사용 예:
+    with get_prompt_transport().prepare(["gemini", "chat"], prompt, prompt_flag="--prompt") as prepared:
+        result = runner.run_sync(prepared.args, backend="gemini", input_text=prepared.input_text)
+"""
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+@dataclass
+class PreparedPrompt:
+    """전달 방식이 정해진 프롬프트"""
+    args: List[str]
+    input_text: Optional[str] = None  # stdin으로 전달할 내용
+    mode: str = "argv"  # "argv" | "stdin" | "file"
+    path: Optional[Path] = None  # file 방식의 임시 파일
+
+    def cleanup(self):
+        """임시 파일 삭제"""
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+            self.path = None
+
+    def __enter__(self) -> 'PreparedPrompt':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.cleanup()
+
+
+class PromptTransport:
+    """프롬프트 전달 방식 선택기"""
+
+    def __init__(self, argv_max_bytes: Optional[int] = None, tmp_dir: Optional[str] = None):
+        """
+        Args:
+            argv_max_bytes: argv로 전달할 최대 프롬프트 크기 (기본값: PROMPT_ARGV_MAX_BYTES 또는 8192,
+                0이면 항상 stdin)
+            tmp_dir: file 방식 임시 파일 디렉토리 (기본값: PROMPT_TMP_DIR, 없으면 /dev/shm 또는 시스템 임시 디렉토리)
+        """
+        if argv_max_bytes is None:
+            argv_max_bytes = int(os.getenv("PROMPT_ARGV_MAX_BYTES", "8192"))
+        self.argv_max_bytes = argv_max_bytes
+        self.tmp_dir = Path(tmp_dir or os.getenv("PROMPT_TMP_DIR") or self._default_tmp_dir())
+        self.stats: Dict[str, int] = {'argv': 0, 'stdin': 0, 'file': 0}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _default_tmp_dir() -> str:
+        """메모리 기반 tmpfs가 있으면 사용 (디스크 쓰기 없음)"""
+        shm = Path("/dev/shm")
+        if shm.is_dir() and os.access(shm, os.W_OK):
+            return str(shm)
+        return tempfile.gettempdir()
+
+    def prepare(self,
+                base_args: List[str],
+                prompt: str,
+                prompt_flag: Optional[str] = None,
+                file_flag: Optional[str] = None) -> PreparedPrompt:
+        """
+        프롬프트 전달 방식 결정
+
+        Args:
+            base_args: 프롬프트를 제외한 명령 (예: ["gemini", "chat", "--model", model])
+            prompt: 프롬프트
+            prompt_flag: argv 전달 시 프롬프트 앞에 붙일 옵션 (예: "--prompt", None이면 위치 인자)
+            file_flag: 파일로만 프롬프트를 받는 CLI의 옵션 (예: "--plan") - 지정 시 항상 file 방식
+
+        Returns:
+            PreparedPrompt (with 문으로 사용하면 임시 파일 자동 삭제)
+        """
+        if file_flag is not None:
+            path = self._write_file(prompt)
+            prepared = PreparedPrompt([*base_args, file_flag, str(path)], mode="file", path=path)
+        elif len(prompt.encode('utf-8')) <= self.argv_max_bytes:
+            prompt_args = [prompt_flag, prompt] if prompt_flag else [prompt]
+            prepared = PreparedPrompt([*base_args, *prompt_args], mode="argv")
+        else:
+            prepared = PreparedPrompt(list(base_args), input_text=prompt, mode="stdin")
+
+        with self._lock:
+            self.stats[prepared.mode] += 1
+        return prepared
+
+    def _write_file(self, prompt: str) -> Path:
+        """프롬프트 임시 파일 생성 (소유자만 읽기 가능)"""
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(prefix="prompt-", suffix=".md", dir=self.tmp_dir)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(prompt)
+        return Path(name)
+
+
+_prompt_transport: Optional[PromptTransport] = None
+_prompt_transport_lock = threading.Lock()
+
+
+def get_prompt_transport() -> PromptTransport:
+    """프로세스 공용 PromptTransport 인스턴스"""
+    global _prompt_transport
+    with _prompt_transport_lock:
+        if _prompt_transport is None:
+            _prompt_transport = PromptTransport()
+        return _prompt_transport
@@ -0,0 +1,226 @@
+"""
+Backend Rate Limiter
+
+백엔드(gemini, goose)별 호출 제한
+- 동시 호출 수 제한 (RATE_LIMIT_<BACKEND>_INFLIGHT)
+- 분당 요청 수 (RATE_LIMIT_<BACKEND>_RPM) / 분당 토큰 수 (RATE_LIMIT_<BACKEND>_TPM) Token Bucket
+- 한도를 넘은 호출은 실패하지 않고 순서대로 대기 (예약 방식이라 먼저 온 호출이 먼저 실행)
+
+실제 백엔드 요청마다(상주 워커 요청, CLI 실행, 재시도 각각) 요청 1개로 계산하며, 응답 캐시 적중은 제외
+CLI 호출은 BackendResilience.run_sync가, 상주 워커 요청은 GeminiWorkerPool.run이 시도마다 예약
+
+사용 예:
+    with get_rate_limiter().limit("gemini", prompt):
+        result = runner.run_sync(args, backend="gemini")
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from utils import cancellation
+from utils.prompt_builder import estimate_tokens
+
+
+# 백엔드: (동시 호출 수, 분당 요청 수, 분당 토큰 수) - 0이면 제한 없음
+DEFAULT_LIMITS = {
+    "gemini": (4, 60, 0),
+    "goose": (2, 30, 0),
+}
+FALLBACK_LIMITS = (4, 0, 0)
+
+WAIT_LOG_SECONDS = 1.0  # 이보다 오래 기다린 호출은 로그
+CANCEL_POLL_SECONDS = 0.2  # 동시 호출 슬롯 대기 중 취소 확인 간격
+
+
+class TokenBucket:
+    """분당 rate만큼 채워지는 Token Bucket (예약 방식, 잔량이 음수가 될 수 있음)"""
+
+    def __init__(self, per_minute: float):
+        """
+        Args:
+            per_minute: 분당 허용량 (= 버킷 크기, 최대 1분치 burst 허용)
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """
+        amount만큼 예약
+
+        Args:
+            amount: 사용할 양 (버킷 크기보다 크면 버킷 크기로 계산)
+
+        Returns:
+            사용 가능해질 때까지 기다려야 하는 시간 (초)
+        """
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            return max(0.0, -self._tokens / self.rate)
+
+    @property
+    def available(self) -> float:
+        """현재 잔량 (음수면 예약 대기 중)"""
+        with self._lock:
+            elapsed = time.monotonic() - self._updated
+            return min(self.capacity, self._tokens + elapsed * self.rate)
+
+
+class BackendLimiter:
+    """단일 백엔드 호출 제한"""
+
+    def __init__(self, backend: str, max_inflight: int = 0, rpm: float = 0, tpm: float = 0):
+        """
+        Args:
+            backend: 백엔드 이름 (토큰 추정 비율 선택)
+            max_inflight: 최대 동시 호출 수 (0이면 제한 없음)
+            rpm: 분당 요청 수 (0이면 제한 없음)
+            tpm: 분당 토큰 수 (0이면 제한 없음)
+        """
+        self.backend = backend
+        self.max_inflight = max_inflight
+        self.requests = TokenBucket(rpm) if rpm else None
+        self.tokens = TokenBucket(tpm) if tpm else None
+        self._slots = threading.BoundedSemaphore(max_inflight) if max_inflight else None
+        self._lock = threading.Lock()
+        self.inflight = 0
+        self.waiting = 0
+        self.stats = {'calls': 0, 'delayed': 0, 'wait_seconds': 0.0, 'max_wait_seconds': 0.0}
+
+    @contextmanager
+    def limit(self, prompt: str = "") -> Iterator[None]:
+        """
+        호출 구간 (한도가 생길 때까지 대기)
+
+        Args:
+            prompt: 전송할 프롬프트 (분당 토큰 수 계산용)
+
+        Raises:
+            concurrent.futures.CancelledError: 대기 중 현재 취소 토큰이 취소된 경우
+        """
+        started = time.monotonic()
+        with self._lock:
+            self.waiting += 1
+
+        try:
+            delay = 0.0
+            if self.requests:
+                delay = self.requests.reserve(1)
+            if self.tokens and prompt:
+                delay = max(delay, self.tokens.reserve(estimate_tokens(prompt, self.backend)))
+            if delay > 0:
+                cancellation.sleep(delay)
+            if self._slots:
+                self._acquire_slot()
+        finally:
+            with self._lock:
+                self.waiting -= 1
+
+        waited = time.monotonic() - started
+        with self._lock:
+            self.inflight += 1
+            self.stats['calls'] += 1
+            self.stats['wait_seconds'] += waited
+            self.stats['max_wait_seconds'] = max(self.stats['max_wait_seconds'], waited)
+            if waited >= WAIT_LOG_SECONDS:
+                self.stats['delayed'] += 1
+        if waited >= WAIT_LOG_SECONDS:
+            print(f"⏳ {self.backend} 호출 {waited:.1f}초 대기 (rate limit)")
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.inflight -= 1
+            if self._slots:
+                self._slots.release()
+
+    def _acquire_slot(self):
+        """동시 호출 슬롯 획득 (취소 토큰이 있으면 주기적으로 취소 확인)"""
+        token = cancellation.current_token()
+        if token is None:
+            self._slots.acquire()
+            return
+        while not self._slots.acquire(timeout=CANCEL_POLL_SECONDS):
+            token.raise_if_cancelled()
+
+    @property
+    def saturated(self) -> bool:
+        """한도 때문에 기다리는 호출이 있거나 동시 호출 수가 가득 찼는지"""
+        with self._lock:
+            return self.waiting > 0 or bool(self.max_inflight and self.inflight >= self.max_inflight)
+
+    def snapshot(self) -> dict:
+        """한도/사용량 (health endpoint용)"""
+        with self._lock:
+            stats = dict(self.stats)
+            inflight, waiting = self.inflight, self.waiting
+        return {
+            'max_inflight': self.max_inflight or None,
+            'rpm': self.requests.capacity if self.requests else None,
+            'tpm': self.tokens.capacity if self.tokens else None,
+            'inflight': inflight,
+            'waiting': waiting,
+            'requests_available': round(self.requests.available, 1) if self.requests else None,
+            'tokens_available': round(self.tokens.available) if self.tokens else None,
+            **stats,
+            'wait_seconds': round(stats['wait_seconds'], 1),
+            'max_wait_seconds': round(stats['max_wait_seconds'], 1),
+        }
+
+
+class RateLimiter:
+    """백엔드별 BackendLimiter 모음"""
+
+    def __init__(self):
+        self._limiters: Dict[str, BackendLimiter] = {}
+        self._lock = threading.Lock()
+
+    def for_backend(self, backend: str) -> BackendLimiter:
+        """
+        백엔드 제한기 (처음 사용할 때 환경변수로 생성)
+
+        RATE_LIMIT_<BACKEND>_INFLIGHT / _RPM / _TPM (없으면 DEFAULT_LIMITS)
+        """
+        with self._lock:
+            limiter = self._limiters.get(backend)
+            if limiter is None:
+                prefix = f"RATE_LIMIT_{backend.upper().replace('-', '_')}"
+                inflight, rpm, tpm = DEFAULT_LIMITS.get(backend, FALLBACK_LIMITS)
+                limiter = self._limiters[backend] = BackendLimiter(
+                    backend,
+                    max_inflight=int(os.getenv(f"{prefix}_INFLIGHT", inflight)),
+                    rpm=float(os.getenv(f"{prefix}_RPM", rpm)),
+                    tpm=float(os.getenv(f"{prefix}_TPM", tpm))
+                )
+            return limiter
+
+    def limit(self, backend: str, prompt: str = ""):
+        """백엔드 호출 구간 (with 문으로 사용)"""
+        return self.for_backend(backend).limit(prompt)
+
+    def snapshot(self) -> dict:
+        """백엔드별 한도/사용량"""
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {backend: limiter.snapshot() for backend, limiter in sorted(limiters.items())}
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """프로세스 공용 RateLimiter 인스턴스"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter()
+        return _rate_limiter
@@ -0,0 +1,353 @@
+"""
+Backend Resilience
+
+CLI 백엔드(gemini, goose) 호출에 재시도 + Circuit Breaker 적용
+- 일시적 실패(네트워크 오류, 429/5xx, 과부하, 시그널 종료)는 지수 백오프 + 지터로 재시도
+  (RETRY_MAX_ATTEMPTS, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+- Timeout은 이미 전체 시간을 기다렸으므로 재시도하지 않음
+- 시도마다 백엔드 rate limit(RPM/TPM, 동시 호출 수)을 새로 예약, 재시도 대기 중에는 슬롯을 반납
+- 일시적 실패/Timeout이 연속 CIRCUIT_FAILURE_THRESHOLD번 발생하면 백엔드 차단(open):
+  CIRCUIT_RESET_SECONDS 동안 호출 없이 즉시 CircuitOpenError → 호출자는 바로 대체 경로 사용
+- 차단 시간이 지나면 호출 하나만 시험(half-open), 성공하면 복구(closed), 실패하면 다시 차단
+
+사용 예 (ProcessRunner.run_sync와 같은 인자):
+    result = get_resilience().run_sync(args, backend="gemini", prompt=prompt, timeout=60, input_text=...)
+
+Gemini 문서 생성/리뷰 호출은 call_gemini() 한 곳에서 응답 캐시 → 상주 워커 → CLI 순서로 처리:
+    output = call_gemini(prompt, model=model, timeout=60, issue_number=issue_number)
+"""
+import os
+import random
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+from utils import cancellation
+from utils.output_stream import get_output_hub
+from utils.process_runner import ProcessResult, get_process_runner
+from utils.prompt_transport import get_prompt_transport
+from utils.rate_limiter import get_rate_limiter
+from utils.response_cache import get_response_cache
+
+
+# 일시적 실패로 보는 stderr 패턴 (대소문자 무시)
+TRANSIENT_PATTERNS = (
+    r"\b429\b", r"\b50[0234]\b", r"rate.?limit", r"quota", r"too many requests",
+    r"overloaded", r"unavailable", r"temporar", r"try again",
+    r"connection (reset|refused|aborted|closed)", r"econn(reset|refused)", r"etimedout",
+    r"network (error|is unreachable|unreachable)", r"enetunreach", r"socket hang up", r"deadline exceeded",
+    r"(connect|connection|request|read|socket|gateway) timed? ?out",
+)
+_TRANSIENT_RE = re.compile("|".join(TRANSIENT_PATTERNS), re.IGNORECASE)
+
+
+class CircuitOpenError(RuntimeError):
+    """백엔드가 차단(open) 상태라 호출하지 않음"""
+
+    def __init__(self, backend: str, retry_in: float):
+        super().__init__(f"{backend} circuit open (retry in {retry_in:.0f}s)")
+        self.backend = backend
+        self.retry_in = retry_in
+
+
+class BackendCallError(RuntimeError):
+    """CLI가 0이 아닌 종료 코드로 끝남 (재시도 후)"""
+
+    def __init__(self, backend: str, returncode: Optional[int], stderr: str):
+        super().__init__(stderr.strip() or f"{backend} exit {returncode}")
+        self.backend = backend
+        self.returncode = returncode
+        self.stderr = stderr
+
+
+def is_transient_message(message: str) -> bool:
+    """오류 메시지가 일시적 실패 패턴(429/5xx, 네트워크 오류 등)에 해당하는지"""
+    return bool(_TRANSIENT_RE.search(message or ""))
+
+
+def is_transient(result: ProcessResult) -> bool:
+    """재시도할 만한 일시적 실패인지 (Timeout 제외)"""
+    if result.ok or result.timed_out:
+        return False
+    if result.returncode is not None and result.returncode < 0:
+        return True  # 시그널로 종료 (OOM kill 등)
+    return is_transient_message(result.stderr)
+
+
+class CircuitBreaker:
+    """백엔드 하나의 closed → open → half-open 상태 관리"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, backend: str, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        """
+        Args:
+            backend: 백엔드 이름
+            failure_threshold: 차단까지의 연속 실패 수
+            reset_timeout: 차단 유지 시간 (초)
+        """
+        self.backend = backend
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        self.stats = {'opened': 0, 'rejected': 0, 'successes': 0, 'failures': 0}
+
+    def before_call(self):
+        """
+        호출 허용 여부 확인
+
+        Raises:
+            CircuitOpenError: 차단 중이거나 half-open 시험 호출이 이미 진행 중인 경우
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self._opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    self.stats['rejected'] += 1
+                    raise CircuitOpenError(self.backend, remaining)
+                self.state = self.HALF_OPEN
+                self._probing = False
+                print(f"🔌 {self.backend} 차단 해제 시험 (half-open)")
+
+            if self.state == self.HALF_OPEN:
+                if self._probing:
+                    self.stats['rejected'] += 1
+                    raise CircuitOpenError(self.backend, 0)
+                self._probing = True
+
+    def record_success(self):
+        """성공 (연속 실패 초기화, half-open이면 복구)"""
+        with self._lock:
+            self.stats['successes'] += 1
+            self.failures = 0
+            if self.state != self.CLOSED:
+                print(f"✅ {self.backend} 복구 (circuit closed)")
+            self.state = self.CLOSED
+            self._probing = False
+
+    def record_failure(self):
+        """일시적 실패/Timeout (임계치 도달 또는 half-open 시험 실패 시 차단)"""
+        with self._lock:
+            self.stats['failures'] += 1
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.stats['opened'] += 1
+                    print(f"🚫 {self.backend} 연속 {self.failures}회 실패 - {self.reset_timeout:.0f}초간 차단")
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    def record_neutral(self):
+        """백엔드 상태와 무관한 결과 (예: 잘못된 입력) - half-open 시험만 종료"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probing = False
+
+    def snapshot(self) -> dict:
+        """상태 (health endpoint용)"""
+        with self._lock:
+            retry_in = None
+            if self.state == self.OPEN:
+                retry_in = round(max(0.0, self._opened_at + self.reset_timeout - time.monotonic()), 1)
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'failure_threshold': self.failure_threshold,
+                'retry_in_seconds': retry_in,
+                **self.stats
+            }
+
+
+class BackendResilience:
+    """백엔드별 Circuit Breaker + 재시도 정책"""
+
+    def __init__(self,
+                 max_attempts: Optional[int] = None,
+                 base_delay: Optional[float] = None,
+                 max_delay: Optional[float] = None,
+                 failure_threshold: Optional[int] = None,
+                 reset_timeout: Optional[float] = None):
+        """
+        Args:
+            max_attempts: 최대 시도 횟수 (기본값: RETRY_MAX_ATTEMPTS 또는 3)
+            base_delay: 첫 재시도 대기 상한 (초, 기본값: RETRY_BASE_DELAY 또는 1)
+            max_delay: 재시도 대기 최대값 (초, 기본값: RETRY_MAX_DELAY 또는 20)
+            failure_threshold: 차단까지의 연속 실패 수 (기본값: CIRCUIT_FAILURE_THRESHOLD 또는 5)
+            reset_timeout: 차단 유지 시간 (초, 기본값: CIRCUIT_RESET_SECONDS 또는 60)
+        """
+        self.max_attempts = max_attempts or int(os.getenv("RETRY_MAX_ATTEMPTS", "3"))
+        self.base_delay = base_delay or float(os.getenv("RETRY_BASE_DELAY", "1"))
+        self.max_delay = max_delay or float(os.getenv("RETRY_MAX_DELAY", "20"))
+        self.failure_threshold = failure_threshold or int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+        self.reset_timeout = reset_timeout or float(os.getenv("CIRCUIT_RESET_SECONDS", "60"))
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self.stats = {'retries': 0}
+
+    def breaker(self, backend: str) -> CircuitBreaker:
+        """백엔드 Circuit Breaker"""
+        with self._lock:
+            breaker = self._breakers.get(backend)
+            if breaker is None:
+                breaker = self._breakers[backend] = CircuitBreaker(
+                    backend, self.failure_threshold, self.reset_timeout
+                )
+            return breaker
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째 재시도 전 대기 시간 (full jitter: 0 ~ base × 2^(attempt-1))"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def run_sync(self, args: List[str], backend: str, prompt: str = "", **kwargs) -> ProcessResult:
+        """
+        재시도 + Circuit Breaker + rate limit을 적용한 ProcessRunner.run_sync
+
+        Args:
+            args: 실행할 명령
+            backend: 백엔드 이름 (Circuit Breaker / rate limit 단위)
+            prompt: 전송할 프롬프트 (분당 토큰 수 계산용, 시도마다 예약)
+            **kwargs: ProcessRunner.run_sync 인자 (timeout, cwd, input_text, ...)
+
+        Returns:
+            마지막 시도의 ProcessResult
+
+        Raises:
+            CircuitOpenError: 백엔드가 차단 중인 경우 (프로세스를 실행하지 않음)
+            FileNotFoundError: 실행 파일이 없는 경우
+        """
+        breaker = self.breaker(backend)
+        attempt = 1
+        while True:
+            breaker.before_call()
+            try:
+                with get_rate_limiter().limit(backend, prompt):
+                    result = get_process_runner().run_sync(args, backend=backend, **kwargs)
+            except BaseException:
+                breaker.record_neutral()
+                raise
+
+            if result.ok:
+                breaker.record_success()
+                return result
+
+            transient = is_transient(result)
+            if transient or result.timed_out:
+                breaker.record_failure()
+            else:
+                breaker.record_neutral()
+
+            if not transient or attempt >= self.max_attempts:
+                return result
+
+            delay = self.backoff(attempt)
+            with self._lock:
+                self.stats['retries'] += 1
+            print(f"🔁 {backend} 일시적 실패 (exit {result.returncode}) - "
+                  f"{delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_attempts})")
+            cancellation.sleep(delay)
+            attempt += 1
+
+    def snapshot(self) -> dict:
+        """백엔드별 Circuit Breaker 상태 (health endpoint용)"""
+        with self._lock:
+            breakers = dict(self._breakers)
+            retries = self.stats['retries']
+        return {
+            'max_attempts': self.max_attempts,
+            'retries': retries,
+            'breakers': {backend: breaker.snapshot() for backend, breaker in sorted(breakers.items())}
+        }
+
+
+_resilience: Optional[BackendResilience] = None
+_resilience_lock = threading.Lock()
+
+
+def get_resilience() -> BackendResilience:
+    """프로세스 공용 BackendResilience 인스턴스"""
+    global _resilience
+    with _resilience_lock:
+        if _resilience is None:
+            _resilience = BackendResilience()
+        return _resilience
+
+
+def call_gemini(prompt: str,
+                model: Optional[str] = None,
+                temperature: Optional[float] = None,
+                timeout: float = 60,
+                use_cache: bool = True,
+                issue_number: Optional[int] = None) -> str:
+    """
+    Gemini 호출 공통 경로: 응답 캐시 → 상주 워커 → 1회성 CLI (재시도/Circuit Breaker/rate limit 적용)
+
+    - 캐시 키: ("gemini", model, temperature, prompt)
+    - 상주 워커가 Timeout이면 같은 Timeout을 CLI로 다시 쓰지 않음
+    - CLI 프롬프트는 크기에 따라 argv/stdin으로 전달
+    - issue_number가 있으면 출력을 Issue 스트림으로 전달
+
+    Args:
+        prompt: 프롬프트
+        model: 모델 이름 (None이면 CLI 기본값)
+        temperature: 샘플링 온도 (CLI에만 적용, 상주 워커 세션에는 적용되지 않음)
+        timeout: Timeout (초)
+        use_cache: 응답 캐시 사용 여부 (False면 항상 새로 생성하고 결과로 캐시 갱신)
+        issue_number: Issue 번호 (출력 스트리밍용)
+
+    Returns:
+        응답 텍스트
+
+    Raises:
+        TimeoutError: 상주 워커 또는 CLI가 timeout 안에 응답하지 않은 경우
+        BackendCallError: CLI가 0이 아닌 종료 코드로 끝난 경우
+        CircuitOpenError: gemini 백엔드가 차단 중인 경우
+        FileNotFoundError: gemini CLI가 없는 경우
+    """
+    # integrations.gemini_worker_pool이 이 모듈을 import하므로 호출 시점에 import
+    from integrations.gemini_worker_pool import get_gemini_pool
+
+    cache = get_response_cache()
+    if use_cache:
+        cached = cache.get("gemini", model, temperature, prompt)
+        if cached is not None:
+            print("♻️ 캐시된 Gemini 응답 사용")
+            return cached
+
+    callbacks = get_output_hub().callbacks(issue_number, "gemini")
+    output = get_gemini_pool().run(prompt, model=model, timeout=timeout, on_stdout=callbacks.get('on_stdout'))
+    if output is not None:
+        print("⚡ 상주 Gemini 워커로 생성")
+        cache.put("gemini", model, temperature, prompt, output)
+        return output
+
+    base_args = ["gemini", "chat"]
+    if model:
+        base_args += ["--model", model]
+    if temperature is not None:
+        base_args += ["--temperature", str(temperature)]
+
+    with get_prompt_transport().prepare(base_args, prompt, prompt_flag="--prompt") as prepared:
+        result = get_resilience().run_sync(
+            prepared.args,
+            backend="gemini",
+            prompt=prompt,
+            timeout=timeout,
+            input_text=prepared.input_text,
+            **callbacks
+        )
+
+    if result.timed_out:
+        raise TimeoutError(f"Gemini 타임아웃 ({timeout:.0f}초 초과)")
+    if result.returncode != 0:
+        raise BackendCallError("gemini", result.returncode, result.stderr)
+
+    output = result.stdout.strip()
+    cache.put("gemini", model, temperature, prompt, output)
+    return output
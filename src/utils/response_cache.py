@@ -0,0 +1,247 @@
+"""
+LLM Response Cache
+
+(backend, model, temperature, prompt) 해시를 키로 하는 디스크 기반 LLM 응답 캐시
+동일한 프롬프트 재요청 시 CLI 프로세스 실행과 네트워크 왕복을 생략
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class ResponseCache:
+    """SQLite 기반 LLM 응답 캐시 (크기 기반 LRU + TTL)"""
+
+    def __init__(self,
+                 db_path: Optional[str] = None,
+                 max_bytes: Optional[int] = None,
+                 ttl_seconds: Optional[int] = None,
+                 enabled: Optional[bool] = None):
+        """
+        Args:
+            db_path: 캐시 DB 경로 (기본값: LLM_CACHE_PATH 또는 data/llm_cache.db)
+            max_bytes: 최대 캐시 크기 (기본값: LLM_CACHE_MAX_BYTES 또는 100MB)
+            ttl_seconds: 항목 유효 시간 (기본값: LLM_CACHE_TTL 또는 24시간)
+            enabled: 캐시 사용 여부 (기본값: LLM_CACHE_ENABLED 또는 true)
+        """
+        self.db_path = Path(db_path or os.getenv("LLM_CACHE_PATH", "data/llm_cache.db"))
+        self.max_bytes = max_bytes or int(os.getenv("LLM_CACHE_MAX_BYTES", str(100 * 1024 * 1024)))
+        self.ttl_seconds = ttl_seconds or int(os.getenv("LLM_CACHE_TTL", "86400"))
+        if enabled is None:
+            enabled = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+        self.enabled = enabled
+
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._evict_lock = threading.Lock()
+
+        if self.enabled:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._init_schema()
+
+    @staticmethod
+    def make_key(backend: str, model: Optional[str], temperature: Optional[float], prompt: str) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            backend: 백엔드 이름 (예: "gemini", "goose")
+            model: 모델 이름
+            temperature: 샘플링 온도
+            prompt: 프롬프트 전문
+
+        Returns:
+            SHA-256 hex digest
+        """
+        digest = hashlib.sha256()
+        for part in (backend, model or "", "" if temperature is None else f"{temperature:g}"):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, backend: str, model: Optional[str], temperature: Optional[float], prompt: str) -> Optional[str]:
+        """
+        캐시 조회
+
+        Returns:
+            캐시된 응답 또는 None (미스/만료/비활성)
+        """
+        if not self.enabled:
+            return None
+
+        key = self.make_key(backend, model, temperature, prompt)
+        now = time.time()
+        conn = self._connect()
+
+        try:
+            row = conn.execute(
+                "SELECT response, created_at FROM responses WHERE cache_key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            response, created_at = row
+            if now - created_at > self.ttl_seconds:
+                with conn:
+                    conn.execute("DELETE FROM responses WHERE cache_key = ?", (key,))
+                self.misses += 1
+                return None
+
+            with conn:
+                conn.execute("UPDATE responses SET last_access = ? WHERE cache_key = ?", (now, key))
+
+            self.hits += 1
+            return response
+
+        except sqlite3.Error as e:
+            print(f"⚠️ LLM 캐시 조회 오류: {e}")
+            return None
+
+    def put(self, backend: str, model: Optional[str], temperature: Optional[float], prompt: str, response: str):
+        """
+        응답 저장 (필요 시 LRU 제거)
+
+        Args:
+            response: 저장할 응답 텍스트
+        """
+        if not self.enabled or not response:
+            return
+
+        key = self.make_key(backend, model, temperature, prompt)
+        size = len(response.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        now = time.time()
+        conn = self._connect()
+
+        try:
+            with conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO responses (cache_key, backend, response, size, created_at, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (key, backend, response, size, now, now)
+                )
+            self._evict(conn)
+
+        except sqlite3.Error as e:
+            print(f"⚠️ LLM 캐시 저장 오류: {e}")
+
+    def invalidate_response(self, response: str) -> int:
+        """
+        응답 내용이 같은 항목 삭제 (리뷰에서 거부된 문서를 같은 프롬프트로 다시 받지 않도록)
+
+        Args:
+            response: 삭제할 응답 텍스트
+
+        Returns:
+            삭제된 항목 수
+        """
+        if not self.enabled or not response:
+            return 0
+
+        conn = self._connect()
+        try:
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM responses WHERE size = ? AND response = ?",
+                    (len(response.encode("utf-8")), response)
+                )
+            return cursor.rowcount
+
+        except sqlite3.Error as e:
+            print(f"⚠️ LLM 캐시 삭제 오류: {e}")
+            return 0
+
+    def clear(self):
+        """전체 캐시 삭제"""
+        if not self.enabled:
+            return
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM responses")
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        entries, total_bytes = 0, 0
+        if self.enabled:
+            entries, total_bytes = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'entries': entries,
+            'bytes': total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 커넥션 반환"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        """테이블 생성"""
+        conn = self._connect()
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    cache_key TEXT PRIMARY KEY,
+                    backend TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)")
+
+    def _evict(self, conn: sqlite3.Connection):
+        """만료 항목 제거 후 최대 크기를 넘으면 오래 사용되지 않은 항목부터 제거"""
+        with self._evict_lock, conn:
+            conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+
+            for key, size in conn.execute(
+                "SELECT cache_key, size FROM responses ORDER BY last_access ASC"
+            ).fetchall():
+                conn.execute("DELETE FROM responses WHERE cache_key = ?", (key,))
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """프로세스 공용 ResponseCache 인스턴스"""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache()
+        return _response_cache
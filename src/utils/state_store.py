@@ -0,0 +1,245 @@
+"""
+Workflow State Store
+
+WorkflowState와 승인 상태를 SQLite(WAL 모드)에 영구 저장하는 저장소
+서버 재시작이나 다중 uvicorn 워커 환경에서도 진행 중인 워크플로우를 복구할 수 있음
+"""
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+from models.issue import GitHubIssue
+from models.workflow_state import WorkflowState
+
+
+class WorkflowStateStore:
+    """SQLite 기반 워크플로우 상태 저장소"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Args:
+            db_path: DB 파일 경로 (기본값: WORKFLOW_DB_PATH 환경변수 또는 data/workflow_state.db)
+        """
+        self.db_path = Path(db_path or os.getenv("WORKFLOW_DB_PATH", "data/workflow_state.db"))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 커넥션 반환"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        """테이블 생성"""
+        conn = self._connect()
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS workflow_states (
+                    issue_number INTEGER PRIMARY KEY,
+                    state_json TEXT NOT NULL,
+                    issue_json TEXT,
+                    completed INTEGER NOT NULL DEFAULT 0,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS approvals (
+                    callback_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS webhook_deliveries (
+                    delivery_id TEXT PRIMARY KEY,
+                    issue_number INTEGER,
+                    job_id TEXT,
+                    received_at TEXT NOT NULL
+                )
+            """)
+
+    def save_state(self, state: WorkflowState, issue: Optional[GitHubIssue] = None):
+        """
+        워크플로우 상태 체크포인트 저장
+
+        Args:
+            state: 워크플로우 상태
+            issue: GitHub Issue (처음 저장 시 전달하면 재시작 시 Spec 재생성에 사용)
+        """
+        conn = self._connect()
+        issue_json = json.dumps(issue.to_dict(), ensure_ascii=False) if issue else None
+
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO workflow_states (issue_number, state_json, issue_json, completed, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(issue_number) DO UPDATE SET
+                    state_json = excluded.state_json,
+                    issue_json = COALESCE(excluded.issue_json, workflow_states.issue_json),
+                    completed = excluded.completed,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    state.issue_number,
+                    json.dumps(state.to_dict(), ensure_ascii=False),
+                    issue_json,
+                    int(state.is_completed),
+                    datetime.now().isoformat()
+                )
+            )
+
+    def load_state(self, issue_number: int) -> Optional[WorkflowState]:
+        """
+        워크플로우 상태 조회
+
+        Args:
+            issue_number: Issue 번호
+
+        Returns:
+            WorkflowState 또는 None
+        """
+        row = self._connect().execute(
+            "SELECT state_json FROM workflow_states WHERE issue_number = ?",
+            (issue_number,)
+        ).fetchone()
+
+        return WorkflowState.from_dict(json.loads(row[0])) if row else None
+
+    def load_issue(self, issue_number: int) -> Optional[GitHubIssue]:
+        """
+        워크플로우 시작 시 저장한 Issue 조회
+
+        Args:
+            issue_number: Issue 번호
+
+        Returns:
+            GitHubIssue 또는 None
+        """
+        row = self._connect().execute(
+            "SELECT issue_json FROM workflow_states WHERE issue_number = ?",
+            (issue_number,)
+        ).fetchone()
+
+        return GitHubIssue.from_dict(json.loads(row[0])) if row and row[0] else None
+
+    def load_unfinished(self) -> List[WorkflowState]:
+        """
+        완료되지 않은 워크플로우 상태 목록
+
+        Returns:
+            WorkflowState 목록 (Issue 번호 순)
+        """
+        rows = self._connect().execute(
+            "SELECT state_json FROM workflow_states WHERE completed = 0 ORDER BY issue_number"
+        ).fetchall()
+
+        return [WorkflowState.from_dict(json.loads(row[0])) for row in rows]
+
+    def set_approval(self, callback_id: str, status: str):
+        """
+        승인 콜백 결과 저장
+
+        Args:
+            callback_id: 콜백 ID
+            status: "approved" 또는 "rejected"
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO approvals (callback_id, status, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(callback_id) DO UPDATE SET
+                    status = excluded.status,
+                    updated_at = excluded.updated_at
+                """,
+                (callback_id, status, datetime.now().isoformat())
+            )
+
+    def get_approval(self, callback_id: str) -> Optional[str]:
+        """
+        승인 콜백 결과 조회
+
+        Args:
+            callback_id: 콜백 ID
+
+        Returns:
+            승인 상태 또는 None
+        """
+        row = self._connect().execute(
+            "SELECT status FROM approvals WHERE callback_id = ?",
+            (callback_id,)
+        ).fetchone()
+
+        return row[0] if row else None
+
+    def claim_delivery(self, delivery_id: str, issue_number: Optional[int] = None,
+                       retention_days: int = 7) -> Optional[dict]:
+        """
+        Webhook 전달 ID 등록 (GitHub 재전송 중복 제거)
+
+        Args:
+            delivery_id: X-GitHub-Delivery 헤더 값
+            issue_number: Issue 번호
+            retention_days: 이보다 오래된 전달 기록은 정리
+
+        Returns:
+            None (처음 받은 전달) 또는 이미 처리한 전달 정보 {"issue_number", "job_id", "received_at"}
+        """
+        conn = self._connect()
+        now = datetime.now()
+        with conn:
+            inserted = conn.execute(
+                "INSERT OR IGNORE INTO webhook_deliveries (delivery_id, issue_number, received_at) "
+                "VALUES (?, ?, ?)",
+                (delivery_id, issue_number, now.isoformat())
+            ).rowcount
+            conn.execute(
+                "DELETE FROM webhook_deliveries WHERE received_at < ?",
+                ((now - timedelta(days=retention_days)).isoformat(),)
+            )
+
+        if inserted:
+            return None
+
+        row = conn.execute(
+            "SELECT issue_number, job_id, received_at FROM webhook_deliveries WHERE delivery_id = ?",
+            (delivery_id,)
+        ).fetchone()
+        return {'issue_number': row[0], 'job_id': row[1], 'received_at': row[2]} if row else {}
+
+    def set_delivery_job(self, delivery_id: str, job_id: Optional[str]):
+        """
+        전달 ID에 처리 작업 연결
+
+        Args:
+            delivery_id: X-GitHub-Delivery 헤더 값
+            job_id: 연결된 작업 ID (없으면 None)
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "UPDATE webhook_deliveries SET job_id = ? WHERE delivery_id = ?",
+                (job_id, delivery_id)
+            )
+
+    def release_delivery(self, delivery_id: str):
+        """
+        전달 ID 등록 취소 (처리하지 못한 전달 - 재전송 시 다시 처리)
+
+        Args:
+            delivery_id: X-GitHub-Delivery 헤더 값
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM webhook_deliveries WHERE delivery_id = ?", (delivery_id,))
@@ -0,0 +1,217 @@
+"""
+Prompt Template Registry
+
+세 종류의 프롬프트 템플릿을 한 곳에서 로드/파싱/컴파일하고 메모리에서 제공
+- command: .gemini/commands/*.toml (Spec-kit 명령, `prompt` 키)
+- prompt: prompts/*.md (Gemini 문서 생성 프롬프트)
+- agent: agents/prompts/*.md (YAML frontmatter + 역할 프롬프트)
+
+파일 mtime이 바뀐 템플릿만 다시 읽고, 렌더링은 미리 분해해 둔 조각을 한 번에 이어 붙임
+"""
+import re
+import threading
+import tomllib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+
+PLACEHOLDER_PATTERN = re.compile(r'\{([A-Za-z_][A-Za-z0-9_]*)\}')
+FAMILY_PATTERNS = {
+    "command": "*.toml",
+    "prompt": "*.md",
+    "agent": "*.md",
+}
+
+
+@dataclass
+class PromptTemplate:
+    """컴파일된 프롬프트 템플릿"""
+    name: str
+    family: str
+    path: Path
+    text: str
+    mtime_ns: int
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    segments: Tuple[str, ...] = ()
+    placeholders: FrozenSet[str] = frozenset()
+
+    def __post_init__(self):
+        # 짝수 인덱스: 리터럴, 홀수 인덱스: placeholder 이름
+        self.segments = tuple(PLACEHOLDER_PATTERN.split(self.text))
+        self.placeholders = frozenset(self.segments[1::2])
+
+    def render(self, values: Optional[Dict[str, Any]] = None, **kwargs) -> str:
+        """
+        placeholder 치환 (단일 패스)
+
+        값이 주어지지 않은 placeholder는 원문 그대로 유지
+
+        Args:
+            values: {placeholder: 값}
+            **kwargs: values와 동일 (키워드 형식)
+
+        Returns:
+            렌더링된 프롬프트
+        """
+        merged = {**(values or {}), **kwargs}
+        parts: List[str] = []
+        for index, segment in enumerate(self.segments):
+            if index % 2 == 0:
+                parts.append(segment)
+            elif segment in merged:
+                parts.append(str(merged[segment]))
+            else:
+                parts.append(f"{{{segment}}}")
+        return "".join(parts)
+
+
+def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
+    """
+    YAML frontmatter 파싱 (yaml 라이브러리 없이 key: value만 지원)
+
+    Args:
+        content: 파일 내용
+
+    Returns:
+        (frontmatter 딕셔너리, 본문)
+    """
+    if not content.startswith('---'):
+        return {}, content
+
+    parts = content.split('---', 2)
+    if len(parts) < 3:
+        return {}, content
+
+    frontmatter = {}
+    for line in parts[1].strip().split('\n'):
+        if ':' in line:
+            key, value = line.split(':', 1)
+            key = key.strip()
+            value = value.strip()
+
+            # 타입 변환
+            if value.lower() == 'true':
+                value = True
+            elif value.lower() == 'false':
+                value = False
+            elif value.replace('.', '').isdigit():
+                value = float(value) if '.' in value else int(value)
+
+            frontmatter[key] = value
+
+    return frontmatter, parts[2].strip()
+
+
+class TemplateRegistry:
+    """프롬프트 템플릿 레지스트리 (파일 경로 단위 캐시)"""
+
+    def __init__(self):
+        self._templates: Dict[Path, PromptTemplate] = {}
+        self._listings: Dict[Tuple[Path, str], Tuple[int, List[Path]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path, family: str) -> Optional[PromptTemplate]:
+        """
+        템플릿 조회 (mtime이 바뀐 경우에만 다시 파싱)
+
+        Args:
+            path: 템플릿 파일 경로
+            family: "command", "prompt", "agent"
+
+        Returns:
+            PromptTemplate 또는 None (파일 없음/파싱 실패)
+        """
+        path = Path(path).resolve()
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            with self._lock:
+                self._templates.pop(path, None)
+            return None
+
+        cached = self._templates.get(path)
+        if cached and cached.mtime_ns == mtime_ns and cached.family == family:
+            return cached
+
+        template = self._load(path, family, mtime_ns)
+        with self._lock:
+            if template:
+                self._templates[path] = template
+            else:
+                self._templates.pop(path, None)
+        return template
+
+    def get_dir(self, directory, family: str) -> Dict[str, PromptTemplate]:
+        """
+        디렉토리의 모든 템플릿 조회 (파일 추가/삭제는 디렉토리 mtime으로 감지)
+
+        Args:
+            directory: 템플릿 디렉토리
+            family: "command", "prompt", "agent"
+
+        Returns:
+            {파일 stem: PromptTemplate}
+        """
+        directory = Path(directory).resolve()
+        if not directory.is_dir():
+            return {}
+
+        key = (directory, family)
+        dir_mtime = directory.stat().st_mtime_ns
+        listing = self._listings.get(key)
+        if listing is None or listing[0] != dir_mtime:
+            files = sorted(directory.glob(FAMILY_PATTERNS[family]))
+            with self._lock:
+                self._listings[key] = (dir_mtime, files)
+        else:
+            files = listing[1]
+
+        templates = {}
+        for path in files:
+            template = self.get(path, family)
+            if template:
+                templates[path.stem] = template
+        return templates
+
+    def _load(self, path: Path, family: str, mtime_ns: int) -> Optional[PromptTemplate]:
+        """파일 읽기 + 파싱"""
+        try:
+            if family == "command":
+                with open(path, "rb") as f:
+                    data = tomllib.load(f)
+                text = data.pop("prompt", None)
+                if text is None:
+                    return None
+                metadata = data
+            elif family == "agent":
+                metadata, text = parse_frontmatter(path.read_text(encoding='utf-8'))
+                metadata.setdefault('name', path.stem.replace('_', ' ').title())
+            else:
+                text = path.read_text(encoding='utf-8')
+                metadata = {}
+
+            return PromptTemplate(
+                name=path.stem,
+                family=family,
+                path=path,
+                text=text,
+                mtime_ns=mtime_ns,
+                metadata=metadata
+            )
+        except Exception as e:
+            print(f"⚠️ 템플릿 파싱 오류 ({path}): {e}")
+            return None
+
+
+_template_registry: Optional[TemplateRegistry] = None
+_template_registry_lock = threading.Lock()
+
+
+def get_template_registry() -> TemplateRegistry:
+    """프로세스 공용 TemplateRegistry 인스턴스"""
+    global _template_registry
+    with _template_registry_lock:
+        if _template_registry is None:
+            _template_registry = TemplateRegistry()
+        return _template_registry
@@ -0,0 +1,258 @@
+"""
+Workspace Manager
+
+Issue별 격리된 작업 디렉토리(git worktree 또는 복사본)를 관리
+여러 Issue의 구현 단계를 같은 트리에 쓰지 않고 동시에 실행할 수 있게 함
+- 파이프라인이 만든 (아직 커밋되지 않은) spec/plan/tasks 문서를 작업 디렉토리에 복사
+- 오래 사용하지 않은 작업 디렉토리는 주기적으로 정리 (start_gc)
+"""
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set
+from utils.process_runner import get_process_runner
+
+
+# 복사 모드에서 제외할 경로
+COPY_IGNORE = shutil.ignore_patterns(
+    '.git', '__pycache__', '*.pyc', '.venv', 'venv', 'node_modules', 'logs', 'data'
+)
+
+
+class WorkspaceManager:
+    """Issue별 작업 디렉토리 관리자"""
+
+    def __init__(self,
+                 root: Optional[str] = None,
+                 source_dir: str = ".",
+                 mode: Optional[str] = None,
+                 max_age_hours: Optional[float] = None,
+                 gc_interval: Optional[float] = None):
+        """
+        Args:
+            root: 작업 디렉토리 루트 (기본값: WORKSPACE_ROOT 또는 workspaces)
+            source_dir: 원본 프로젝트 디렉토리
+            mode: "worktree", "copy" 또는 "auto" (기본값: WORKSPACE_MODE 또는 auto)
+                  auto는 git 저장소이면 worktree, 아니면 copy
+            max_age_hours: gc() 시 삭제할 작업 디렉토리 나이 - 마지막 사용 기준
+                           (기본값: WORKSPACE_MAX_AGE_HOURS 또는 72)
+            gc_interval: start_gc() 실행 간격 (초, 기본값: WORKSPACE_GC_INTERVAL_SECONDS 또는 3600)
+        """
+        self.root = Path(root or os.getenv("WORKSPACE_ROOT", "workspaces")).resolve()
+        self.source_dir = Path(source_dir).resolve()
+        self.max_age_hours = max_age_hours or float(os.getenv("WORKSPACE_MAX_AGE_HOURS", "72"))
+        self.gc_interval = gc_interval or float(os.getenv("WORKSPACE_GC_INTERVAL_SECONDS", "3600"))
+
+        mode = mode or os.getenv("WORKSPACE_MODE", "auto")
+        if mode == "auto":
+            mode = "worktree" if (self.source_dir / ".git").exists() else "copy"
+        self.mode = mode
+
+        self._locks: Dict[int, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._last_used: Dict[int, float] = {}  # Issue 번호 -> 마지막 acquire/release 시각
+        self._active: Set[int] = set()  # 구현 중인 Issue (gc 대상 제외)
+        self._gc_stop = threading.Event()
+        self._gc_thread: Optional[threading.Thread] = None
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, issue_number: int) -> Path:
+        """Issue의 작업 디렉토리 경로"""
+        return self.root / f"issue-{issue_number}"
+
+    def branch_for(self, issue_number: int) -> str:
+        """Issue의 worktree 브랜치 이름"""
+        return f"issue-{issue_number}"
+
+    def acquire(self, issue_number: int, artifacts_dir: Optional[Path] = None) -> Path:
+        """
+        Issue 작업 디렉토리 준비 (이미 있으면 재사용 - 실패 후 재시도 시 이어서 작업)
+
+        worktree는 마지막 커밋(HEAD)에서 만들어지므로 파이프라인이 방금 생성한
+        spec/plan/tasks 문서(artifacts_dir)는 같은 상대 경로로 복사
+
+        Args:
+            issue_number: Issue 번호
+            artifacts_dir: Issue 산출물 디렉토리 (예: specs/001-login)
+
+        Returns:
+            작업 디렉토리 경로
+        """
+        with self._lock_for(issue_number):
+            workspace = self.path_for(issue_number)
+            if not workspace.exists():
+                if self.mode == "worktree":
+                    result = self._git(
+                        "worktree", "add", "-B", self.branch_for(issue_number), str(workspace), "HEAD"
+                    )
+                    if not result.ok:
+                        raise RuntimeError(f"git worktree 생성 실패: {result.stderr.strip()}")
+                else:
+                    shutil.copytree(self.source_dir, workspace, ignore=self._copy_ignore)
+
+                print(f"📁 Issue #{issue_number} 작업 디렉토리 생성 ({self.mode}): {workspace}")
+
+            if artifacts_dir is not None:
+                self._copy_artifacts(Path(artifacts_dir), workspace)
+
+            self._touch(issue_number, active=True)
+            return workspace
+
+    def release(self, issue_number: int, success: bool):
+        """
+        구현 종료 후 작업 디렉토리 정리
+
+        - worktree: 성공 시 변경사항을 issue-<번호> 브랜치에 커밋하고 worktree 제거
+        - copy: 결과물이 디렉토리에만 있으므로 gc()까지 유지
+        - 실패 시: 재시도를 위해 유지
+
+        Args:
+            issue_number: Issue 번호
+            success: 구현 성공 여부
+        """
+        self._touch(issue_number, active=False)
+        if not success or self.mode != "worktree":
+            return
+
+        with self._lock_for(issue_number):
+            workspace = self.path_for(issue_number)
+            if not workspace.exists():
+                return
+
+            self._git("add", "-A", cwd=workspace)
+            commit = self._git(
+                "commit", "--allow-empty", "-m", f"Issue #{issue_number}: Goose 구현 결과", cwd=workspace
+            )
+            if not commit.ok:
+                print(f"⚠️ 작업 디렉토리 커밋 실패 - 유지: {workspace} ({commit.stderr.strip()})")
+                return
+
+            self._remove(workspace)
+            print(f"🧹 Issue #{issue_number} 작업 디렉토리 정리 (브랜치: {self.branch_for(issue_number)})")
+
+    def gc(self) -> int:
+        """
+        max_age_hours보다 오래 사용하지 않은 작업 디렉토리 삭제 (구현 중인 Issue 제외)
+
+        마지막 사용 시각은 acquire/release 기록, 기록이 없으면(서버 재시작 전에 만든 디렉토리)
+        디렉토리 안 파일의 가장 최근 수정 시각 기준
+
+        Returns:
+            삭제한 디렉토리 수
+        """
+        cutoff = time.time() - self.max_age_hours * 3600
+        removed = 0
+
+        for workspace in self.root.glob("issue-*"):
+            if not workspace.is_dir():
+                continue
+            try:
+                issue_number = int(workspace.name.split("-", 1)[1])
+            except ValueError:
+                continue
+
+            with self._lock_for(issue_number):
+                if issue_number in self._active or self._last_used_at(issue_number, workspace) > cutoff:
+                    continue
+                self._remove(workspace)
+                self._last_used.pop(issue_number, None)
+            removed += 1
+
+        if self.mode == "worktree":
+            self._git("worktree", "prune")
+
+        if removed:
+            print(f"🧹 오래된 작업 디렉토리 {removed}개 삭제")
+        return removed
+
+    def start_gc(self):
+        """gc_interval마다 gc()를 실행하는 백그라운드 스레드 시작 (시작 시 1회 즉시 실행)"""
+        if self._gc_thread is not None:
+            return
+        self._gc_stop.clear()
+        self._gc_thread = threading.Thread(target=self._gc_loop, name="workspace-gc", daemon=True)
+        self._gc_thread.start()
+
+    def stop_gc(self):
+        """주기적 gc 중지"""
+        self._gc_stop.set()
+        self._gc_thread = None
+
+    def _gc_loop(self):
+        """주기적 gc 루프"""
+        while True:
+            try:
+                self.gc()
+            except Exception as e:
+                print(f"⚠️ 작업 디렉토리 정리 오류: {e}")
+            if self._gc_stop.wait(self.gc_interval):
+                return
+
+    def _touch(self, issue_number: int, active: bool):
+        """마지막 사용 시각 기록"""
+        with self._locks_guard:
+            self._last_used[issue_number] = time.time()
+            if active:
+                self._active.add(issue_number)
+            else:
+                self._active.discard(issue_number)
+
+    def _last_used_at(self, issue_number: int, workspace: Path) -> float:
+        """마지막 사용 시각 (기록이 없으면 가장 최근에 수정된 파일 기준)"""
+        with self._locks_guard:
+            recorded = self._last_used.get(issue_number)
+        if recorded is not None:
+            return recorded
+
+        latest = workspace.stat().st_mtime
+        for path in workspace.rglob("*"):
+            if ".git" in path.parts:
+                continue
+            try:
+                latest = max(latest, path.stat().st_mtime)
+            except OSError:
+                pass
+        return latest
+
+    def _copy_artifacts(self, artifacts_dir: Path, workspace: Path):
+        """Issue 산출물 디렉토리를 작업 디렉토리의 같은 상대 경로로 복사"""
+        if not artifacts_dir.is_dir():
+            return
+        source = artifacts_dir.resolve()
+        try:
+            relative = source.relative_to(self.source_dir)
+        except ValueError:
+            relative = Path("specs") / source.name
+        shutil.copytree(source, workspace / relative, dirs_exist_ok=True)
+
+    def _remove(self, workspace: Path):
+        """작업 디렉토리 삭제"""
+        if self.mode == "worktree":
+            result = self._git("worktree", "remove", "--force", str(workspace))
+            if result.ok:
+                return
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    def _copy_ignore(self, directory: str, names: list) -> set:
+        """복사 모드 제외 목록 (작업 디렉토리 루트 자신 포함)"""
+        ignored = set(COPY_IGNORE(directory, names))
+        for name in names:
+            if (Path(directory) / name).resolve() == self.root:
+                ignored.add(name)
+        return ignored
+
+    def _git(self, *args: str, cwd: Optional[Path] = None):
+        """git 명령 실행"""
+        return get_process_runner().run_sync(
+            ["git", *args],
+            backend="git",
+            timeout=120,
+            cwd=str(cwd or self.source_dir)
+        )
+
+    def _lock_for(self, issue_number: int) -> threading.Lock:
+        """Issue별 잠금"""
+        with self._locks_guard:
+            return self._locks.setdefault(issue_number, threading.Lock())
@@ -0,0 +1,343 @@
+"""
+Workflow Job Queue
+
+Webhook 요청을 즉시 응답하고 워크플로우는 백그라운드 워커에서 실행하는 인메모리 작업 큐
+(실행 순서는 Issue 라벨 기반 PriorityScheduler가 결정)
+"""
+import os
+import threading
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from workflow.priority_scheduler import PriorityScheduler
+
+
+class QueueFullError(Exception):
+    """대기 작업 수가 상한(WORKFLOW_QUEUE_MAX)에 도달해 새 작업을 받을 수 없음"""
+
+    def __init__(self, pending: int, limit: int, retry_after: int):
+        super().__init__(f"Workflow queue is full ({pending}/{limit})")
+        self.pending = pending
+        self.limit = limit
+        self.retry_after = retry_after  # 다시 시도할 때까지 권장 대기 시간 (초)
+
+
+class JobStatus(Enum):
+    """작업 상태"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass
+class WorkflowJob:
+    """큐에 등록된 워크플로우 작업"""
+
+    job_id: str
+    issue_number: int
+    func: Callable[..., Any]
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    status: JobStatus = JobStatus.QUEUED
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Any = None
+    error: Optional[str] = None
+    coalesced: int = 0  # 이 작업에 합쳐진 중복 요청 수
+    priority_class: Optional[str] = None  # 우선순위 클래스 (None이면 기본 클래스)
+
+    @property
+    def done(self) -> bool:
+        """완료(성공/실패) 여부"""
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환"""
+        return {
+            'job_id': self.job_id,
+            'issue_number': self.issue_number,
+            'status': self.status.value,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'result': self.result if isinstance(self.result, (bool, int, float, str, type(None))) else str(self.result),
+            'error': self.error,
+            'coalesced': self.coalesced,
+            'priority_class': self.priority_class
+        }
+
+
+class WorkflowJobQueue:
+    """워커 풀 기반 인메모리 작업 큐"""
+
+    def __init__(self, num_workers: Optional[int] = None, max_history: int = 1000,
+                 scheduler: Optional[PriorityScheduler] = None, max_pending: Optional[int] = None):
+        """
+        Args:
+            num_workers: 워커 스레드 수 = 최대 동시 워크플로우 수 (기본값: WORKFLOW_WORKERS 환경변수 또는 2)
+            max_history: 보관할 완료 작업 최대 개수
+            scheduler: 우선순위 스케줄러 (기본값: config/priority_classes.json 기반)
+            max_pending: 대기 작업 최대 개수, 초과 시 QueueFullError
+                         (기본값: WORKFLOW_QUEUE_MAX 또는 50, 0이면 제한 없음)
+        """
+        self.num_workers = num_workers or int(os.getenv("WORKFLOW_WORKERS", "2"))
+        self.max_history = max_history
+        if max_pending is None:
+            max_pending = int(os.getenv("WORKFLOW_QUEUE_MAX", "50"))
+        self.max_pending = max_pending
+        self.stats = {'accepted': 0, 'coalesced': 0, 'rejected': 0}
+        self._durations: "deque[float]" = deque(maxlen=50)  # 최근 작업 실행 시간 (Retry-After 추정)
+        self.jobs: Dict[str, WorkflowJob] = {}
+        self.scheduler = scheduler or PriorityScheduler()
+        self._lock = threading.Lock()
+        self._workers: list[threading.Thread] = []
+        self._flights: Dict[str, WorkflowJob] = {}
+        self._debouncing: set[str] = set()  # debounce 중이라 아직 스케줄러에 등록되지 않은 작업 ID
+
+    def start(self):
+        """워커 스레드 시작"""
+        if self._workers:
+            return
+
+        for i in range(self.num_workers):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"workflow-worker-{i + 1}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+        print(f"✅ WorkflowJobQueue 시작 (워커 {self.num_workers}개)")
+
+    def shutdown(self, wait: bool = True):
+        """
+        워커 종료
+
+        Args:
+            wait: 실행 중인 작업 완료 대기 여부
+        """
+        self.scheduler.close()
+
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+        self._workers.clear()
+
+    def classify(self, labels: Iterable[str]) -> str:
+        """Issue 라벨 → 우선순위 클래스 이름"""
+        return self.scheduler.classify(labels)
+
+    def submit(self, issue_number: int, func: Callable[..., Any], *args,
+               priority_class: Optional[str] = None, admit: bool = True, **kwargs) -> WorkflowJob:
+        """
+        작업 등록 (즉시 반환)
+
+        Args:
+            issue_number: Issue 번호
+            func: 워커에서 실행할 함수
+            *args, **kwargs: 함수 인자
+            priority_class: 우선순위 클래스 (None이면 기본 클래스)
+            admit: 대기 작업 상한 검사 여부 (False: 서버 재시작 후 재개처럼 반드시 받아야 하는 작업)
+
+        Returns:
+            등록된 WorkflowJob
+
+        Raises:
+            QueueFullError: 대기 작업 수가 상한에 도달한 경우
+        """
+        job = WorkflowJob(
+            job_id=uuid.uuid4().hex,
+            issue_number=issue_number,
+            func=func,
+            args=args,
+            kwargs=kwargs,
+            priority_class=priority_class
+        )
+
+        with self._lock:
+            if admit:
+                self._admit_locked()
+            self.stats['accepted'] += 1
+            self.jobs[job.job_id] = job
+            self._prune_history()
+
+        self.scheduler.put(job)
+        return job
+
+    def submit_single_flight(self, key: str, issue_number: int, func: Callable[..., Any], *args,
+                             debounce: float = 0, priority_class: Optional[str] = None,
+                             **kwargs) -> Tuple[WorkflowJob, bool]:
+        """
+        같은 key의 작업이 대기/실행 중이면 새 작업 대신 기존 작업에 합침 (single-flight)
+
+        debounce 동안은 실제로 큐에 넣지 않고 기다리며, 그 사이 들어온 요청의 인자로
+        교체 (예: opened → labeled 이벤트가 연달아 오면 마지막 Issue 데이터로 한 번만 실행)
+
+        Args:
+            key: 합칠 단위 (예: "start:42")
+            issue_number: Issue 번호
+            func: 워커에서 실행할 함수
+            *args, **kwargs: 함수 인자
+            debounce: 큐에 넣기 전 대기 시간 (초)
+            priority_class: 우선순위 클래스 (대기 중인 작업에 합쳐질 때 더 높은 클래스일 때만 옮김,
+                            낮은 클래스로는 내리지 않음)
+
+        Returns:
+            (작업, 기존 작업에 합쳐졌는지 여부)
+
+        Raises:
+            QueueFullError: 합칠 작업이 없고 대기 작업 수가 상한에 도달한 경우
+        """
+        with self._lock:
+            job = self._flights.get(key)
+            if job is not None and not job.done:
+                job.coalesced += 1
+                self.stats['coalesced'] += 1
+                if job.status == JobStatus.QUEUED:
+                    job.args, job.kwargs = args, kwargs
+                    if priority_class and self.scheduler.outranks(priority_class, job.priority_class):
+                        # 대기열에 있으면 옮기고, 아직 등록 전(debounce 중)이면 속성만 바꾸면 됨
+                        # (워커가 막 꺼낸 작업은 실행 수가 기존 클래스에 잡혀 있으므로 그대로 둠)
+                        if (self.scheduler.reclassify(job, priority_class)
+                                or job.job_id in self._debouncing):
+                            job.priority_class = priority_class
+                return job, True
+
+            job = WorkflowJob(
+                job_id=uuid.uuid4().hex,
+                issue_number=issue_number,
+                func=func,
+                args=args,
+                kwargs=kwargs,
+                priority_class=priority_class
+            )
+            self._admit_locked()
+            self.stats['accepted'] += 1
+            self.jobs[job.job_id] = job
+            self._flights[key] = job
+            self._prune_history()
+            if debounce > 0:
+                self._debouncing.add(job.job_id)
+
+        if debounce > 0:
+            timer = threading.Timer(debounce, self._enqueue_debounced, args=(job,))
+            timer.daemon = True
+            timer.start()
+        else:
+            self.scheduler.put(job)
+        return job, False
+
+    def get_job(self, job_id: str) -> Optional[WorkflowJob]:
+        """작업 조회"""
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def pending_count(self) -> int:
+        """대기 중인 작업 수 (debounce 중인 작업 포함)"""
+        with self._lock:
+            return self._pending_locked()
+
+    def retry_after(self) -> int:
+        """
+        대기열이 찼을 때 권장 재시도 시간 (초)
+
+        최근 작업 평균 실행 시간 × 대기 작업 수 / 워커 수, 5초 ~ 300초
+        """
+        with self._lock:
+            return self._retry_after_locked(self._pending_locked())
+
+    def snapshot(self) -> dict:
+        """대기열 점유율 + 우선순위 클래스별 상태 (health/metrics endpoint용)"""
+        with self._lock:
+            pending = self._pending_locked()
+            running = sum(1 for job in self.jobs.values() if job.status == JobStatus.RUNNING)
+            durations = list(self._durations)
+            stats = dict(self.stats)
+        return {
+            'workers': self.num_workers,
+            'running': running,
+            'pending': pending,
+            'max_pending': self.max_pending or None,
+            'occupancy': round(pending / self.max_pending, 3) if self.max_pending else None,
+            'avg_job_seconds': round(sum(durations) / len(durations), 1) if durations else None,
+            **stats,
+            **self.scheduler.snapshot()
+        }
+
+    def _pending_locked(self) -> int:
+        """실행 전 작업 수 (lock 보유 상태에서 호출)"""
+        return sum(1 for job in self.jobs.values() if job.status == JobStatus.QUEUED)
+
+    def _retry_after_locked(self, pending: int) -> int:
+        """권장 재시도 시간 (lock 보유 상태에서 호출)"""
+        average = sum(self._durations) / len(self._durations) if self._durations else 60.0
+        return int(min(300, max(5, average * (pending + 1) / self.num_workers)))
+
+    def _admit_locked(self):
+        """대기 작업 상한 검사 (lock 보유 상태에서 호출)"""
+        if not self.max_pending:
+            return
+        pending = self._pending_locked()
+        if pending >= self.max_pending:
+            self.stats['rejected'] += 1
+            raise QueueFullError(pending, self.max_pending, self._retry_after_locked(pending))
+
+    def _worker_loop(self):
+        """워커 메인 루프"""
+        while True:
+            job = self.scheduler.get()
+            if job is None:
+                return
+
+            try:
+                self._run_job(job)
+            finally:
+                self.scheduler.task_done(job)
+
+    def _enqueue_debounced(self, job: WorkflowJob):
+        """debounce가 끝난 작업을 스케줄러에 등록 (Timer 스레드)"""
+        with self._lock:
+            self._debouncing.discard(job.job_id)
+            self.scheduler.put(job)
+
+    def _run_job(self, job: WorkflowJob):
+        """단일 작업 실행"""
+        # submit_single_flight와 같은 lock 안에서 상태를 바꿔야 실행 시작 후 인자/클래스가 바뀌지 않음
+        with self._lock:
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.now()
+            func, args, kwargs = job.func, job.args, job.kwargs
+
+        try:
+            job.result = func(*args, **kwargs)
+            # 워크플로우 함수는 성공 여부(bool)를 반환
+            job.status = JobStatus.FAILED if job.result is False else JobStatus.SUCCEEDED
+        except Exception as e:
+            print(f"❌ 작업 실행 오류 (job {job.job_id}, #{job.issue_number}): {e}")
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+        finally:
+            job.finished_at = datetime.now()
+            with self._lock:
+                self._durations.append((job.finished_at - job.started_at).total_seconds())
+                for key in [key for key, flight in self._flights.items() if flight is job]:
+                    del self._flights[key]
+
+    def _prune_history(self):
+        """오래된 완료 작업 정리 (lock 보유 상태에서 호출)"""
+        if len(self.jobs) <= self.max_history:
+            return
+
+        finished = sorted(
+            (job for job in self.jobs.values() if job.done),
+            key=lambda job: job.finished_at
+        )
+        for job in finished[:len(self.jobs) - self.max_history]:
+            del self.jobs[job.job_id]
@@ -3,27 +3,156 @@ Workflow Orchestrator
 
 전체 워크플로우를 조율하는 오케스트레이터
 """
-from typing import Optional
+from typing import List, Optional
 from pathlib import Path
 from models.issue import GitHubIssue
 from models.workflow_state import WorkflowState, WorkflowStage, ApprovalStatus
 from workflow.stage_executor import StageExecutor
 from integrations.slack_bot import SlackBot
+from utils.state_store import WorkflowStateStore
+from utils.workspace_manager import WorkspaceManager
+from utils.output_stream import get_output_hub
+from utils.response_cache import get_response_cache
+from agents.goose_session_manager import get_goose_session_manager
 
 
 class WorkflowOrchestrator:
     """워크플로우 오케스트레이터"""
     
-    def __init__(self, stage_executor: StageExecutor, slack_bot: SlackBot):
+    def __init__(self, stage_executor: StageExecutor, slack_bot: SlackBot,
+                 state_store: Optional[WorkflowStateStore] = None,
+                 workspace_manager: Optional[WorkspaceManager] = None):
         """
         Args:
             stage_executor: 단계 실행기
             slack_bot: Slack Bot
+            state_store: 상태 저장소 (없으면 메모리에만 유지)
+            workspace_manager: Issue별 작업 디렉토리 관리자 (없으면 현재 디렉토리에서 구현)
         """
         self.stage_executor = stage_executor
         self.slack_bot = slack_bot
+        self.state_store = state_store
+        self.workspace_manager = workspace_manager
         self.workflow_states = {}  # issue_number -> WorkflowState
     
+    def get_state(self, issue_number: int) -> Optional[WorkflowState]:
+        """
+        워크플로우 상태 조회 (메모리 → 저장소 순)
+        
+        Args:
+            issue_number: Issue 번호
+            
+        Returns:
+            WorkflowState 또는 None
+        """
+        state = self.workflow_states.get(issue_number)
+        if state is None and self.state_store:
+            state = self.state_store.load_state(issue_number)
+            if state:
+                self.workflow_states[issue_number] = state
+        return state
+    
+    def _checkpoint(self, state: WorkflowState, issue: Optional[GitHubIssue] = None):
+        """단계 전이 후 상태 저장"""
+        if not self.state_store:
+            return
+        try:
+            self.state_store.save_state(state, issue)
+        except Exception as e:
+            print(f"⚠️ 워크플로우 상태 저장 실패 (#{state.issue_number}): {e}")
+    
+    def _reject(self, state: WorkflowState, reason: str):
+        """
+        단계 거부 + 체크포인트 (거부된 문서는 응답 캐시에서 제거)
+        
+        워크플로우가 승인 대기/실패로 멈추므로 Issue 출력 스트림도 닫음
+        (다시 승인되어 출력이 생기면 자동으로 다시 열림)
+        """
+        state.reject(reason)
+        self._checkpoint(state)
+        self._forget_rejected_document(state)
+        get_output_hub().close(state.issue_number)
+    
+    def _forget_rejected_document(self, state: WorkflowState):
+        """
+        거부된 단계 문서를 응답 캐시에서 제거
+        
+        승인/재실행 경로와 관계없이 같은 프롬프트로 다시 생성할 때 거부된 문서가 캐시에서 반환되지 않도록 함
+        """
+        path = {
+            WorkflowStage.SPEC: state.spec_path,
+            WorkflowStage.PLAN: state.plan_path,
+            WorkflowStage.TASKS: state.tasks_path
+        }.get(state.current_stage)
+        if not path:
+            return
+        try:
+            content = Path(path).read_text(encoding='utf-8')
+        except OSError:
+            return
+        removed = get_response_cache().invalidate_response(content)
+        if removed:
+            print(f"🗑️ 거부된 {state.current_stage.value} 응답 캐시 제거: #{state.issue_number} ({removed}건)")
+    
+    def unfinished_workflows(self) -> List[WorkflowState]:
+        """
+        저장소에서 완료되지 않은 워크플로우를 메모리로 복원
+        
+        Returns:
+            자동으로 이어서 실행해야 하는 워크플로우 목록
+            (사용자 승인 대기 중인 워크플로우는 복원만 하고 제외)
+        """
+        if not self.state_store:
+            return []
+        
+        resumable = []
+        for state in self.state_store.load_unfinished():
+            self.workflow_states[state.issue_number] = state
+            if state.approval_status == ApprovalStatus.REJECTED:
+                print(f"⏸️  승인 대기 워크플로우 복원: #{state.issue_number} ({state.current_stage.value})")
+                continue
+            resumable.append(state)
+        
+        return resumable
+    
+    def resume_workflow(self, issue_number: int, channel: str = "#dev-team") -> bool:
+        """
+        중단된 워크플로우를 마지막으로 완료된 단계 다음부터 재개
+        
+        Args:
+            issue_number: Issue 번호
+            channel: Slack 채널
+            
+        Returns:
+            성공 여부
+        """
+        state = self.get_state(issue_number)
+        if not state:
+            print(f"워크플로우 상태 없음: #{issue_number}")
+            return False
+        
+        print(f"🔁 워크플로우 재개: #{issue_number} ({state.current_stage.value}, {state.approval_status.value})")
+        
+        # 승인까지 끝났지만 다음 단계로 넘어가기 전에 중단된 경우
+        if state.approval_status == ApprovalStatus.APPROVED:
+            return self.approve_and_continue(issue_number, channel)
+        
+        # 현재 단계 재실행 (이전 단계 산출물은 재사용)
+        if state.current_stage == WorkflowStage.SPEC:
+            issue = self.state_store.load_issue(issue_number) if self.state_store else None
+            if not issue:
+                print(f"⚠️ Issue 정보 없음 - Spec 재생성 불가: #{issue_number}")
+                return False
+            return self.start_workflow(issue, channel)
+        elif state.current_stage == WorkflowStage.PLAN:
+            return self._execute_plan_stage(state, channel)
+        elif state.current_stage == WorkflowStage.TASKS:
+            return self._execute_tasks_stage(state, channel)
+        elif state.current_stage == WorkflowStage.IMPLEMENTATION:
+            return self._execute_implementation_stage(state, channel)
+        
+        return False
+    
     def start_workflow(self, issue: GitHubIssue, channel: str = "#dev-team") -> bool:
         """
         워크플로우 시작 (Issue → Spec)
@@ -47,6 +176,11 @@ class WorkflowOrchestrator:
             issue_logger.info(f"작성자: {issue.author}")
             issue_logger.info("=" * 60)
             
+            # 이전 Spec이 거부된 뒤 다시 시작하는 경우 같은 (거부된) 캐시 응답을 쓰지 않음
+            previous = self.get_state(issue.number)
+            regenerate = (previous is not None and previous.current_stage == WorkflowStage.SPEC
+                          and previous.approval_status == ApprovalStatus.REJECTED)
+            
             # 워크플로우 상태 초기화
             issue_logger.debug("워크플로우 상태 초기화...")
             state = WorkflowState(
@@ -54,14 +188,15 @@ class WorkflowOrchestrator:
                 current_stage=WorkflowStage.SPEC
             )
             self.workflow_states[issue.number] = state
+            self._checkpoint(state, issue)
             issue_logger.info(f"현재 단계: {state.current_stage.value}")
             
             # Spec 생성
             issue_logger.info("\n📄 Step 1/4: Spec 생성")
-            spec_path, review_result = self.stage_executor.create_spec(issue)
+            spec_path, review_result = self.stage_executor.create_spec(issue, regenerate=regenerate)
             
             if not spec_path or not review_result:
-                state.reject("Spec 생성 실패")
+                self._reject(state, "Spec 생성 실패")
                 issue_logger.error("❌ Spec 생성 실패 - 워크플로우 중단")
                 return False
             
@@ -88,13 +223,14 @@ class WorkflowOrchestrator:
                 self.approve_and_continue(issue.number, channel)
             else:
                 issue_logger.warning(f"❌ Spec 리뷰 실패 (점수: {review_result.score:.2f})")
-                state.reject(review_result.comments)
+                self._reject(state, review_result.comments)
                 issue_logger.info("⏸️  사용자 승인 대기")
             
             return True
             
         except Exception as e:
             issue_logger.error(f"❌ 워크플로우 오류: {e}", exc_info=True)
+            get_output_hub().close(issue.number)
             return False
     
     def approve_and_continue(self, issue_number: int, channel: str = "#dev-team") -> bool:
@@ -108,7 +244,7 @@ class WorkflowOrchestrator:
         Returns:
             성공 여부
         """
-        state = self.workflow_states.get(issue_number)
+        state = self.get_state(issue_number)
         if not state:
             print(f"워크플로우 상태 없음: #{issue_number}")
             return False
@@ -118,9 +254,17 @@ class WorkflowOrchestrator:
         
         # 다음 단계로 진행
         if not state.advance_to_next_stage():
+            # 구현 단계 실패 후 재승인 → 완료되지 않은 태스크부터 재시도
+            if state.current_stage == WorkflowStage.IMPLEMENTATION and not state.is_completed:
+                print(f"🔁 구현 단계 재시도: #{issue_number}")
+                return self._execute_implementation_stage(state, channel)
+            
+            self._checkpoint(state)
             print(f"마지막 단계 완료: #{issue_number}")
             return True
         
+        self._checkpoint(state)
+        
         # 다음 단계 실행
         if state.current_stage == WorkflowStage.PLAN:
             return self._execute_plan_stage(state, channel)
@@ -142,24 +286,28 @@ class WorkflowOrchestrator:
         Returns:
             성공 여부
         """
-        state = self.workflow_states.get(issue_number)
+        state = self.get_state(issue_number)
         if not state:
             return False
         
-        state.reject(reason)
+        self._reject(state, reason)
+        self.stage_executor.discard_speculation(issue_number)
         print(f"❌ 단계 거부: #{issue_number} - {reason}")
         return True
     
     def _execute_plan_stage(self, state: WorkflowState, channel: str) -> bool:
-        """Plan 단계 실행"""
+        """Plan 단계 실행 (거부된 Plan을 다시 만드는 경우 캐시 우회)"""
         try:
             issue_dir = Path(state.spec_path).parent
             spec_path = Path(state.spec_path)
             
-            plan_path, review_result = self.stage_executor.create_plan(issue_dir, spec_path)
+            plan_path, review_result = self.stage_executor.create_plan(
+                issue_dir, spec_path, issue_number=state.issue_number,
+                regenerate=state.approval_status == ApprovalStatus.REJECTED
+            )
             
             if not plan_path or not review_result:
-                state.reject("Plan 생성 실패")
+                self._reject(state, "Plan 생성 실패")
                 return False
             
             state.plan_path = str(plan_path)
@@ -174,25 +322,28 @@ class WorkflowOrchestrator:
                 print(f"🔄 Tasks 단계 자동 시작 (#{state.issue_number})")
                 self.approve_and_continue(state.issue_number, channel)
             else:
-                state.reject(review_result.comments)
+                self._reject(state, review_result.comments)
             
             return True
             
         except Exception as e:
             print(f"Plan 실행 오류: {e}")
-            state.reject(str(e))
+            self._reject(state, str(e))
             return False
     
     def _execute_tasks_stage(self, state: WorkflowState, channel: str) -> bool:
-        """Tasks 단계 실행"""
+        """Tasks 단계 실행 (거부된 Tasks를 다시 만드는 경우 캐시 우회)"""
         try:
             issue_dir = Path(state.spec_path).parent
             plan_path = Path(state.plan_path)
             
-            tasks_path, review_result = self.stage_executor.create_tasks(issue_dir, plan_path)
+            tasks_path, review_result = self.stage_executor.create_tasks(
+                issue_dir, plan_path, issue_number=state.issue_number,
+                regenerate=state.approval_status == ApprovalStatus.REJECTED
+            )
             
             if not tasks_path or not review_result:
-                state.reject("Tasks 생성 실패")
+                self._reject(state, "Tasks 생성 실패")
                 return False
             
             state.tasks_path = str(tasks_path)
@@ -207,13 +358,13 @@ class WorkflowOrchestrator:
                 print(f"🔄 구현 단계 자동 시작 (#{state.issue_number})")
                 self.approve_and_continue(state.issue_number, channel)
             else:
-                state.reject(review_result.comments)
+                self._reject(state, review_result.comments)
             
             return True
             
         except Exception as e:
             print(f"Tasks 실행 오류: {e}")
-            state.reject(str(e))
+            self._reject(state, str(e))
             return False
     
     def _execute_implementation_stage(self, state: WorkflowState, channel: str) -> bool:
@@ -228,20 +379,36 @@ class WorkflowOrchestrator:
                 message = "⚠️ Goose CLI를 사용할 수 없습니다. 수동 구현이 필요합니다."
                 self.slack_bot.send_message(channel, message)
                 print(f"⚠️ Goose 미사용 - 수동 구현 필요 (#{state.issue_number})")
+                state.implementation_status = 'skipped'
+                self._checkpoint(state)
                 return True
             
             tasks_path = Path(state.tasks_path)
             
-            # Goose로 Tasks 실행
-            print(f"🤖 Goose로 구현 시작 (#{state.issue_number})")
-            result = goose_client.execute_tasks(tasks_path, state.issue_number)
+            # Issue별 격리된 작업 디렉토리에서 구현 (동시에 여러 Issue 구현 가능)
+            # worktree에는 아직 커밋되지 않은 spec/plan/tasks 문서를 복사
+            if self.workspace_manager:
+                goose_client.project_root = self.workspace_manager.acquire(
+                    state.issue_number, artifacts_dir=tasks_path.parent
+                )
+            
+            # Goose로 Tasks 실행 (예외가 나도 작업 디렉토리는 반납)
+            result = {'status': 'failed'}
+            try:
+                print(f"🤖 Goose로 구현 시작 (#{state.issue_number})")
+                result = goose_client.execute_tasks(tasks_path, state.issue_number)
+            finally:
+                if self.workspace_manager:
+                    self.workspace_manager.release(state.issue_number, success=result['status'] == 'success')
             
             # 결과 저장
             state.implementation_status = result['status']
             
             # Slack 알림
             if result['status'] == 'success':
-                message = f"✅ 구현 완료!\n\n완료된 태스크: {result['completed_tasks']}개"
+                message = (f"✅ 구현 완료!\n\n완료된 태스크: {result['completed_tasks']}개\n"
+                           f"소요 시간: {result.get('wall_clock', 0):.1f}s "
+                           f"(임계 경로: {result.get('critical_path_length', 0):.1f}s)")
                 print(f"✅ 구현 완료 (#{state.issue_number})")
             elif result['status'] == 'skipped':
                 message = f"⚠️ Goose 미사용\n\n{result['message']}"
@@ -249,14 +416,20 @@ class WorkflowOrchestrator:
                 message = f"❌ 구현 실패\n\n{result.get('message', '알 수 없는 오류')}"
                 state.reject(result.get('message', '구현 실패'))
             
+            self._checkpoint(state)
+            
             self.slack_bot.send_message(channel, message)
             
             return result['status'] in ['success', 'skipped']
             
         except Exception as e:
             print(f"구현 실행 오류: {e}")
-            state.reject(str(e))
+            self._reject(state, str(e))
             return False
+        finally:
+            # 구현 단계가 끝나면 Issue 출력 스트림 닫기 (링 버퍼는 보존 시간 동안 유지)
+            get_output_hub().close(state.issue_number)
+            get_goose_session_manager().discard_issue(state.issue_number)
     
     def _create_approval_message(self, stage: str, issue: GitHubIssue, 
                                  review_result, file_path: Path) -> str:
@@ -0,0 +1,251 @@
+"""
+Priority Scheduler
+
+WorkflowJobQueue 앞단의 라벨 기반 우선순위 스케줄러
+- Issue 라벨을 설정 파일(config/priority_classes.json)의 우선순위 클래스로 매핑
+- 클래스별 가중치(weight)만큼 워커(=백엔드 동시 실행)를 나눠 사용:
+  점수 = (실행 중 작업 수 + 1) / weight 가 가장 낮은 클래스의 작업을 먼저 실행
+- Aging: 대기 시간이 길어질수록 점수를 낮춰 낮은 우선순위 작업이 굶지 않게 함
+  (aging_seconds 만큼 기다리면 점수 1만큼 앞당겨짐)
+- 큐에서 대기 중인(아직 실행 전) 단계는 나중에 들어온 높은 우선순위 작업에 밀려남 (선점),
+  실행 중인 단계는 중단하지 않음
+
+설정 형식:
+    {
+        "default_class": "normal",          # 어떤 클래스 라벨에도 해당하지 않는 Issue
+        "aging_seconds": 600,
+        "classes": [                        # 위에 있을수록 높은 우선순위 (점수가 같을 때)
+            {"name": "hotfix", "labels": ["hotfix", "P0"], "weight": 8},
+            ...
+        ]
+    }
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass
+class PriorityClass:
+    """우선순위 클래스"""
+    name: str
+    labels: frozenset
+    weight: float = 1.0
+    rank: int = 0  # 설정 파일 순서 (작을수록 높은 우선순위)
+
+    @classmethod
+    def from_dict(cls, data: dict, rank: int) -> 'PriorityClass':
+        """설정 딕셔너리로부터 생성"""
+        weight = float(data.get('weight', 1.0))
+        if weight <= 0:
+            raise ValueError(f"Priority class '{data.get('name')}' must have a positive weight")
+        return cls(
+            name=data['name'],
+            labels=frozenset(label.lower() for label in data.get('labels', ())),
+            weight=weight,
+            rank=rank
+        )
+
+
+class _ClassQueue:
+    """클래스별 대기열 + 통계"""
+
+    def __init__(self, priority_class: PriorityClass, wait_window: int = 100):
+        self.priority_class = priority_class
+        self.pending: Deque[Tuple[float, object]] = deque()  # (등록 시각, 작업)
+        self.running = 0
+        self.dispatched = 0
+        self.preempted = 0  # 나중에 들어온 다른 클래스 작업에 순서를 양보한 횟수
+        self.waits: Deque[float] = deque(maxlen=wait_window)
+
+    def oldest_wait(self, now: float) -> float:
+        return now - self.pending[0][0] if self.pending else 0.0
+
+
+class PriorityScheduler:
+    """가중치 + aging 기반 우선순위 스케줄러 (queue.Queue 대체)"""
+
+    def __init__(self, config_path: Optional[str] = None, aging_seconds: Optional[float] = None):
+        """
+        Args:
+            config_path: 우선순위 설정 파일 (기본값: PRIORITY_CLASSES_PATH 또는 config/priority_classes.json,
+                파일이 없으면 모든 Issue를 하나의 클래스로 처리 = 기존 FIFO)
+            aging_seconds: 점수를 1만큼 앞당기는 대기 시간 (초, 기본값: PRIORITY_AGING_SECONDS 또는 설정 파일 값)
+        """
+        self.config_path = Path(config_path or os.getenv("PRIORITY_CLASSES_PATH", "config/priority_classes.json"))
+        config = self._load_config()
+
+        classes = [PriorityClass.from_dict(data, rank) for rank, data in enumerate(config.get('classes', []))]
+        if not classes:
+            classes = [PriorityClass("normal", frozenset(), 1.0, 0)]
+        self.classes: Dict[str, PriorityClass] = {c.name: c for c in classes}
+        self.default_class = config.get('default_class', classes[-1].name)
+        if self.default_class not in self.classes:
+            raise ValueError(f"Unknown default priority class '{self.default_class}'. Available: {list(self.classes)}")
+
+        self.aging_seconds = aging_seconds or float(
+            os.getenv("PRIORITY_AGING_SECONDS") or config.get('aging_seconds', 600)
+        )
+        self._queues: Dict[str, _ClassQueue] = {name: _ClassQueue(c) for name, c in self.classes.items()}
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def _load_config(self) -> dict:
+        """설정 파일 로드 (없으면 빈 설정)"""
+        if not self.config_path.exists():
+            print(f"⚠️ 우선순위 설정 없음 ({self.config_path}) - 모든 작업을 등록 순서대로 실행")
+            return {}
+        return json.loads(self.config_path.read_text(encoding='utf-8'))
+
+    def classify(self, labels: Iterable[str]) -> str:
+        """
+        Issue 라벨 → 우선순위 클래스
+
+        Args:
+            labels: Issue 라벨 목록
+
+        Returns:
+            가장 높은 우선순위로 매칭된 클래스 이름 (없으면 default_class)
+        """
+        normalized = {label.lower() for label in labels or ()}
+        for priority_class in sorted(self.classes.values(), key=lambda c: c.rank):
+            if priority_class.labels & normalized:
+                return priority_class.name
+        return self.default_class
+
+    def outranks(self, candidate: str, current: Optional[str]) -> bool:
+        """
+        candidate 클래스가 current 클래스보다 높은 우선순위인지 (설정 파일 순서 기준)
+
+        Args:
+            candidate: 비교할 클래스 (알 수 없는 클래스면 False)
+            current: 현재 클래스 (None 또는 알 수 없는 클래스면 default_class)
+        """
+        if candidate not in self.classes:
+            return False
+        current_class = self.classes.get(current) or self.classes[self.default_class]
+        return self.classes[candidate].rank < current_class.rank
+
+    def put(self, job, priority_class: Optional[str] = None):
+        """
+        작업 등록
+
+        Args:
+            job: 작업 (priority_class 속성 사용, 실제 배정된 클래스로 갱신)
+            priority_class: 클래스 (None이면 job.priority_class)
+        """
+        name = priority_class or getattr(job, 'priority_class', None) or self.default_class
+        if name not in self._queues:
+            name = self.default_class
+        job.priority_class = name
+        with self._cond:
+            self._queues[name].pending.append((time.monotonic(), job))
+            self._cond.notify()
+
+    def reclassify(self, job, priority_class: str) -> bool:
+        """
+        대기 중인 작업의 클래스 변경 (예: hotfix 라벨이 나중에 붙은 경우), 대기 시간은 유지
+
+        Returns:
+            대기열에서 찾아 옮겼는지 여부 (이미 실행 중이거나 아직 등록 전이면 False)
+        """
+        if priority_class not in self._queues:
+            return False
+        with self._cond:
+            for name, class_queue in self._queues.items():
+                for index, (enqueued_at, pending) in enumerate(class_queue.pending):
+                    if pending is job:
+                        if name == priority_class:
+                            return True
+                        del class_queue.pending[index]
+                        target = self._queues[priority_class].pending
+                        target.append((enqueued_at, job))
+                        # 등록 순서 유지 (대기 시간이 긴 작업이 앞)
+                        self._queues[priority_class].pending = deque(sorted(target, key=lambda item: item[0]))
+                        return True
+        return False
+
+    def get(self) -> Optional[object]:
+        """
+        다음 실행할 작업 (대기 중인 작업이 없으면 블록)
+
+        Returns:
+            작업 또는 None (close() 호출됨)
+        """
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                selected = self._select_locked(time.monotonic())
+                if selected is not None:
+                    return selected
+                self._cond.wait()
+
+    def task_done(self, job):
+        """작업 완료 (클래스 실행 수 반환)"""
+        name = getattr(job, 'priority_class', self.default_class)
+        with self._cond:
+            class_queue = self._queues.get(name)
+            if class_queue and class_queue.running > 0:
+                class_queue.running -= 1
+            self._cond.notify()
+
+    def close(self):
+        """대기 중인 get() 모두 깨우고 종료 (남은 작업은 실행하지 않음)"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def qsize(self) -> int:
+        """대기 중인 작업 수"""
+        with self._cond:
+            return sum(len(q.pending) for q in self._queues.values())
+
+    def snapshot(self) -> dict:
+        """클래스별 대기열 깊이/대기 시간 (health endpoint용)"""
+        now = time.monotonic()
+        with self._cond:
+            classes = {}
+            for name, class_queue in self._queues.items():
+                waits = list(class_queue.waits)
+                classes[name] = {
+                    'weight': class_queue.priority_class.weight,
+                    'depth': len(class_queue.pending),
+                    'running': class_queue.running,
+                    'dispatched': class_queue.dispatched,
+                    'preempted': class_queue.preempted,
+                    'oldest_wait_seconds': round(class_queue.oldest_wait(now), 1),
+                    'avg_wait_seconds': round(sum(waits) / len(waits), 1) if waits else None,
+                    'max_wait_seconds': round(max(waits), 1) if waits else None,
+                }
+        return {'aging_seconds': self.aging_seconds, 'default_class': self.default_class, 'classes': classes}
+
+    def _score(self, class_queue: _ClassQueue, now: float) -> Tuple[float, int]:
+        """낮을수록 먼저 실행 (가중치 대비 실행 수 - aging 보너스, 동점이면 설정 순서)"""
+        priority_class = class_queue.priority_class
+        share = (class_queue.running + 1) / priority_class.weight
+        return share - class_queue.oldest_wait(now) / self.aging_seconds, priority_class.rank
+
+    def _select_locked(self, now: float) -> Optional[object]:
+        """다음 작업 선택 (_cond 보유 상태에서 호출)"""
+        candidates: List[_ClassQueue] = [q for q in self._queues.values() if q.pending]
+        if not candidates:
+            return None
+
+        chosen = min(candidates, key=lambda q: self._score(q, now))
+        enqueued_at, job = chosen.pending.popleft()
+
+        # 먼저 들어온 다른 클래스 작업을 앞지른 경우 선점으로 기록
+        for other in candidates:
+            if other is not chosen and other.pending and other.pending[0][0] < enqueued_at:
+                other.preempted += 1
+
+        chosen.running += 1
+        chosen.dispatched += 1
+        chosen.waits.append(now - enqueued_at)
+        return job
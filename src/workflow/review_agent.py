@@ -4,8 +4,12 @@ Review Agent Mock
 문서 검토를 수행하는 Mock Review Agent
 실제로는 Gemini CLI를 호출하지만, 여기서는 간단한 검증만 수행
 """
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 from dataclasses import dataclass
+from workflow.rule_engine import Evaluation, evaluate
+
+if TYPE_CHECKING:
+    from agents.llm_review_agent import LLMReviewAgent  # agents.llm_review_agent가 workflow를 import
 
 
 @dataclass
@@ -24,12 +28,14 @@ class ReviewResult:
 class ReviewAgent:
     """Review Agent Mock"""
     
-    def __init__(self, auto_approve: bool = False):
+    def __init__(self, auto_approve: bool = False, spec_reviewer: Optional['LLMReviewAgent'] = None):
         """
         Args:
             auto_approve: 자동 승인 여부 (테스트용)
+            spec_reviewer: Spec 리뷰를 맡길 LLM Review Agent (None이면 규칙 기반 검증)
         """
         self.auto_approve = auto_approve
+        self.spec_reviewer = spec_reviewer
     
     def review_spec(self, content: str, issue_title: str) -> ReviewResult:
         """
@@ -55,42 +61,18 @@ class ReviewAgent:
                 score=1.0
             )
         
+        if self.spec_reviewer:
+            result = self.spec_reviewer.review_spec(content, issue_title)
+            return ReviewResult(approved=result.approved, comments=result.comments, score=result.score)
+        
         # 간단한 검증
         review_logger.debug("  검증 항목 체크 시작...")
         
-        checks = {
-            'has_user_stories': '## User Scenarios' in content or 'User Story' in content,
-            'has_requirements': 'Requirements' in content or 'Functional Requirements' in content,
-            'has_success_criteria': 'Success Criteria' in content,
-            'min_length': len(content) > 500
-        }
-        
-        # 각 항목 체크 로깅
-        review_logger.debug("  [체크 1/4] User Stories 존재 여부...")
-        if checks['has_user_stories']:
-            review_logger.debug("    ✓ User Stories 발견")
-        else:
-            review_logger.warning("    ✗ User Stories 없음")
-        
-        review_logger.debug("  [체크 2/4] Requirements 존재 여부...")
-        if checks['has_requirements']:
-            review_logger.debug("    ✓ Requirements 발견")
-        else:
-            review_logger.warning("    ✗ Requirements 없음")
-        
-        review_logger.debug("  [체크 3/4] Success Criteria 존재 여부...")
-        if checks['has_success_criteria']:
-            review_logger.debug("    ✓ Success Criteria 발견")
-        else:
-            review_logger.warning("    ✗ Success Criteria 없음")
-        
-        review_logger.debug("  [체크 4/4] 최소 길이 (500자) 확인...")
-        if checks['min_length']:
-            review_logger.debug(f"    ✓ 충분한 길이 ({len(content)}자)")
-        else:
-            review_logger.warning(f"    ✗ 너무 짧음 ({len(content)}자)")
+        evaluation = evaluate("spec", content)
+        checks = evaluation.checks
+        self._log_checks(evaluation)
         
-        score = sum(checks.values()) / len(checks)
+        score = evaluation.score
         approved = score >= 0.75
         
         review_logger.info(f"  총점: {score:.2f}/1.0 (기준: 0.75)")
@@ -133,24 +115,13 @@ class ReviewAgent:
                 score=1.0
             )
         
-        # 간단한 검증
+        # 간단한 검증 (LLM 리뷰는 Spec 전용 - Plan은 항상 Plan 규칙으로 검사)
         review_logger.debug("  검증 항목 체크...")
-        checks = {
-            'has_technical_context': 'Technical Context' in content or '기술 스택' in content,
-            'has_implementation_phases': 'Phase' in content or 'Implementation' in content,
-            'has_project_structure': 'Project Structure' in content or '프로젝트 구조' in content,
-            'has_verification': 'Verification' in content or 'Test' in content or '검증' in content,
-            'min_length': len(content) > 800
-        }
-        
-        for i, (key, value) in enumerate(checks.items(), 1):
-            review_logger.debug(f"  [체크 {i}/5] {key}...")
-            if value:
-                review_logger.debug(f"    ✓ 통과")
-            else:
-                review_logger.warning(f"    ✗ 실패")
+        evaluation = evaluate("plan", content)
+        checks = evaluation.checks
+        self._log_checks(evaluation)
         
-        score = sum(checks.values()) / len(checks)
+        score = evaluation.score
         approved = score >= 0.75
         
         review_logger.info(f"  총점: {score:.2f}/1.0")
@@ -185,16 +156,11 @@ class ReviewAgent:
                 score=1.0
             )
         
-        # 간단한 검증
-        checks = {
-            'has_phases': 'Phase' in content,
-            'has_task_ids': '- [ ]' in content or '- [x]' in content,
-            'has_dependencies': 'Dependencies' in content or '의존성' in content,
-            'has_checkpoints': 'Checkpoint' in content or 'checkpoint' in content,
-            'min_length': len(content) > 1000
-        }
-        
-        score = sum(checks.values()) / len(checks)
+        # 간단한 검증 (Tasks 규칙)
+        evaluation = evaluate("tasks", content)
+        checks = evaluation.checks
+        
+        score = evaluation.score
         approved = score >= 0.75
         
         comments = self._generate_comments(checks, "Tasks")
@@ -205,6 +171,18 @@ class ReviewAgent:
             score=score
         )
     
+    def _log_checks(self, evaluation: Evaluation):
+        """규칙별 검사 결과 로깅"""
+        from utils.logger import review_logger
+        
+        total = len(evaluation.results)
+        for i, result in enumerate(evaluation.results, 1):
+            review_logger.debug(f"  [체크 {i}/{total}] {result.rule.description}...")
+            if result.passed:
+                review_logger.debug(f"    ✓ 통과 ({', '.join(result.matched) or f'{evaluation.length}자'})")
+            else:
+                review_logger.warning(f"    ✗ 실패 - {result.rule.issue.format(length=evaluation.length)}")
+    
     def _generate_comments(self, checks: Dict[str, bool], doc_type: str) -> str:
         """
         검증 결과를 기반으로 코멘트 생성
@@ -0,0 +1,158 @@
+"""
+Review Panel
+
+한 단계의 여러 리뷰어(Technical, Regulatory 등)를 동시에 실행하고
+결과를 하나의 ReviewResult로 병합
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from workflow.review_agent import ReviewResult
+
+
+# 리뷰어: 인자 없이 호출하면 ReviewResult를 반환 (결과 없음/건너뜀은 None)
+Reviewer = Callable[[], Optional[ReviewResult]]
+# 병합 전략: {리뷰어 이름: ReviewResult} → 최종 ReviewResult
+MergeStrategy = Callable[[Dict[str, ReviewResult]], ReviewResult]
+
+
+def _merged_comments(results: Dict[str, ReviewResult]) -> str:
+    """리뷰어별 코멘트를 하나로 합침"""
+    if len(results) == 1:
+        return next(iter(results.values())).comments
+
+    sections = []
+    for name, result in results.items():
+        sections.append(f"[{name}] {result.status} (점수: {result.score:.2f})\n{result.comments}")
+    return "\n\n".join(sections)
+
+
+def merge_all_approved(results: Dict[str, ReviewResult]) -> ReviewResult:
+    """
+    기본 병합 전략: 모든 리뷰어가 승인해야 승인, 점수는 평균
+
+    Args:
+        results: 리뷰어별 결과
+
+    Returns:
+        병합된 ReviewResult
+    """
+    return ReviewResult(
+        approved=all(result.approved for result in results.values()),
+        comments=_merged_comments(results),
+        score=sum(result.score for result in results.values()) / len(results)
+    )
+
+
+def weighted_merge(weights: Dict[str, float], threshold: float = 0.75) -> MergeStrategy:
+    """
+    가중 평균 병합 전략 생성
+
+    Args:
+        weights: 리뷰어별 가중치 (없는 리뷰어는 1.0)
+        threshold: 승인 기준 점수
+
+    Returns:
+        MergeStrategy
+    """
+    def merge(results: Dict[str, ReviewResult]) -> ReviewResult:
+        total_weight = sum(weights.get(name, 1.0) for name in results)
+        score = sum(result.score * weights.get(name, 1.0) for name, result in results.items()) / total_weight
+        return ReviewResult(
+            approved=score >= threshold,
+            comments=_merged_comments(results),
+            score=score
+        )
+
+    return merge
+
+
+def review_from_agent_output(agent_result: Dict[str, Any]) -> Optional[ReviewResult]:
+    """
+    Goose Agent 실행 결과(JSON 출력)를 ReviewResult로 변환
+
+    Args:
+        agent_result: GooseAgentExecutor.execute_agent() 결과
+
+    Returns:
+        ReviewResult 또는 None (실행 실패, JSON 아님)
+    """
+    if not agent_result.get('success'):
+        return None
+
+    output = agent_result.get('output', '')
+    if "```json" in output:
+        output = output.split("```json")[1].split("```")[0]
+    elif "```" in output:
+        output = output.split("```")[1].split("```")[0]
+
+    try:
+        data = json.loads(output.strip())
+        score = float(data.get('score', 0.0))
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+    issues = data.get('compliance_issues') or data.get('issues') or []
+    comments = data.get('summary', '')
+    if issues:
+        comments += "\n\n" + "\n".join(f"  ⚠️ {issue}" for issue in issues)
+
+    return ReviewResult(
+        approved=bool(data.get('approved', score >= 0.75)),
+        comments=comments,
+        score=score
+    )
+
+
+class ReviewPanel:
+    """리뷰어 병렬 실행 + 결과 병합"""
+
+    def __init__(self, merge_strategy: MergeStrategy = merge_all_approved, max_workers: int = 4):
+        """
+        Args:
+            merge_strategy: 결과 병합 전략
+            max_workers: 동시에 실행할 최대 리뷰어 수
+        """
+        self.merge_strategy = merge_strategy
+        self.max_workers = max_workers
+
+    def review(self, reviewers: Dict[str, Reviewer],
+               merge_strategy: Optional[MergeStrategy] = None) -> Optional[ReviewResult]:
+        """
+        리뷰어를 동시에 실행하고 결과 병합
+
+        단계 소요 시간은 리뷰어 합계가 아니라 가장 느린 리뷰어 시간이 됨
+
+        Args:
+            reviewers: {리뷰어 이름: 리뷰어}
+            merge_strategy: 이번 호출에만 사용할 병합 전략
+
+        Returns:
+            병합된 ReviewResult (모든 리뷰어가 결과를 내지 못하면 None)
+        """
+        from utils.logger import review_logger
+
+        results: Dict[str, ReviewResult] = {}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(reviewers)) or 1,
+                                thread_name_prefix="reviewer") as pool:
+            futures = {name: pool.submit(reviewer) for name, reviewer in reviewers.items()}
+
+            for name, future in futures.items():
+                try:
+                    result = future.result()
+                except Exception as e:
+                    review_logger.error(f"  ❌ {name} 리뷰 오류: {e}")
+                    continue
+
+                if result is None:
+                    review_logger.info(f"  ⏭️ {name} 리뷰 결과 없음 - 병합에서 제외")
+                    continue
+
+                review_logger.info(f"  {name}: {result.status} (점수: {result.score:.2f})")
+                results[name] = result
+
+        if not results:
+            return None
+
+        return (merge_strategy or self.merge_strategy)(results)
@@ -0,0 +1,267 @@
+"""
+Review Rule Engine
+
+문서 유형(spec/plan/tasks)별 구조 검사 규칙을 설정 파일(config/review_rules.json)에서 읽고
+모든 키워드를 하나의 정규식으로 컴파일하여 문서를 한 번만 스캔해 전체 규칙을 평가
+
+규칙 형식:
+    {
+        "id": "has_requirements",
+        "description": "Requirements 존재 여부",
+        "any": ["Requirements", "FR-"],       # 하나라도 있으면 통과
+        "all": ["..."],                        # 모두 있어야 통과
+        "structure": "requirement_ids",        # 파싱된 문서 구조가 있으면 통과
+                                               # (tasks, phases, requirement_ids, success_criteria_ids)
+        "min_length": 500,                     # 문서 길이 조건
+        "weight": 1.0,
+        "issue": "미통과 시 문제 설명 ({length} 사용 가능)",
+        "suggestion": "미통과 시 개선 제안"
+    }
+"""
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from models.markdown_document import parse_document
+
+
+STRUCTURE_ATTRIBUTES = ('tasks', 'phases', 'requirement_ids', 'success_criteria_ids')
+
+
+@dataclass
+class Rule:
+    """단일 검사 규칙"""
+    id: str
+    description: str = ""
+    any: Tuple[str, ...] = ()
+    all: Tuple[str, ...] = ()
+    structure: Optional[str] = None
+    min_length: Optional[int] = None
+    weight: float = 1.0
+    issue: str = ""
+    suggestion: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Rule':
+        """설정 딕셔너리로부터 생성"""
+        structure = data.get('structure')
+        if structure and structure not in STRUCTURE_ATTRIBUTES:
+            raise ValueError(f"Unknown structure '{structure}' in rule '{data.get('id')}'")
+        return cls(
+            id=data['id'],
+            description=data.get('description', data['id']),
+            any=tuple(data.get('any', ())),
+            all=tuple(data.get('all', ())),
+            structure=structure,
+            min_length=data.get('min_length'),
+            weight=float(data.get('weight', 1.0)),
+            issue=data.get('issue', f"{data['id']} 미통과"),
+            suggestion=data.get('suggestion', "")
+        )
+
+
+@dataclass
+class RuleResult:
+    """규칙 평가 결과"""
+    rule: Rule
+    passed: bool
+    matched: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Evaluation:
+    """문서 하나에 대한 전체 규칙 평가 결과"""
+    doc_type: str
+    length: int
+    results: List[RuleResult]
+
+    @property
+    def score(self) -> float:
+        """가중 통과 비율 (0.0 ~ 1.0)"""
+        total = sum(result.rule.weight for result in self.results)
+        if not total:
+            return 0.0
+        return sum(result.rule.weight for result in self.results if result.passed) / total
+
+    @property
+    def checks(self) -> Dict[str, bool]:
+        """{규칙 ID: 통과 여부}"""
+        return {result.rule.id: result.passed for result in self.results}
+
+    @property
+    def passed(self) -> List[RuleResult]:
+        """통과한 규칙"""
+        return [result for result in self.results if result.passed]
+
+    @property
+    def failed(self) -> List[RuleResult]:
+        """미통과 규칙"""
+        return [result for result in self.results if not result.passed]
+
+    def issues(self) -> List[str]:
+        """미통과 규칙의 문제 설명"""
+        return [result.rule.issue.format(length=self.length) for result in self.failed]
+
+    def suggestions(self) -> List[str]:
+        """미통과 규칙의 개선 제안"""
+        return [result.rule.suggestion for result in self.failed if result.rule.suggestion]
+
+
+class CompiledRuleSet:
+    """문서 유형 하나의 규칙 + 컴파일된 키워드 정규식"""
+
+    def __init__(self, doc_type: str, rules: List[Rule]):
+        self.doc_type = doc_type
+        self.rules = rules
+
+        keywords = sorted({kw for rule in rules for kw in (*rule.any, *rule.all)}, key=len, reverse=True)
+        # 같은 위치에서 시작하는 키워드는 서로 접두사 관계이므로
+        # 가장 긴 키워드만 찾고 나머지는 접두사 테이블로 보충
+        self._prefixes: Dict[str, FrozenSet[str]] = {
+            keyword: frozenset(other for other in keywords if keyword.startswith(other))
+            for keyword in keywords
+        }
+        self.pattern = (
+            re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in keywords) + "))")
+            if keywords else None
+        )
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """문서를 한 번 스캔하여 등장한 키워드 집합 반환"""
+        if self.pattern is None:
+            return frozenset()
+        found = set()
+        for match in self.pattern.finditer(text):
+            keyword = match.group(1)
+            if keyword not in found:
+                found.update(self._prefixes[keyword])
+        return frozenset(found)
+
+    def evaluate(self, text: str) -> Evaluation:
+        """전체 규칙 평가"""
+        found = self.scan(text)
+        document = None
+        results = []
+
+        for rule in self.rules:
+            matched = [keyword for keyword in (*rule.any, *rule.all) if keyword in found]
+            conditions = []
+            if rule.any or rule.structure:
+                any_hit = any(keyword in found for keyword in rule.any)
+                if not any_hit and rule.structure:
+                    document = document or parse_document(text)
+                    any_hit = bool(getattr(document, rule.structure))
+                    if any_hit:
+                        matched.append(f"<{rule.structure}>")
+                conditions.append(any_hit)
+            if rule.all:
+                conditions.append(all(keyword in found for keyword in rule.all))
+            if rule.min_length is not None:
+                conditions.append(len(text) > rule.min_length)
+
+            results.append(RuleResult(rule, bool(conditions) and all(conditions), matched))
+
+        return Evaluation(self.doc_type, len(text), results)
+
+
+class RuleEngine:
+    """문서 리뷰 규칙 엔진"""
+
+    def __init__(self, config_path: Optional[str] = None, cache_size: int = 128):
+        """
+        Args:
+            config_path: 규칙 설정 파일 (기본값: REVIEW_RULES_PATH 또는 config/review_rules.json)
+            cache_size: 평가 결과 캐시 크기 (같은 문서 버전은 다시 스캔하지 않음)
+        """
+        self.config_path = Path(config_path or os.getenv("REVIEW_RULES_PATH", "config/review_rules.json"))
+        self.cache_size = cache_size
+        self._rule_sets: Dict[str, CompiledRuleSet] = {}
+        self._config_mtime: Optional[int] = None
+        self._cache: 'OrderedDict[Tuple[str, str], Evaluation]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def doc_types(self) -> List[str]:
+        """규칙이 정의된 문서 유형"""
+        self._reload_if_changed()
+        return list(self._rule_sets)
+
+    def evaluate(self, doc_type: str, content: str) -> Evaluation:
+        """
+        문서 평가
+
+        Args:
+            doc_type: 문서 유형 ("spec", "plan", "tasks")
+            content: 문서 내용
+
+        Returns:
+            Evaluation (규칙별 통과 여부, 매칭 키워드, 점수)
+
+        Raises:
+            ValueError: 규칙이 없는 문서 유형
+        """
+        self._reload_if_changed()
+
+        rule_set = self._rule_sets.get(doc_type)
+        if rule_set is None:
+            raise ValueError(f"Unknown document type '{doc_type}'. Available: {list(self._rule_sets)}")
+
+        key = (doc_type, content)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        evaluation = rule_set.evaluate(content)
+
+        with self._lock:
+            self._cache[key] = evaluation
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return evaluation
+
+    def _reload_if_changed(self):
+        """설정 파일이 바뀌었으면 다시 컴파일"""
+        try:
+            mtime = self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            if self._config_mtime is None:
+                raise FileNotFoundError(f"Review rules not found: {self.config_path}")
+            return
+
+        if mtime == self._config_mtime:
+            return
+
+        with self._lock:
+            if mtime == self._config_mtime:
+                return
+            config = json.loads(self.config_path.read_text(encoding='utf-8'))
+            self._rule_sets = {
+                doc_type: CompiledRuleSet(doc_type, [Rule.from_dict(rule) for rule in spec['rules']])
+                for doc_type, spec in config.items()
+            }
+            self._cache.clear()
+            self._config_mtime = mtime
+
+
+_rule_engine: Optional[RuleEngine] = None
+_rule_engine_lock = threading.Lock()
+
+
+def get_rule_engine() -> RuleEngine:
+    """프로세스 공용 RuleEngine 인스턴스"""
+    global _rule_engine
+    with _rule_engine_lock:
+        if _rule_engine is None:
+            _rule_engine = RuleEngine()
+        return _rule_engine
+
+
+def evaluate(doc_type: str, content: str) -> Evaluation:
+    """공용 RuleEngine으로 문서 평가"""
+    return get_rule_engine().evaluate(doc_type, content)
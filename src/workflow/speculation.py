@@ -0,0 +1,272 @@
+"""
+Speculative Stage Generation
+
+리뷰/승인 대기 중에 다음 단계 문서(Plan, Tasks)를 미리 생성
+- 승인 시: 입력 문서가 그대로면 미리 생성한 결과를 즉시 사용
+- 거부 또는 입력 문서 수정 시: 결과 폐기 (실행 중이면 취소 토큰으로 프로세스 종료)
+- 전용 스레드 풀(SPECULATIVE_WORKERS)에서만 실행하고 빈 워커가 없으면 시작하지 않음
+- 백엔드 rate limit에 대기 중인 호출이 있거나 동시 실행 슬롯이 가득 차 있으면 시작하지 않음
+  → 실제 워크플로우 작업과 같은 한도(rate limit, 프로세스 슬롯, 상주 워커)를 두고 경쟁하지 않음
+- 실행 중에도 실제 작업이 같은 백엔드를 기다리기 시작하면 사전 생성을 중단하고 자리를 양보
+"""
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from utils.cancellation import CancelToken, cancel_scope
+from utils.process_runner import get_process_runner
+from utils.rate_limiter import get_rate_limiter
+
+# 실행 중인 사전 생성이 실제 작업에 양보해야 하는지 확인하는 주기 (초)
+PREEMPT_POLL_SECONDS = 0.5
+
+
+def _fingerprint(source: str) -> str:
+    """입력 문서 지문"""
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class Speculation:
+    """진행 중이거나 완료된 사전 생성 작업"""
+    issue_number: int
+    stage: str
+    fingerprint: str
+    future: Future
+    started_at: float
+    token: CancelToken
+
+
+class SpeculativeExecutor:
+    """다음 단계 사전 생성기 (opt-in)"""
+
+    def __init__(self, enabled: Optional[bool] = None, max_workers: Optional[int] = None,
+                 backends: Iterable[str] = ("gemini", "goose")):
+        """
+        Args:
+            enabled: 사용 여부 (기본값: SPECULATIVE_ENABLED 환경변수, 기본 false)
+            max_workers: 동시에 실행할 최대 사전 생성 수 (기본값: SPECULATIVE_WORKERS 또는 1)
+            backends: 사전 생성이 사용하는 백엔드 (하나라도 바쁘면 시작하지 않음)
+        """
+        if enabled is None:
+            enabled = os.getenv("SPECULATIVE_ENABLED", "false").lower() == "true"
+        self.enabled = enabled
+        self.max_workers = max_workers or int(os.getenv("SPECULATIVE_WORKERS", "1"))
+        self.backends = tuple(backends)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._entries: Dict[Tuple[int, str], Speculation] = {}
+        self._running = 0
+        self._monitor: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.stats = {'started': 0, 'skipped_busy': 0, 'skipped_contended': 0, 'hits': 0, 'misses': 0,
+                      'discarded': 0, 'preempted': 0}
+
+    def start(self, issue_number: int, stage: str, source: str,
+              generate: Callable[[], Optional[str]]) -> bool:
+        """
+        다음 단계 사전 생성 시작
+
+        Args:
+            issue_number: Issue 번호
+            stage: 사전 생성할 단계 (예: "plan", "tasks")
+            source: 생성 입력 문서 내용 (승인 시 변경 여부 확인용)
+            generate: 문서 내용을 반환하는 생성 함수 (파일을 쓰지 않아야 함)
+
+        Returns:
+            시작(또는 동일 입력으로 이미 진행 중) 여부
+        """
+        if not self.enabled:
+            return False
+
+        key = (issue_number, stage)
+        fingerprint = _fingerprint(source)
+
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing and existing.fingerprint == fingerprint:
+                return True
+            if existing:
+                self._discard_locked(key)
+
+            if self._running >= self.max_workers:
+                self.stats['skipped_busy'] += 1
+                return False
+
+            contended = self._contended_backend()
+            if contended:
+                self.stats['skipped_contended'] += 1
+                print(f"⏭️ {contended} 사용량이 많아 {stage} 사전 생성 생략 (#{issue_number})")
+                return False
+
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="speculative")
+            self._running += 1
+            token = CancelToken()
+            future = self._pool.submit(self._run, generate, token)
+            self._entries[key] = Speculation(issue_number, stage, fingerprint, future, time.time(), token)
+            self.stats['started'] += 1
+            if self._monitor is None:
+                self._monitor = threading.Thread(target=self._watch_contention,
+                                                 name="speculative-preempt", daemon=True)
+                self._monitor.start()
+
+        print(f"🔮 {stage} 사전 생성 시작 (#{issue_number})")
+        return True
+
+    def take(self, issue_number: int, stage: str, source: str) -> Optional[str]:
+        """
+        사전 생성 결과 가져오기 (진행 중이면 완료까지 대기)
+
+        Args:
+            issue_number: Issue 번호
+            stage: 단계
+            source: 현재 입력 문서 내용
+
+        Returns:
+            생성된 내용 또는 None (사전 생성 없음, 입력 변경, 실패)
+        """
+        with self._lock:
+            speculation = self._entries.pop((issue_number, stage), None)
+
+        if speculation is None:
+            return None
+
+        if speculation.fingerprint != _fingerprint(source):
+            print(f"🗑️ 입력 문서가 변경되어 {stage} 사전 생성 결과 폐기 (#{issue_number})")
+            with self._lock:
+                self._cancel_locked(speculation)
+                self.stats['misses'] += 1
+            return None
+
+        try:
+            content = speculation.future.result()
+        except (Exception, CancelledError) as e:
+            print(f"⚠️ {stage} 사전 생성 실패 (#{issue_number}): {e}")
+            content = None
+
+        with self._lock:
+            self.stats['hits' if content else 'misses'] += 1
+        if content:
+            print(f"⚡ {stage} 사전 생성 결과 사용 (#{issue_number}, "
+                  f"{time.time() - speculation.started_at:.1f}s 전 시작)")
+        return content
+
+    def discard(self, issue_number: int, stage: Optional[str] = None):
+        """
+        사전 생성 결과 폐기 (거부 시)
+
+        Args:
+            issue_number: Issue 번호
+            stage: 단계 (None이면 해당 Issue 전체)
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] == issue_number and (stage is None or key[1] == stage):
+                    self._discard_locked(key)
+
+    def snapshot(self) -> dict:
+        """사전 생성 상태 (health endpoint용)"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'max_workers': self.max_workers,
+                'running': self._running,
+                'pending': [f"#{n}:{stage}" for n, stage in self._entries],
+                **self.stats
+            }
+
+    def shutdown(self):
+        """스레드 풀 종료 (실행 중인 생성은 기다리지 않음)"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._monitor = None
+            for speculation in self._entries.values():
+                speculation.token.cancel()
+            self._entries.clear()
+        if pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _contended_backend(self) -> Optional[str]:
+        """실제 작업이 한도를 기다리고 있거나 슬롯이 가득 찬 백엔드 (없으면 None)"""
+        limiter = get_rate_limiter()
+        runner = get_process_runner().snapshot()['backends']
+        for backend in self.backends:
+            if limiter.for_backend(backend).saturated:
+                return backend
+            usage = runner.get(backend)
+            if usage and (usage['waiting'] or usage['active'] >= usage['limit']):
+                return backend
+        return None
+
+    def _waiting_backend(self) -> Optional[str]:
+        """
+        호출이 한도/슬롯을 기다리고 있는 백엔드 (없으면 None)
+
+        실행 중인 사전 생성이 슬롯을 차지하고 있을 수 있으므로 가득 찬 것만으로는 판단하지 않음
+        """
+        limiter = get_rate_limiter()
+        runner = get_process_runner().snapshot()['backends']
+        for backend in self.backends:
+            if limiter.for_backend(backend).waiting:
+                return backend
+            usage = runner.get(backend)
+            if usage and usage['waiting']:
+                return backend
+        return None
+
+    def _watch_contention(self):
+        """
+        실행 중인 사전 생성 감시 (전용 스레드)
+
+        실제 작업이 같은 백엔드를 기다리면 실행 중인 사전 생성을 취소해 자리를 양보하고,
+        실행 중인 사전 생성이 없으면 종료
+        """
+        while True:
+            time.sleep(PREEMPT_POLL_SECONDS)
+            with self._lock:
+                if self._monitor is not threading.current_thread():
+                    return
+                running = [key for key, speculation in self._entries.items()
+                           if not speculation.future.done()]
+                if not running:
+                    self._monitor = None
+                    return
+
+                backend = self._waiting_backend()
+                if not backend:
+                    continue
+                for key in running:
+                    self._cancel_locked(self._entries.pop(key))
+                self.stats['preempted'] += len(running)
+
+            print(f"⏸️ 실제 작업이 {backend}를 기다려 사전 생성 {len(running)}건 중단 "
+                  f"({', '.join(f'#{n}:{stage}' for n, stage in running)})")
+
+    def _run(self, generate: Callable[[], Optional[str]], token: CancelToken) -> Optional[str]:
+        """사전 생성 실행 (전용 워커 스레드, 폐기되면 token으로 중단)"""
+        try:
+            with cancel_scope(token):
+                return generate()
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _discard_locked(self, key: Tuple[int, str]):
+        """결과 폐기 (_lock 보유 상태에서 호출)"""
+        self._cancel_locked(self._entries.pop(key))
+        self.stats['discarded'] += 1
+
+    def _cancel_locked(self, speculation: Speculation):
+        """
+        사전 생성 취소 (_lock 보유 상태에서 호출)
+
+        시작 전이면 실행하지 않고, 실행 중이면 취소 토큰으로 프로세스/대기 중단
+        """
+        speculation.token.cancel()
+        if speculation.future.cancel():
+            # 시작 전에 취소되면 _run이 호출되지 않으므로 여기서 워커 슬롯 반환
+            self._running -= 1
@@ -8,31 +8,41 @@ from typing import Optional
 from models.issue import GitHubIssue
 from utils.file_manager import FileManager
 from workflow.review_agent import ReviewAgent, ReviewResult
+from workflow.review_panel import ReviewPanel, review_from_agent_output
+from workflow.speculation import SpeculativeExecutor
 
 
 class StageExecutor:
     """워크플로우 단계 실행기"""
     
     def __init__(self, file_manager: FileManager, review_agent: ReviewAgent, 
-                 spec_kit_client=None, goose_executor=None):
+                 spec_kit_client=None, goose_executor=None,
+                 review_panel: Optional[ReviewPanel] = None,
+                 speculator: Optional[SpeculativeExecutor] = None):
         """
         Args:
             file_manager: 파일 관리자
             review_agent: Review Agent
             spec_kit_client: Spec-kit Client (문서 생성용)
             goose_executor: Goose Agent Executor (Agent 실행용)
+            review_panel: 리뷰어 병렬 실행/병합기 (기본: 전원 승인 시 승인)
+            speculator: 리뷰/승인 대기 중 다음 단계 사전 생성기 (기본: SPECULATIVE_ENABLED 설정)
         """
         self.file_manager = file_manager
         self.review_agent = review_agent
         self.spec_kit_client = spec_kit_client
         self.goose_executor = goose_executor
+        self.review_panel = review_panel or ReviewPanel()
+        self.speculator = speculator or SpeculativeExecutor()
     
-    def create_spec(self, issue: GitHubIssue) -> tuple[Optional[Path], Optional[ReviewResult]]:
+    def create_spec(self, issue: GitHubIssue,
+                    regenerate: bool = False) -> tuple[Optional[Path], Optional[ReviewResult]]:
         """
         Spec 생성
         
         Args:
             issue: GitHub Issue
+            regenerate: 이전 결과가 거부된 뒤 다시 생성하는 경우 (응답 캐시를 쓰지 않음)
             
         Returns:
             (spec 파일 경로, 리뷰 결과) 또는 (None, None)
@@ -54,7 +64,7 @@ class StageExecutor:
             spec_content = None
             if self.spec_kit_client:
                 workflow_logger.info("  🤖 Spec-kit으로 Spec 생성 중...")
-                spec_content = self.spec_kit_client.generate_spec(issue)
+                spec_content = self.spec_kit_client.generate_spec(issue, use_cache=not regenerate)
                 if spec_content:
                     workflow_logger.info("  ✅ Spec-kit으로 생성 완료")
                 else:
@@ -78,26 +88,26 @@ class StageExecutor:
             spec_path = self.file_manager.create_spec_file(issue_dir, spec_content)
             workflow_logger.info(f"  💾 Spec 파일: {spec_path}")
             
-            # Review Agent (Technical) 리뷰
-            workflow_logger.info("  🔍 Review Agent (Technical) 검토 시작...")
-            review_result = self.review_agent.review_spec(spec_content, issue.title)
+            # 리뷰/승인 대기 동안 Plan 사전 생성 (opt-in)
+            self.speculator.start(
+                issue.number, "plan", spec_content,
+                lambda: self.generate_plan_content(spec_content, issue.number)
+            )
             
-            # RA Agent (Regulatory) 리뷰 - Goose Executor 사용
+            # Review Agent (Technical) + RA Agent (Regulatory) 동시 리뷰
+            reviewers = {
+                "Review Agent": lambda: self.review_agent.review_spec(spec_content, issue.title)
+            }
             if self.goose_executor:
-                workflow_logger.info("  ⚖️ RA Agent (Regulatory) 검토 시작...")
-                ra_result = self.goose_executor.execute_agent(
-                    agent_name="RA Agent",
-                    task="Spec 문서를 규제(FDA/ISO) 관점에서 검토하세요.",
-                    context={
-                        "document_type": "spec",
-                        "content": spec_content,
-                        "issue_title": issue.title
-                    },
-                    issue_number=issue.number
+                reviewers["RA Agent"] = lambda: self._regulatory_review(
+                    spec_content, issue.title, issue.number
                 )
-                # RA 리뷰 결과 로그 (실제 반영은 추후)
-                workflow_logger.info(f"  RA Agent 결과: {ra_result.get('success')}")
-
+            
+            workflow_logger.info(f"  🔍 리뷰 시작 (동시 실행): {', '.join(reviewers)}")
+            review_result = self.review_panel.review(reviewers)
+            if not review_result:
+                return None, None
+            
             workflow_logger.info(f"  {'✅' if review_result.approved else '❌'} 검토 완료: {review_result.status}")
             
             return spec_path, review_result
@@ -106,38 +116,48 @@ class StageExecutor:
             workflow_logger.error(f"  ❌ Spec 생성 오류: {e}", exc_info=True)
             return None, None
     
-    def create_plan(self, issue_dir: Path, spec_path: Path) -> tuple[Optional[Path], Optional[ReviewResult]]:
+    def create_plan(self, issue_dir: Path, spec_path: Path, issue_number: Optional[int] = None,
+                    regenerate: bool = False) -> tuple[Optional[Path], Optional[ReviewResult]]:
         """
         Plan 생성
         
         Args:
             issue_dir: Issue 디렉토리
             spec_path: Spec 파일 경로
+            issue_number: Issue 번호 (출력 스트리밍용)
+            regenerate: 이전 Plan이 거부된 뒤 다시 생성하는 경우 (사전 생성 결과/응답 캐시를 쓰지 않음)
             
         Returns:
             (plan 파일 경로, 리뷰 결과) 또는 (None, None)
         """
         try:
             # Spec 읽기
-            spec_content = self.file_manager.read_file(spec_path)
-            if not spec_content:
+            spec_document = self.file_manager.read_document(spec_path)
+            if not spec_document or not spec_document.text:
                 return None, None
+            spec_content = spec_document.text
             
-            # Plan 내용 생성 (Spec-kit 사용)
+            # Plan 내용 생성 (사전 생성 결과가 있고 Spec이 그대로면 재사용)
             plan_content = None
-            if self.spec_kit_client:
-                print("🤖 Spec-kit으로 Plan 생성 중...")
-                plan_content = self.spec_kit_client.generate_plan(spec_content)
-            
+            if issue_number is not None and not regenerate:
+                plan_content = self.speculator.take(issue_number, "plan", spec_content)
             if not plan_content:
-                print("📝 템플릿으로 Plan 생성 중...")
-                plan_content = self._generate_plan_content(spec_content)
+                plan_content = self.generate_plan_content(spec_content, issue_number, use_cache=not regenerate)
             
             # Plan 파일 생성
             plan_path = self.file_manager.create_plan_file(issue_dir, plan_content)
             
+            # 리뷰/승인 대기 동안 Tasks 사전 생성 (opt-in)
+            if issue_number is not None:
+                self.speculator.start(
+                    issue_number, "tasks", plan_content,
+                    lambda: self.generate_tasks_content(plan_content, issue_number)
+                )
+            
             # Review Agent 리뷰
-            review_result = self.review_agent.review_plan(plan_content, spec_content)
+            review_result = self.review_panel.review({
+                "Review Agent": lambda: self.review_agent.review_plan(plan_content, spec_content)
+            })
             
             return plan_path, review_result
             
@@ -145,42 +165,41 @@ class StageExecutor:
             print(f"Plan 생성 오류: {e}")
             return None, None
     
-    def create_tasks(self, issue_dir: Path, plan_path: Path) -> tuple[Optional[Path], Optional[ReviewResult]]:
+    def create_tasks(self, issue_dir: Path, plan_path: Path, issue_number: Optional[int] = None,
+                     regenerate: bool = False) -> tuple[Optional[Path], Optional[ReviewResult]]:
         """
         Tasks 생성
         
         Args:
             issue_dir: Issue 디렉토리
             plan_path: Plan 파일 경로
+            issue_number: Issue 번호 (출력 스트리밍용)
+            regenerate: 이전 Tasks가 거부된 뒤 다시 생성하는 경우 (사전 생성 결과/응답 캐시를 쓰지 않음)
             
         Returns:
             (tasks 파일 경로, 리뷰 결과) 또는 (None, None)
         """
         try:
             # Plan 읽기
-            plan_content = self.file_manager.read_file(plan_path)
-            if not plan_content:
+            plan_document = self.file_manager.read_document(plan_path)
+            if not plan_document or not plan_document.text:
                 return None, None
+            plan_content = plan_document.text
             
-            # Spec도 읽기 (Gemini에 참고용)
-            spec_path = issue_dir / "spec.md"
-            spec_content = self.file_manager.read_file(spec_path) if spec_path.exists() else ""
-            
-            # Tasks 내용 생성 (Spec-kit 사용)
+            # Tasks 내용 생성 (사전 생성 결과가 있고 Plan이 그대로면 재사용)
             tasks_content = None
-            if self.spec_kit_client:
-                print("🤖 Spec-kit으로 Tasks 생성 중...")
-                tasks_content = self.spec_kit_client.generate_tasks(plan_content)
-
+            if issue_number is not None and not regenerate:
+                tasks_content = self.speculator.take(issue_number, "tasks", plan_content)
             if not tasks_content:
-                print("📝 템플릿으로 Tasks 생성 중...")
-                tasks_content = self._generate_tasks_content(plan_content)
+                tasks_content = self.generate_tasks_content(plan_content, issue_number, use_cache=not regenerate)
             
             # Tasks 파일 생성
             tasks_path = self.file_manager.create_tasks_file(issue_dir, tasks_content)
             
             # Review Agent 리뷰
-            review_result = self.review_agent.review_tasks(tasks_content, plan_content)
+            review_result = self.review_panel.review({
+                "Review Agent": lambda: self.review_agent.review_tasks(tasks_content, plan_content)
+            })
             
             return tasks_path, review_result
             
@@ -188,6 +207,85 @@ class StageExecutor:
             print(f"Tasks 생성 오류: {e}")
             return None, None
     
+    def generate_plan_content(self, spec_content: str, issue_number: Optional[int] = None,
+                              use_cache: bool = True) -> str:
+        """
+        Plan 내용 생성 (Spec-kit → 템플릿 순, 파일은 쓰지 않음)
+        
+        Args:
+            spec_content: Spec 내용
+            issue_number: Issue 번호 (출력 스트리밍용)
+            use_cache: 응답 캐시 사용 여부
+            
+        Returns:
+            Plan 내용
+        """
+        plan_content = None
+        if self.spec_kit_client:
+            print("🤖 Spec-kit으로 Plan 생성 중...")
+            plan_content = self.spec_kit_client.generate_plan(spec_content, use_cache=use_cache,
+                                                              issue_number=issue_number)
+        
+        if not plan_content:
+            print("📝 템플릿으로 Plan 생성 중...")
+            plan_content = self._generate_plan_content(spec_content)
+        
+        return plan_content
+    
+    def generate_tasks_content(self, plan_content: str, issue_number: Optional[int] = None,
+                               use_cache: bool = True) -> str:
+        """
+        Tasks 내용 생성 (Spec-kit → 템플릿 순, 파일은 쓰지 않음)
+        
+        Args:
+            plan_content: Plan 내용
+            issue_number: Issue 번호 (출력 스트리밍용)
+            use_cache: 응답 캐시 사용 여부
+            
+        Returns:
+            Tasks 내용
+        """
+        tasks_content = None
+        if self.spec_kit_client:
+            print("🤖 Spec-kit으로 Tasks 생성 중...")
+            tasks_content = self.spec_kit_client.generate_tasks(plan_content, use_cache=use_cache,
+                                                                issue_number=issue_number)
+        
+        if not tasks_content:
+            print("📝 템플릿으로 Tasks 생성 중...")
+            tasks_content = self._generate_tasks_content(plan_content)
+        
+        return tasks_content
+    
+    def discard_speculation(self, issue_number: int):
+        """Issue의 사전 생성 결과 폐기 (단계 거부 시)"""
+        self.speculator.discard(issue_number)
+    
+    def _regulatory_review(self, spec_content: str, issue_title: str,
+                           issue_number: int) -> Optional[ReviewResult]:
+        """
+        RA Agent (Regulatory) 리뷰 - Goose Executor 사용
+        
+        Returns:
+            ReviewResult 또는 None (Goose 미사용/실행 실패 시 병합에서 제외)
+        """
+        from utils.logger import workflow_logger
+        
+        workflow_logger.info("  ⚖️ RA Agent (Regulatory) 검토 시작...")
+        ra_result = self.goose_executor.execute_agent(
+            agent_name="RA Agent",
+            task="Spec 문서를 규제(FDA/ISO) 관점에서 검토하세요.",
+            context={
+                "document_type": "spec",
+                "content": spec_content,
+                "issue_title": issue_title
+            },
+            issue_number=issue_number
+        )
+        workflow_logger.info(f"  RA Agent 결과: {ra_result.get('success')}")
+        
+        return review_from_agent_output(ra_result)
+    
     def _generate_spec_content(self, issue: GitHubIssue) -> str:
         """
         Spec 내용 생성 (템플릿 기반)
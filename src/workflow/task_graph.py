@@ -0,0 +1,293 @@
+"""
+Task Graph
+
+tasks.md를 의존성 그래프(DAG)로 파싱하고 독립 태스크를 병렬 실행
+
+의존성 규칙:
+- Phase 순서: Phase N의 태스크는 Phase N-1의 모든 태스크 완료 후 실행
+- Phase 내부: [P] 표시가 없는 태스크는 같은 Phase의 앞선 태스크가 모두 끝난 뒤 실행,
+  [P] 표시 태스크는 Phase 내부 암묵적 의존성 없음
+- 명시적 의존성: 태스크 줄의 "depends on T001", "after T001", "의존: T001" 또는
+  Dependencies 섹션의 "T004 → T005" 형식
+"""
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set
+from models.markdown_document import MarkdownDocument, parse_document
+
+
+PARALLEL_MARKER = re.compile(r'\[P\]')
+INLINE_DEPS_PATTERN = re.compile(
+    r'(?:depends\s+on|depends|deps|after|의존)\s*:?\s*((?:T\d+[\s,/&]*(?:and\s+)?)+)',
+    re.IGNORECASE
+)
+ARROW_PATTERN = re.compile(r'(T\d+)\s*(?:→|->|=>)\s*(?=T\d+)')
+TASK_ID_PATTERN = re.compile(r'T\d+')
+
+
+@dataclass
+class TaskNode:
+    """tasks.md의 단일 태스크"""
+    id: str
+    description: str
+    phase: int = 0
+    parallel: bool = False
+    completed: bool = False
+    dependencies: Set[str] = field(default_factory=set)
+
+    def to_dict(self) -> Dict[str, str]:
+        """GooseClient 태스크 형식으로 변환"""
+        return {'id': self.id, 'description': self.description}
+
+
+class TaskGraph:
+    """태스크 의존성 그래프"""
+
+    def __init__(self, tasks: List[TaskNode]):
+        """
+        Args:
+            tasks: 파일 순서대로 정렬된 태스크 목록
+        """
+        self.tasks: Dict[str, TaskNode] = {task.id: task for task in tasks}
+        self.order: List[str] = [task.id for task in tasks]
+
+    @classmethod
+    def parse(cls, content: str) -> 'TaskGraph':
+        """
+        tasks.md 내용 파싱
+
+        Args:
+            content: tasks.md 내용
+
+        Returns:
+            TaskGraph
+        """
+        return cls.from_document(parse_document(content))
+
+    @classmethod
+    def from_document(cls, document: MarkdownDocument) -> 'TaskGraph':
+        """
+        파싱된 tasks.md 문서로 그래프 생성
+
+        Args:
+            document: MarkdownDocument (태스크/Phase 정보 사용)
+
+        Returns:
+            TaskGraph
+        """
+        tasks: List[TaskNode] = []
+        for item in document.tasks:
+            node = TaskNode(
+                id=item.id,
+                description=item.description,
+                phase=item.phase,
+                parallel=bool(PARALLEL_MARKER.search(item.description)),
+                completed=item.completed
+            )
+            for deps_match in INLINE_DEPS_PATTERN.finditer(item.description):
+                node.dependencies.update(TASK_ID_PATTERN.findall(deps_match.group(1)))
+            tasks.append(node)
+
+        # Dependencies 섹션 등의 화살표 체인 (T004 → T005 → T006)
+        arrow_edges: List[tuple] = []
+        task_lines = {item.line for item in document.tasks}
+        for index, line in enumerate(document.lines):
+            if index in task_lines or not ARROW_PATTERN.search(line):
+                continue
+            for match in ARROW_PATTERN.finditer(line):
+                following = TASK_ID_PATTERN.search(line, match.end())
+                arrow_edges.append((match.group(1), following.group(0)))
+
+        graph = cls(tasks)
+        graph._add_implicit_dependencies()
+        for before, after in arrow_edges:
+            if before in graph.tasks and after in graph.tasks:
+                graph.tasks[after].dependencies.add(before)
+
+        for task in graph.tasks.values():
+            task.dependencies.discard(task.id)
+            task.dependencies.intersection_update(graph.tasks)
+
+        return graph
+
+    def _add_implicit_dependencies(self):
+        """Phase 순서 및 [P] 표시 기반 암묵적 의존성 추가"""
+        phases: Dict[int, List[TaskNode]] = {}
+        for task_id in self.order:
+            task = self.tasks[task_id]
+            phases.setdefault(task.phase, []).append(task)
+
+        previous_phase: List[TaskNode] = []
+        for phase in sorted(phases):
+            members = phases[phase]
+            for index, task in enumerate(members):
+                task.dependencies.update(t.id for t in previous_phase)
+                if not task.parallel:
+                    task.dependencies.update(t.id for t in members[:index])
+            previous_phase = members
+
+    def pending(self) -> List[TaskNode]:
+        """미완료 태스크 목록 (파일 순서)"""
+        return [self.tasks[task_id] for task_id in self.order if not self.tasks[task_id].completed]
+
+    def dependents(self, task_id: str) -> Set[str]:
+        """task_id에 (직/간접적으로) 의존하는 모든 태스크"""
+        result: Set[str] = set()
+        frontier = [task_id]
+        while frontier:
+            current = frontier.pop()
+            for task in self.tasks.values():
+                if current in task.dependencies and task.id not in result:
+                    result.add(task.id)
+                    frontier.append(task.id)
+        return result
+
+    def critical_path(self, durations: Dict[str, float]) -> tuple[float, List[str]]:
+        """
+        측정된 소요 시간 기준 임계 경로 계산
+
+        Args:
+            durations: 태스크별 소요 시간 (초, 실행하지 않은 태스크는 0)
+
+        Returns:
+            (임계 경로 길이(초), 경로상의 태스크 ID 목록)
+        """
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+
+        def visit(task_id: str) -> float:
+            if task_id in finish:
+                return finish[task_id]
+            finish[task_id] = 0.0  # 순환 의존성 방어
+            best, best_dep = 0.0, None
+            for dep in self.tasks[task_id].dependencies:
+                dep_finish = visit(dep)
+                if dep_finish > best:
+                    best, best_dep = dep_finish, dep
+            finish[task_id] = best + durations.get(task_id, 0.0)
+            previous[task_id] = best_dep
+            return finish[task_id]
+
+        for task_id in self.order:
+            visit(task_id)
+
+        if not finish:
+            return 0.0, []
+
+        end = max(finish, key=finish.get)
+        path = []
+        current: Optional[str] = end
+        while current:
+            path.append(current)
+            current = previous.get(current)
+        return finish[end], list(reversed(path))
+
+
+def mark_task_completed(content: str, task_id: str) -> str:
+    """
+    tasks.md 내용에서 해당 태스크의 체크박스를 체크
+
+    Args:
+        content: tasks.md 내용
+        task_id: 태스크 ID (예: "T017")
+
+    Returns:
+        수정된 내용 (해당 태스크가 없으면 원본 그대로)
+    """
+    pattern = re.compile(rf'^(\s*- )\[ \]( {re.escape(task_id)}\b)', re.MULTILINE)
+    return pattern.sub(r'\1[x]\2', content, count=1)
+
+
+class TaskGraphExecutor:
+    """의존성을 지키며 독립 태스크를 병렬 실행"""
+
+    def __init__(self, run_task: Callable[[TaskNode], Dict[str, Any]], max_concurrency: int = 1,
+                 on_task_done: Optional[Callable[[TaskNode, Dict[str, Any]], None]] = None):
+        """
+        Args:
+            run_task: 단일 태스크 실행 함수 (결과 딕셔너리에 'success' 포함)
+            max_concurrency: 최대 동시 실행 태스크 수
+            on_task_done: 태스크 완료 시 호출되는 콜백 (워커 스레드에서 호출)
+        """
+        self.run_task = run_task
+        self.max_concurrency = max(1, max_concurrency)
+        self.on_task_done = on_task_done
+
+    def execute(self, graph: TaskGraph) -> Dict[str, Any]:
+        """
+        그래프 실행
+
+        실패한 태스크에 의존하는 태스크는 실행하지 않고(blocked) 나머지 독립 태스크는 계속 실행
+
+        Returns:
+            실행 결과 (status, results, failed_tasks, blocked_tasks, wall_clock,
+            critical_path, critical_path_length)
+        """
+        done: Set[str] = {task.id for task in graph.tasks.values() if task.completed}
+        remaining: List[str] = [task.id for task in graph.pending()]
+        failed: List[str] = []
+        blocked: Set[str] = set()
+        results: List[Dict[str, Any]] = []
+        durations: Dict[str, float] = {}
+        lock = threading.Lock()
+
+        def run(node: TaskNode) -> Dict[str, Any]:
+            started = time.monotonic()
+            try:
+                result = self.run_task(node)
+            except Exception as e:
+                result = {'success': False, 'task_id': node.id, 'error': str(e)}
+            with lock:
+                durations[node.id] = time.monotonic() - started
+            if self.on_task_done:
+                self.on_task_done(node, result)
+            return result
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="goose-task") as pool:
+            running: Dict[Any, str] = {}
+
+            while remaining or running:
+                # 실행 가능한 태스크 제출
+                for task_id in list(remaining):
+                    if len(running) >= self.max_concurrency:
+                        break
+                    if graph.tasks[task_id].dependencies <= done:
+                        remaining.remove(task_id)
+                        running[pool.submit(run, graph.tasks[task_id])] = task_id
+
+                if not running:
+                    # 남은 태스크는 모두 실패/순환 의존성으로 실행 불가
+                    blocked.update(remaining)
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    task_id = running.pop(future)
+                    result = future.result()
+                    results.append(result)
+
+                    if result.get('success'):
+                        done.add(task_id)
+                    else:
+                        failed.append(task_id)
+                        dependents = graph.dependents(task_id)
+                        blocked.update(dependents & set(remaining))
+                        remaining = [t for t in remaining if t not in dependents]
+
+        wall_clock = time.monotonic() - started
+        critical_length, critical_path = graph.critical_path(durations)
+
+        return {
+            'status': 'failed' if failed or blocked else 'success',
+            'results': results,
+            'completed_tasks': len([r for r in results if r.get('success')]),
+            'failed_tasks': failed,
+            'blocked_tasks': sorted(blocked),
+            'wall_clock': wall_clock,
+            'critical_path': critical_path,
+            'critical_path_length': critical_length
+        }
@@ -0,0 +1,95 @@
+"""
+BackendDispatcher 테스트
+
+- race/hedged에서 먼저 성공한 후보가 나오면 나머지 후보의 프로세스를 종료하는지 확인
+- 취소된 후보는 (None을 반환해도) 지연 시간/실패 통계에 기록하지 않음
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from integrations.backend_dispatcher import Attempt, BackendDispatcher
+from utils.process_runner import ProcessRunner
+
+
+def test_race_cancels_slow_process():
+    runner = ProcessRunner()
+    loser_done = threading.Event()
+    loser_results = []
+
+    def slow(timeout):
+        try:
+            loser_results.append(runner.run_sync([sys.executable, "-c", "import time; time.sleep(30)"],
+                                                 backend="slow", timeout=timeout))
+        finally:
+            loser_done.set()
+
+    def fast(timeout):
+        time.sleep(0.3)  # slow 프로세스가 시작될 시간
+        return "fast"
+
+    dispatcher = BackendDispatcher(strategy="race")
+    started = time.monotonic()
+    result = dispatcher.dispatch([Attempt("slow", slow, 60), Attempt("fast", fast, 60)])
+
+    assert result == "fast"
+    assert loser_done.wait(5), "취소된 후보가 끝나지 않음"
+    assert time.monotonic() - started < 5
+    assert loser_results == []  # run_sync가 결과 대신 CancelledError로 끝남
+    # 프로세스 종료는 백그라운드 루프에서 비동기로 마무리됨
+    deadline = time.monotonic() + 5
+    while runner.snapshot()['active'] and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert runner.snapshot()['active'] == 0
+    assert dispatcher.snapshot()['cancelled'] == 1
+    dispatcher.shutdown()
+
+
+def test_cancelled_loser_is_not_recorded():
+    runner = ProcessRunner()
+    loser_done = threading.Event()
+
+    def slow(timeout):
+        # 클라이언트처럼 모든 예외를 잡고 None 반환
+        try:
+            runner.run_sync([sys.executable, "-c", "import time; time.sleep(30)"],
+                            backend="slow", timeout=timeout)
+        except BaseException:
+            return None
+        finally:
+            loser_done.set()
+
+    def fast(timeout):
+        time.sleep(0.3)
+        return "fast"
+
+    dispatcher = BackendDispatcher(strategy="race")
+    assert dispatcher.dispatch([Attempt("slow", slow, 60), Attempt("fast", fast, 60)]) == "fast"
+    assert loser_done.wait(5)
+    time.sleep(0.1)  # _run이 기록 여부를 결정할 시간
+
+    latency = dispatcher.latency.snapshot()
+    assert "slow" not in latency
+    assert latency["fast"]["samples"] == 1
+    assert dispatcher.snapshot()['cancelled'] == 1
+    dispatcher.shutdown()
+
+
+def test_fallback_runs_in_order():
+    calls = []
+
+    def failing(timeout):
+        calls.append("a")
+        return None
+
+    def ok(timeout):
+        calls.append("b")
+        return "b"
+
+    dispatcher = BackendDispatcher(strategy="fallback")
+    assert dispatcher.dispatch([Attempt("a", failing, 10), Attempt("b", ok, 10)]) == "b"
+    assert calls == ["a", "b"]
+    dispatcher.shutdown()
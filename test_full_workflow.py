@@ -61,12 +61,12 @@ def test_full_workflow():
         headers=headers
     )
     
-    if response.status_code != 200:
+    if response.status_code != 202:
         print(f"❌ 오류: {response.status_code} - {response.text}")
         return False
     
     result = response.json()
-    print(f"   ✅ {result['message']}")
+    print(f"   ✅ {result['message']} (job: {result['job_id']})")
     
     # 잠시 대기 (처리 시간)
     print("\n⏳ 워크플로우 처리 중...\n")
@@ -0,0 +1,76 @@
+"""
+GeminiWorkerPool 테스트
+
+가짜 ACP 워커(stdio JSON-RPC)로 확인:
+- 응답 중인 워커가 ProcessRunner 동시 실행 수에 포함되는지
+- 워커 Timeout이 None(CLI 대체) 대신 TimeoutError로 끝나는지
+"""
+import shlex
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from integrations.gemini_worker_pool import GeminiWorkerPool
+from utils.process_runner import get_process_runner
+from utils.resilience import get_resilience
+
+
+FAKE_WORKER = '''
+import json, sys, time
+for line in sys.stdin:
+    message = json.loads(line)
+    result = {}
+    if message["method"] == "session/new":
+        result = {"sessionId": "s1"}
+    elif message["method"] == "session/prompt":
+        text = message["params"]["prompt"][0]["text"]
+        time.sleep(float(text.split(":")[1]) if text.startswith("sleep:") else 0)
+        update = {"sessionUpdate": "agent_message_chunk", "content": {"type": "text", "text": "답변"}}
+        print(json.dumps({"jsonrpc": "2.0", "method": "session/update",
+                          "params": {"sessionId": "s1", "update": update}}), flush=True)
+    print(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}), flush=True)
+'''
+
+
+@pytest.fixture
+def pool(tmp_path):
+    script = tmp_path / "fake_worker.py"
+    script.write_text(FAKE_WORKER, encoding="utf-8")
+    pool = GeminiWorkerPool(enabled=True, size=1,
+                            command=f"{shlex.quote(sys.executable)} {shlex.quote(str(script))}")
+    get_resilience().breaker("gemini").record_success()
+    yield pool
+    pool.shutdown()
+
+
+def test_run_returns_worker_output(pool):
+    assert pool.run("hello") == "답변"
+    assert pool.snapshot()['requests'] == 1
+
+
+def test_busy_worker_counts_as_running_process(pool):
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(pool.run("sleep:0.5")))
+    thread.start()
+    time.sleep(0.3)
+    active = get_process_runner().snapshot()['backends'].get('gemini', {}).get('active')
+    thread.join()
+
+    assert active == 1
+    assert seen == ["답변"]
+    assert get_process_runner().snapshot()['backends']['gemini']['active'] == 0
+
+
+def test_worker_timeout_raises_instead_of_falling_back(pool):
+    with pytest.raises(TimeoutError):
+        pool.run("sleep:2", timeout=0.3)
+
+    snapshot = pool.snapshot()
+    assert snapshot['timeouts'] == 1
+    assert snapshot['workers'] == 0  # 응답하지 않은 워커는 교체
+    assert get_resilience().breaker("gemini").snapshot()['consecutive_failures'] == 1
@@ -55,12 +55,12 @@ def test_goose_integration():
         headers=headers
     )
     
-    if response.status_code != 200:
+    if response.status_code != 202:
         print(f"❌ 오류: {response.status_code} - {response.text}")
         return False
     
     result = response.json()
-    print(f"   ✅ {result['message']}")
+    print(f"   ✅ {result['message']} (job: {result['job_id']})")
     
     # 워크플로우 완료 대기
     print("\n⏳ 워크플로우 처리 중 (Spec→Plan→Tasks→구현)...\n")
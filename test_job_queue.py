@@ -0,0 +1,119 @@
+"""
+WorkflowJobQueue 테스트
+
+- single-flight: 같은 key의 대기 중인 작업에 합치고 마지막 인자로 실행
+- 합쳐질 때 우선순위 클래스는 올리기만 하고 내리지 않음
+- 워커가 이미 꺼낸 작업은 합쳐져도 클래스가 바뀌지 않음
+- 대기 작업 상한
+"""
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from workflow.job_queue import JobStatus, QueueFullError, WorkflowJobQueue
+from workflow.priority_scheduler import PriorityScheduler
+
+
+CONFIG = {
+    "default_class": "normal",
+    "aging_seconds": 600,
+    "classes": [
+        {"name": "hotfix", "labels": ["hotfix"], "weight": 8},
+        {"name": "bug", "labels": ["bug"], "weight": 4},
+        {"name": "normal", "labels": [], "weight": 1},
+    ]
+}
+
+
+@pytest.fixture
+def queue(tmp_path):
+    config_path = tmp_path / "priority_classes.json"
+    config_path.write_text(json.dumps(CONFIG), encoding="utf-8")
+    return WorkflowJobQueue(num_workers=1, scheduler=PriorityScheduler(str(config_path)), max_pending=3)
+
+
+def _depths(queue):
+    return {name: c['depth'] for name, c in queue.scheduler.snapshot()['classes'].items()}
+
+
+def test_single_flight_coalesces_and_keeps_latest_args(queue):
+    job, coalesced = queue.submit_single_flight("start:1", 1, print, "opened")
+    again, coalesced_again = queue.submit_single_flight("start:1", 1, print, "labeled")
+
+    assert (coalesced, coalesced_again) == (False, True)
+    assert again is job
+    assert job.args == ("labeled",)
+    assert job.coalesced == 1
+    assert queue.scheduler.qsize() == 1
+
+
+def test_coalescing_promotes_priority_class(queue):
+    job, _ = queue.submit_single_flight("start:1", 1, print, priority_class="normal")
+    queue.submit_single_flight("start:1", 1, print, priority_class="hotfix")
+
+    assert job.priority_class == "hotfix"
+    assert _depths(queue) == {"hotfix": 1, "bug": 0, "normal": 0}
+
+
+def test_coalescing_never_demotes_priority_class(queue):
+    job, _ = queue.submit_single_flight("start:1", 1, print, priority_class="hotfix")
+    queue.submit_single_flight("start:1", 1, print, priority_class="normal")
+    queue.submit_single_flight("start:1", 1, print)
+
+    assert job.priority_class == "hotfix"
+    assert _depths(queue) == {"hotfix": 1, "bug": 0, "normal": 0}
+
+
+def test_promotion_during_debounce_applies_when_enqueued(queue):
+    job, _ = queue.submit_single_flight("start:1", 1, print, debounce=0.2, priority_class="normal")
+    queue.submit_single_flight("start:1", 1, print, priority_class="bug")
+    assert queue.scheduler.qsize() == 0
+
+    threading.Event().wait(0.4)
+    assert job.priority_class == "bug"
+    assert _depths(queue)["bug"] == 1
+
+
+def test_dequeued_job_keeps_its_class_until_finished(queue):
+    job, _ = queue.submit_single_flight("start:1", 1, print, "opened", priority_class="normal")
+    assert queue.scheduler.get() is job  # 워커가 꺼냈지만 아직 RUNNING 전
+
+    queue.submit_single_flight("start:1", 1, print, "labeled", priority_class="hotfix")
+    assert job.priority_class == "normal"
+
+    queue._run_job(job)
+    queue.scheduler.task_done(job)
+    assert job.status == JobStatus.SUCCEEDED
+    assert {name: c['running'] for name, c in queue.scheduler.snapshot()['classes'].items()} == \
+        {"hotfix": 0, "bug": 0, "normal": 0}
+
+
+def test_finished_flight_starts_new_job(queue):
+    queue.start()
+    done = threading.Event()
+    job, _ = queue.submit_single_flight("start:1", 1, done.set)
+    assert done.wait(5)
+    queue.shutdown(wait=True)
+
+    second, coalesced = queue.submit_single_flight("start:1", 1, print)
+    assert job.status == JobStatus.SUCCEEDED
+    assert second is not job
+    assert coalesced is False
+
+
+def test_rejects_when_queue_full(queue):
+    for number in range(3):
+        queue.submit_single_flight(f"start:{number}", number, print)
+
+    with pytest.raises(QueueFullError) as error:
+        queue.submit_single_flight("start:9", 9, print)
+    assert error.value.limit == 3
+
+    # 기존 작업에 합쳐지는 요청은 상한과 무관
+    _, coalesced = queue.submit_single_flight("start:0", 0, print)
+    assert coalesced is True
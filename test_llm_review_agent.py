@@ -0,0 +1,36 @@
+"""
+LLMReviewAgent 단계별 리뷰 테스트
+
+구조 검사로 확정한 판정과 코멘트(승인/거부 표시)가 일치하는지 확인
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from agents.llm_review_agent import LLMReviewAgent
+
+
+SPEC = "# Spec\n\n## User Story\n\nGiven 사용자가 로그인하면 When 버튼을 누르고 Then 화면이 보인다\n"
+
+
+def test_rule_reject_comments_match_decision():
+    # approval_threshold 기준으로는 승인이지만 단계별 리뷰가 거부로 확정
+    agent = LLMReviewAgent(use_llm=False, approval_threshold=0.0, cascade=True,
+                           cascade_reject_below=1.01, cascade_approve_at=2.0)
+    result = agent._cascade_review_spec(SPEC, "로그인", "")
+
+    assert result.approved is False
+    assert "❌ 거부" in result.comments
+    assert "✅ 승인" not in result.comments
+    assert agent.cascade_stats()['counts']['rule_reject'] == 1
+
+
+def test_rule_approve_comments_match_decision():
+    agent = LLMReviewAgent(use_llm=False, approval_threshold=1.01, cascade=True,
+                           cascade_reject_below=0.0, cascade_approve_at=0.0)
+    result = agent._cascade_review_spec(SPEC, "로그인", "")
+
+    assert result.approved is True
+    assert "✅ 승인" in result.comments
+    assert agent.cascade_stats()['rates']['rule_approve'] == 1.0
@@ -0,0 +1,134 @@
+"""
+OutputStreamHub 테스트
+
+- 워크플로우가 끝난(close) 스트림이 보존 시간 후 메모리에서 제거되는지 확인
+- Spec/Plan/Tasks 단계에서 거부·실패로 멈춘 워크플로우도 스트림을 닫는지 확인
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import utils.output_stream as output_stream_module
+import workflow.orchestrator as orchestrator_module
+from models.issue import GitHubIssue
+from models.workflow_state import ApprovalStatus, WorkflowStage
+from utils.file_manager import FileManager
+from utils.output_stream import OutputStreamHub
+from workflow.orchestrator import WorkflowOrchestrator
+from workflow.review_agent import ReviewAgent, ReviewResult
+from workflow.speculation import SpeculativeExecutor
+from workflow.stage_executor import StageExecutor
+
+
+def test_closed_stream_is_evicted_after_retention(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(output_stream_module.time, "time", lambda: now[0])
+    hub = OutputStreamHub(log_dir=str(tmp_path), retention_seconds=60)
+
+    hub.callbacks(1, "goose")['on_stdout']("첫 줄")
+    hub.close(1)
+    now[0] += 59
+    assert [entry['line'] for entry in hub.tail(1)] == ["첫 줄"]
+
+    now[0] += 2
+    hub.stream(2)  # 다른 Issue 활동 시 만료된 스트림 정리
+    assert hub.tail(1) == []
+    assert (tmp_path / "issue-1.log").read_text(encoding="utf-8").endswith("goose:stdout | 첫 줄\n")
+
+
+def test_reopened_stream_is_kept(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(output_stream_module.time, "time", lambda: now[0])
+    hub = OutputStreamHub(log_dir=str(tmp_path), retention_seconds=60)
+
+    stream = hub.stream(1)
+    stream.write("gemini:stdout", "a")
+    hub.close(1)
+    stream.write("gemini:stdout", "b")  # 재시도 등으로 다시 출력
+    now[0] += 120
+    hub.stream(2)
+
+    assert [entry['line'] for entry in hub.tail(1)] == ["a", "b"]
+    hub.close(1)
+
+
+class _StreamingSpecKit:
+    """생성할 때마다 Issue 스트림에 출력을 남기는 Spec-kit 대역 (fail_at 단계는 생성 실패)"""
+
+    def __init__(self, hub, fail_at=None):
+        self.hub = hub
+        self.fail_at = fail_at
+
+    def _generate(self, stage, issue_number):
+        self.hub.callbacks(issue_number, "gemini")['on_stdout'](f"{stage} 생성 중")
+        if stage == self.fail_at:
+            raise RuntimeError(f"{stage} 생성 실패")
+        return f"# {stage}"
+
+    def generate_spec(self, issue, use_cache=True):
+        return self._generate("spec", issue.number)
+
+    def generate_plan(self, spec_content, use_cache=True, issue_number=None):
+        return self._generate("plan", issue_number)
+
+    def generate_tasks(self, plan_content, use_cache=True, issue_number=None):
+        return self._generate("tasks", issue_number)
+
+
+class _RejectAt(ReviewAgent):
+    """reject_at 단계만 거부"""
+
+    def __init__(self, reject_at):
+        super().__init__()
+        self.reject_at = reject_at
+
+    def _result(self, stage):
+        approved = stage != self.reject_at
+        return ReviewResult(approved=approved, comments=stage, score=float(approved))
+
+    def review_spec(self, content, issue_title):
+        return self._result("spec")
+
+    def review_plan(self, content, spec_content):
+        return self._result("plan")
+
+    def review_tasks(self, content, plan_content):
+        return self._result("tasks")
+
+
+class _SilentSlack:
+    def send_message(self, channel, message):
+        return None
+
+
+@pytest.mark.parametrize("reject_at, fail_at, stage", [
+    ("spec", None, WorkflowStage.SPEC),
+    ("plan", None, WorkflowStage.PLAN),
+    ("tasks", None, WorkflowStage.TASKS),
+    (None, "plan", WorkflowStage.PLAN),
+])
+def test_stream_is_closed_when_workflow_stops(tmp_path, monkeypatch, reject_at, fail_at, stage):
+    hub = OutputStreamHub(log_dir=str(tmp_path / "logs"), retention_seconds=60)
+    monkeypatch.setattr(orchestrator_module, "get_output_hub", lambda: hub)
+    executor = StageExecutor(
+        FileManager(base_dir=str(tmp_path / "specs")),
+        _RejectAt(reject_at),
+        spec_kit_client=_StreamingSpecKit(hub, fail_at),
+        speculator=SpeculativeExecutor(enabled=False)
+    )
+    orchestrator = WorkflowOrchestrator(executor, _SilentSlack())
+    now = datetime.now()
+    issue = GitHubIssue(number=3, title="로그인", body="", state="open", labels=[],
+                        created_at=now, updated_at=now, url="", author="dev")
+
+    orchestrator.start_workflow(issue)
+
+    state = orchestrator.get_state(3)
+    assert (state.current_stage, state.approval_status) == (stage, ApprovalStatus.REJECTED)
+    assert hub.is_closed(3)
+    assert hub.stream(3)._file is None
+    assert hub.tail(3)[-1]['line'] == f"{stage.value} 생성 중"
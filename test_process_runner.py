@@ -0,0 +1,64 @@
+"""
+ProcessRunner 테스트
+
+청크 경계에서 잘린 멀티바이트(UTF-8) 출력이 깨지지 않는지 확인
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from utils.process_runner import ProcessRunner, _TailBuffer
+
+
+TEXT = "한글 출력 테스트\n두 번째 줄 ✅\n마지막"
+
+
+def _read_chunks(chunks):
+    """chunks를 한 번에 하나씩 흘려보내며 _read_stream 실행"""
+    async def scenario():
+        reader = asyncio.StreamReader()
+        buffer = _TailBuffer()
+        lines = []
+
+        async def feed():
+            for chunk in chunks:
+                reader.feed_data(chunk)
+                await asyncio.sleep(0.01)  # 청크마다 별도 read()가 되도록
+            reader.feed_eof()
+
+        await asyncio.gather(feed(), ProcessRunner._read_stream(reader, buffer, lines.append))
+        return buffer.text(), lines
+
+    return asyncio.run(scenario())
+
+
+def test_read_stream_keeps_split_multibyte_characters():
+    data = TEXT.encode("utf-8")
+    # 1바이트씩 나누면 모든 한글 문자가 청크 경계에서 잘림
+    text, lines = _read_chunks([data[i:i + 1] for i in range(len(data))])
+
+    assert text == TEXT
+    assert "�" not in text
+    assert lines == TEXT.split("\n")
+
+
+def test_read_stream_replaces_truncated_character_at_eof():
+    data = "끝".encode("utf-8")[:2]
+    text, _ = _read_chunks([b"ok ", data])
+
+    assert text == "ok �"
+
+
+def test_run_sync_decodes_korean_output():
+    script = (
+        "import sys, time\n"
+        f"data = {TEXT!r}.encode('utf-8')\n"
+        "for i in range(0, len(data), 5):\n"
+        "    sys.stdout.buffer.write(data[i:i + 5]); sys.stdout.buffer.flush(); time.sleep(0.002)\n"
+    )
+    result = ProcessRunner().run_sync([sys.executable, "-c", script], backend="test", timeout=30)
+
+    assert result.ok
+    assert result.stdout == TEXT
@@ -0,0 +1,70 @@
+"""
+PromptBuilder 테스트
+
+예산을 넘을 때 부가 컨텍스트만 축소하고 주 입력(required)은 그대로 두는지 확인
+Spec 생성 프롬프트도 예산을 넘으면 Issue 본문을 축소하는지 확인
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from integrations.gemini_client import GeminiClient
+from models.issue import GitHubIssue
+from utils.prompt_builder import PromptBuilder, get_prompt_builder
+from utils.template_registry import PromptTemplate
+
+
+def _section(title: str, size: int) -> str:
+    return f"# {title}\n\n" + "\n\n".join(f"## {title} {i}\n\n" + "내용 " * 40 for i in range(size))
+
+
+def _template() -> PromptTemplate:
+    return PromptTemplate(name="test", family="prompt", path=Path("test.md"), mtime_ns=0,
+                          text="다음 문서로 Plan을 작성하세요.\n\n{spec}\n\n참고:\n{notes}")
+
+
+def test_required_field_is_not_shrunk():
+    spec = _section("Spec", 40)
+    notes = _section("Notes", 40)
+    builder = PromptBuilder("gemini", budget_tokens=3000)
+
+    built = builder.build(_template(), {'spec': spec, 'notes': notes}, required=('spec',), label="test")
+
+    assert spec in built.text
+    assert 'spec' not in built.trimmed
+    assert 'notes' in built.trimmed
+
+
+def test_without_required_largest_field_may_shrink():
+    spec = _section("Spec", 80)
+    builder = PromptBuilder("gemini", budget_tokens=3000)
+
+    built = builder.build(_template(), {'spec': spec, 'notes': "짧은 메모"}, label="test")
+
+    assert 'spec' in built.trimmed
+
+
+def test_over_budget_when_required_field_alone_is_too_large():
+    spec = _section("Spec", 80)
+    builder = PromptBuilder("gemini", budget_tokens=1000)
+
+    built = builder.build(_template(), {'spec': spec, 'notes': "짧은 메모"}, required=('spec',), label="test")
+
+    assert spec in built.text
+    assert built.over_budget
+
+
+def test_spec_prompt_shrinks_issue_body(monkeypatch):
+    monkeypatch.setattr(get_prompt_builder("gemini"), "budget_tokens", 2000)
+    client = GeminiClient(prompts_dir=str(Path(__file__).parent / "prompts"))
+    body = _section("Issue", 80)
+    issue = GitHubIssue(number=7, title="로그인 기능 추가", body=body, labels=[], state="open",
+                        created_at=datetime.now(), updated_at=datetime.now(), url="", author="tester")
+
+    prompt = client._create_spec_prompt(issue)
+
+    assert "로그인 기능 추가" in prompt
+    assert body not in prompt
+    assert get_prompt_builder("gemini").estimate(prompt) <= 2000
@@ -0,0 +1,47 @@
+"""
+PromptTransport 테스트
+
+- argv/stdin 선택은 UTF-8 바이트 길이 기준
+- file 방식(goose --plan / --instructions)은 임시 파일을 만들고 with 블록 종료 시 삭제
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from utils.prompt_transport import PromptTransport
+
+
+def test_small_prompt_uses_argv(tmp_path):
+    transport = PromptTransport(argv_max_bytes=16, tmp_dir=str(tmp_path))
+
+    prepared = transport.prepare(["gemini", "chat"], "hello", prompt_flag="--prompt")
+
+    assert prepared.mode == "argv"
+    assert prepared.args == ["gemini", "chat", "--prompt", "hello"]
+    assert prepared.input_text is None
+
+
+def test_limit_counts_utf8_bytes(tmp_path):
+    transport = PromptTransport(argv_max_bytes=16, tmp_dir=str(tmp_path))
+
+    # 6글자지만 UTF-8로 18바이트
+    prepared = transport.prepare(["gemini"], "한국어프롬프")
+
+    assert prepared.mode == "stdin"
+    assert prepared.args == ["gemini"]
+    assert prepared.input_text == "한국어프롬프"
+
+
+def test_file_flag_writes_temp_file_and_cleans_up(tmp_path):
+    transport = PromptTransport(tmp_dir=str(tmp_path))
+
+    with transport.prepare(["goose", "session", "start", "s1"], "plan", file_flag="--plan") as prepared:
+        path = Path(prepared.args[-1])
+        assert prepared.mode == "file"
+        assert prepared.args[:-1] == ["goose", "session", "start", "s1", "--plan"]
+        assert path.parent == tmp_path
+        assert path.read_text(encoding="utf-8") == "plan"
+
+    assert not path.exists()
+    assert transport.stats == {'argv': 0, 'stdin': 0, 'file': 1}
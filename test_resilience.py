@@ -0,0 +1,204 @@
+"""
+BackendResilience 테스트
+
+- 일시적 실패만 재시도, 재시도마다 rate limit 새로 예약 (대기 중에는 슬롯 반납)
+- Circuit Breaker closed → open → half-open → closed 전이
+- call_gemini: 캐시 → CLI 순서, 공통 캐시 키, Issue 스트리밍, Timeout/오류 예외
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import utils.resilience as resilience_module
+from utils.output_stream import OutputStreamHub
+from utils.process_runner import ProcessResult
+from utils.rate_limiter import RateLimiter
+from utils.response_cache import ResponseCache
+from utils.resilience import (BackendCallError, BackendResilience, CircuitBreaker, CircuitOpenError,
+                              call_gemini, is_transient)
+
+
+def _result(returncode=0, stderr="", timed_out=False) -> ProcessResult:
+    return ProcessResult(args=["cli"], returncode=returncode, stdout="ok", stderr=stderr,
+                         duration=0.1, timed_out=timed_out)
+
+
+class _FakeRunner:
+    """정해진 결과를 순서대로 반환하고, 실행 시점의 rate limit 사용량을 기록"""
+
+    def __init__(self, results, limiter):
+        self.results = list(results)
+        self.limiter = limiter
+        self.inflight_seen = []
+        self.calls = []
+
+    def run_sync(self, args, backend, **kwargs):
+        self.inflight_seen.append(self.limiter.for_backend(backend).inflight)
+        self.calls.append((args, kwargs))
+        result = self.results.pop(0)
+        if kwargs.get('on_stdout') and result.stdout:
+            kwargs['on_stdout'](result.stdout)
+        return result
+
+
+@pytest.fixture
+def env(monkeypatch):
+    limiter = RateLimiter()
+    sleeps = []
+
+    def setup(results):
+        runner = _FakeRunner(results, limiter)
+        monkeypatch.setattr(resilience_module, "get_process_runner", lambda: runner)
+        monkeypatch.setattr(resilience_module, "get_rate_limiter", lambda: limiter)
+        monkeypatch.setattr(resilience_module.cancellation, "sleep", sleeps.append)
+        return runner, limiter, sleeps
+
+    return setup
+
+
+@pytest.mark.parametrize("stderr, expected", [
+    ("Error: 429 Too Many Requests", True),
+    ("503 Service Unavailable", True),
+    ("read ECONNRESET", True),
+    ("request timed out", True),
+    ("network error while fetching", True),
+    ("Invalid timeout value: -1", False),
+    ("Unknown option --network", False),
+    ("Error: file not found", False),
+])
+def test_transient_patterns(stderr, expected):
+    assert is_transient(_result(returncode=1, stderr=stderr)) is expected
+
+
+def test_timeout_and_signal_classification():
+    assert is_transient(_result(returncode=None, timed_out=True)) is False
+    assert is_transient(_result(returncode=-9)) is True
+
+
+def test_retries_transient_failure_with_new_reservation(env):
+    runner, limiter, sleeps = env([_result(1, "503 unavailable"), _result(1, "429"), _result(0)])
+    resilience = BackendResilience(max_attempts=3, base_delay=0.01)
+
+    result = resilience.run_sync(["cli"], backend="gemini", prompt="hello")
+
+    assert result.ok
+    assert len(sleeps) == 2
+    assert limiter.for_backend("gemini").stats['calls'] == 3  # 시도마다 예약
+    assert limiter.for_backend("gemini").inflight == 0  # 재시도 대기 중에는 슬롯 반납
+    assert runner.inflight_seen == [1, 1, 1]
+    assert resilience.snapshot()['retries'] == 2
+
+
+def test_does_not_retry_permanent_failure_or_timeout(env):
+    runner, limiter, sleeps = env([_result(1, "Error: bad argument"), _result(None, timed_out=True)])
+    resilience = BackendResilience(max_attempts=3, base_delay=0.01)
+
+    assert resilience.run_sync(["cli"], backend="gemini").returncode == 1
+    assert resilience.run_sync(["cli"], backend="gemini").timed_out
+    assert sleeps == []
+    assert limiter.for_backend("gemini").stats['calls'] == 2
+
+
+def test_gives_up_after_max_attempts(env):
+    runner, _, sleeps = env([_result(1, "overloaded")] * 3)
+    resilience = BackendResilience(max_attempts=3, base_delay=0.01, failure_threshold=10)
+
+    result = resilience.run_sync(["cli"], backend="goose")
+
+    assert result.returncode == 1
+    assert len(sleeps) == 2
+    assert runner.results == []
+
+
+def test_circuit_breaker_transitions(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(resilience_module.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker("gemini", failure_threshold=2, reset_timeout=30)
+
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    # 차단 시간이 지나면 시험 호출 하나만 허용
+    now[0] += 31
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    # 시험 실패 → 다시 차단, 다음 시험 성공 → 복구
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    now[0] += 31
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.snapshot()['opened'] == 2
+
+
+def test_open_circuit_skips_process(env):
+    runner, limiter, _ = env([_result(1, "503"), _result(0)])
+    resilience = BackendResilience(max_attempts=1, failure_threshold=1, reset_timeout=60)
+
+    resilience.run_sync(["cli"], backend="gemini")
+    with pytest.raises(CircuitOpenError):
+        resilience.run_sync(["cli"], backend="gemini")
+
+    assert len(runner.results) == 1  # 두 번째 호출은 프로세스 실행 안 함
+    assert limiter.for_backend("gemini").stats['calls'] == 1
+
+
+@pytest.fixture
+def gemini(env, monkeypatch, tmp_path):
+    cache = ResponseCache(db_path=str(tmp_path / "cache.db"), enabled=True)
+    hub = OutputStreamHub(log_dir=str(tmp_path / "logs"))
+    monkeypatch.setattr(resilience_module, "get_response_cache", lambda: cache)
+    monkeypatch.setattr(resilience_module, "get_output_hub", lambda: hub)
+    monkeypatch.setattr(resilience_module, "get_resilience", lambda: BackendResilience(max_attempts=1))
+
+    def setup(results):
+        runner, _, _ = env(results)
+        return runner, cache, hub
+
+    return setup
+
+
+def test_call_gemini_runs_cli_once_then_uses_cache(gemini):
+    runner, cache, hub = gemini([_result(0)])
+
+    assert call_gemini("prompt", model="m", temperature=0.2, issue_number=9) == "ok"
+    assert call_gemini("prompt", model="m", temperature=0.2, issue_number=9) == "ok"
+
+    args, kwargs = runner.calls[0]
+    assert args == ["gemini", "chat", "--model", "m", "--temperature", "0.2", "--prompt", "prompt"]
+    assert len(runner.calls) == 1
+    assert cache.get("gemini", "m", 0.2, "prompt") == "ok"
+    assert [entry['line'] for entry in hub.tail(9)] == ["ok"]
+
+
+def test_call_gemini_bypasses_cache_when_regenerating(gemini):
+    runner, cache, _ = gemini([_result(0)])
+    cache.put("gemini", None, None, "prompt", "old")
+
+    assert call_gemini("prompt", use_cache=False) == "ok"
+    assert cache.get("gemini", None, None, "prompt") == "ok"
+
+
+def test_call_gemini_raises_on_timeout_and_error(gemini):
+    gemini([_result(None, timed_out=True), _result(2, "Error: bad flag")])
+
+    with pytest.raises(TimeoutError):
+        call_gemini("prompt", timeout=5)
+    with pytest.raises(BackendCallError) as error:
+        call_gemini("prompt")
+    assert error.value.returncode == 2
+    assert str(error.value) == "Error: bad flag"
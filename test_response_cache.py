@@ -0,0 +1,174 @@
+"""
+ResponseCache / 캐시 우회 테스트
+
+- TTL이 지난 응답은 반환하지 않음
+- 거부된 단계를 다시 생성할 때(StageExecutor regenerate=True)는 캐시를 쓰지 않음
+- 거부가 기록되면 거부된 문서를 캐시에서 제거 (승인 후 재실행해도 같은 문서가 나오지 않음)
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import utils.response_cache as response_cache_module
+from models.issue import GitHubIssue
+from models.workflow_state import ApprovalStatus, WorkflowStage
+from utils.file_manager import FileManager
+from utils.response_cache import ResponseCache
+from workflow.orchestrator import WorkflowOrchestrator
+from workflow.review_agent import ReviewAgent, ReviewResult
+from workflow.speculation import SpeculativeExecutor
+from workflow.stage_executor import StageExecutor
+
+
+def _cache(tmp_path, **kwargs) -> ResponseCache:
+    return ResponseCache(db_path=str(tmp_path / "cache.db"), enabled=True, **kwargs)
+
+
+def test_put_and_get_same_key(tmp_path):
+    cache = _cache(tmp_path)
+    cache.put("gemini", "m", 0.2, "prompt", "answer")
+
+    assert cache.get("gemini", "m", 0.2, "prompt") == "answer"
+    assert cache.get("gemini", "m", 0.7, "prompt") is None
+    assert cache.get("goose", "m", 0.2, "prompt") is None
+
+
+def test_expired_entry_is_not_returned(tmp_path, monkeypatch):
+    cache = _cache(tmp_path, ttl_seconds=60)
+    now = [1000.0]
+    monkeypatch.setattr(response_cache_module.time, "time", lambda: now[0])
+
+    cache.put("gemini", None, None, "prompt", "answer")
+    now[0] += 59
+    assert cache.get("gemini", None, None, "prompt") == "answer"
+
+    now[0] += 2
+    assert cache.get("gemini", None, None, "prompt") is None
+    assert cache.stats()['entries'] == 0
+
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    cache = ResponseCache(db_path=str(tmp_path / "cache.db"), enabled=False)
+    cache.put("gemini", None, None, "prompt", "answer")
+
+    assert cache.get("gemini", None, None, "prompt") is None
+
+
+class _RecordingSpecKit:
+    """use_cache 인자만 기록하는 Spec-kit 대역"""
+
+    def __init__(self):
+        self.calls = []
+
+    def generate_plan(self, spec_content, use_cache=True, issue_number=None):
+        self.calls.append(("plan", use_cache))
+        return "# Plan\n\n새로 생성된 Plan"
+
+    def generate_tasks(self, plan_content, use_cache=True, issue_number=None):
+        self.calls.append(("tasks", use_cache))
+        return "# Tasks\n\n- [ ] T001 작업"
+
+
+def _stage_executor(tmp_path, spec_kit) -> StageExecutor:
+    return StageExecutor(
+        FileManager(base_dir=str(tmp_path / "specs")),
+        ReviewAgent(auto_approve=True),
+        spec_kit_client=spec_kit,
+        speculator=SpeculativeExecutor(enabled=False)
+    )
+
+
+def test_regenerate_bypasses_cache(tmp_path):
+    spec_kit = _RecordingSpecKit()
+    executor = _stage_executor(tmp_path, spec_kit)
+    issue_dir = tmp_path / "specs" / "001-test"
+    issue_dir.mkdir(parents=True)
+    spec_path = issue_dir / "spec.md"
+    spec_path.write_text("# Spec\n\n내용", encoding="utf-8")
+
+    plan_path, _ = executor.create_plan(issue_dir, spec_path, issue_number=1)
+    executor.create_plan(issue_dir, spec_path, issue_number=1, regenerate=True)
+    executor.create_tasks(issue_dir, plan_path, issue_number=1, regenerate=True)
+
+    assert spec_kit.calls == [("plan", True), ("plan", False), ("tasks", False)]
+
+
+class _CachingSpecKit:
+    """응답 캐시를 거쳐 단계별로 버전이 올라가는 문서를 생성하는 Spec-kit 대역"""
+
+    def __init__(self):
+        self.calls = {"spec": 0, "plan": 0, "tasks": 0}
+
+    def _generate(self, stage, prompt, use_cache):
+        cache = response_cache_module.get_response_cache()
+        if use_cache:
+            cached = cache.get("gemini", None, None, prompt)
+            if cached is not None:
+                return cached
+        self.calls[stage] += 1
+        output = f"# {stage} v{self.calls[stage]}"
+        cache.put("gemini", None, None, prompt, output)
+        return output
+
+    def generate_spec(self, issue, use_cache=True):
+        return self._generate("spec", f"spec:{issue.title}", use_cache)
+
+    def generate_plan(self, spec_content, use_cache=True, issue_number=None):
+        return self._generate("plan", f"plan:{spec_content}", use_cache)
+
+    def generate_tasks(self, plan_content, use_cache=True, issue_number=None):
+        return self._generate("tasks", f"tasks:{plan_content}", use_cache)
+
+
+class _StageReviewer(ReviewAgent):
+    """Spec 승인, 첫 Plan 거부, Tasks 거부 (구현 단계 전에 멈춤)"""
+
+    def review_spec(self, content, issue_title):
+        return ReviewResult(approved=True, comments="ok", score=1.0)
+
+    def review_plan(self, content, spec_content):
+        approved = "v1" not in content
+        return ReviewResult(approved=approved, comments="ok" if approved else "Plan 거부", score=float(approved))
+
+    def review_tasks(self, content, plan_content):
+        return ReviewResult(approved=False, comments="Tasks 거부", score=0.0)
+
+
+class _SilentSlack:
+    def send_message(self, channel, message):
+        return None
+
+
+def test_rejected_document_is_regenerated_after_approve(tmp_path, monkeypatch):
+    cache = _cache(tmp_path)
+    monkeypatch.setattr(response_cache_module, "_response_cache", cache)
+    spec_kit = _CachingSpecKit()
+    executor = StageExecutor(
+        FileManager(base_dir=str(tmp_path / "specs")),
+        _StageReviewer(),
+        spec_kit_client=spec_kit,
+        speculator=SpeculativeExecutor(enabled=False)
+    )
+    orchestrator = WorkflowOrchestrator(executor, _SilentSlack())
+    now = datetime.now()
+    issue = GitHubIssue(number=7, title="로그인", body="로그인 기능", state="open", labels=[],
+                        created_at=now, updated_at=now, url="", author="dev")
+
+    # Spec 승인 → Plan v1 거부: 거부된 Plan만 캐시에서 제거
+    orchestrator.start_workflow(issue)
+    state = orchestrator.get_state(7)
+    assert (state.current_stage, state.approval_status) == (WorkflowStage.PLAN, ApprovalStatus.REJECTED)
+    assert cache.get("gemini", None, None, "spec:로그인") == "# spec v1"
+    assert cache.get("gemini", None, None, "plan:# spec v1") is None
+
+    # 사용자 승인 → Tasks 단계로 진행
+    orchestrator.approve_and_continue(7)
+    assert orchestrator.get_state(7).current_stage == WorkflowStage.TASKS
+
+    # 재실행: Spec은 캐시에서, 거부됐던 Plan은 새로 생성
+    orchestrator.start_workflow(issue)
+    plan_path = orchestrator.get_state(7).plan_path
+    assert Path(plan_path).read_text(encoding="utf-8") == "# plan v2"
+    assert spec_kit.calls == {"spec": 1, "plan": 2, "tasks": 2}
@@ -0,0 +1,82 @@
+"""
+ReviewAgent 테스트
+
+LLM 리뷰(spec_reviewer)는 Spec에만 사용하고, Plan/Tasks는 각 문서 유형의 규칙으로 검사하는지 확인
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from agents.llm_review_agent import LLMReviewAgent
+from workflow.review_agent import ReviewAgent
+
+
+PLAN = """# Implementation Plan
+
+## Technical Context
+Python 3.11, FastAPI, pytest
+
+## Project Structure
+src/api, src/models, tests/
+
+## Phase 1: Setup
+프로젝트 구조 생성
+
+## Phase 2: Implementation
+로그인 API 구현
+
+## Verification
+pytest로 API 테스트
+""" + "상세 설명. " * 120
+
+TASKS = """# Tasks
+
+## Phase 1: Setup
+- [ ] T001 프로젝트 구조 생성
+- [ ] T002 의존성 설치
+
+Checkpoint: 서버 실행 확인
+
+## Phase 2: Implementation
+- [ ] T003 로그인 API 구현
+
+Checkpoint: 테스트 통과
+
+## Dependencies
+T003은 T001, T002 이후 실행
+""" + "상세 설명. " * 150
+
+
+class _SpyReviewer(LLMReviewAgent):
+    """review_spec 호출을 기록하는 LLM Review Agent (LLM 미사용)"""
+
+    def __init__(self):
+        super().__init__(use_llm=False)
+        self.calls = []
+
+    def review_spec(self, content, issue_title, issue_body=""):
+        self.calls.append(issue_title)
+        return super().review_spec(content, issue_title, issue_body)
+
+
+def test_plan_and_tasks_use_their_own_rules_with_spec_reviewer():
+    reviewer = _SpyReviewer()
+    agent = ReviewAgent(spec_reviewer=reviewer)
+
+    plan = agent.review_plan(PLAN, spec_content="# Spec")
+    tasks = agent.review_tasks(TASKS, plan_content=PLAN)
+
+    assert plan.approved is True
+    assert plan.comments.startswith("Plan 리뷰 결과")
+    assert tasks.approved is True
+    assert tasks.comments.startswith("Tasks 리뷰 결과")
+    assert reviewer.calls == []
+
+
+def test_spec_is_delegated_to_spec_reviewer():
+    reviewer = _SpyReviewer()
+
+    ReviewAgent(spec_reviewer=reviewer).review_spec("# Spec", "로그인")
+
+    assert reviewer.calls == ["로그인"]
@@ -0,0 +1,102 @@
+"""
+SpeculativeExecutor 테스트
+
+- 백엔드 한도를 기다리는 실제 작업이 있으면 사전 생성을 시작하지 않음
+- 폐기된 사전 생성은 실행 중이어도 중단
+- 실행 중에 실제 작업이 같은 백엔드를 기다리기 시작하면 사전 생성을 중단하고 양보
+"""
+import sys
+import threading
+import time
+from contextlib import ExitStack
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import workflow.speculation as speculation_module
+from utils import cancellation
+from utils.rate_limiter import RateLimiter
+from workflow.speculation import SpeculativeExecutor
+
+
+def _limiter(monkeypatch) -> RateLimiter:
+    limiter = RateLimiter()
+    monkeypatch.setattr(speculation_module, "get_rate_limiter", lambda: limiter)
+    return limiter
+
+
+def test_skips_when_backend_limiter_is_saturated(monkeypatch):
+    limiter = _limiter(monkeypatch)
+    speculator = SpeculativeExecutor(enabled=True, backends=("gemini",))
+    gemini = limiter.for_backend("gemini")
+
+    with gemini.limit(), gemini.limit(), gemini.limit(), gemini.limit():  # 기본 동시 호출 수 4
+        assert not speculator.start(1, "plan", "spec", lambda: "plan")
+    assert speculator.snapshot()['skipped_contended'] == 1
+
+    assert speculator.start(1, "plan", "spec", lambda: "plan")
+    assert speculator.take(1, "plan", "spec") == "plan"
+    speculator.shutdown()
+
+
+def test_discard_cancels_running_generation(monkeypatch):
+    _limiter(monkeypatch)
+    speculator = SpeculativeExecutor(enabled=True, backends=())
+    started = threading.Event()
+    stopped = threading.Event()
+
+    def generate():
+        started.set()
+        try:
+            cancellation.sleep(30)  # 백엔드 호출 대신 취소 가능한 대기
+        finally:
+            stopped.set()
+        return "plan"
+
+    assert speculator.start(1, "plan", "spec", generate)
+    assert started.wait(5)
+    speculator.discard(1)
+
+    assert stopped.wait(5)
+    deadline = time.monotonic() + 5
+    while speculator.snapshot()['running'] and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert speculator.snapshot()['running'] == 0
+    speculator.shutdown()
+
+
+def test_running_generation_yields_to_waiting_real_work(monkeypatch):
+    limiter = _limiter(monkeypatch)
+    monkeypatch.setattr(speculation_module, "PREEMPT_POLL_SECONDS", 0.05)
+    speculator = SpeculativeExecutor(enabled=True, backends=("gemini",))
+    gemini = limiter.for_backend("gemini")
+    started = threading.Event()
+    stopped = threading.Event()
+
+    def generate():
+        started.set()
+        try:
+            cancellation.sleep(30)
+        finally:
+            stopped.set()
+        return "plan"
+
+    def call_gemini():
+        with gemini.limit():
+            pass
+
+    assert speculator.start(1, "plan", "spec", generate)
+    assert started.wait(5)
+
+    with ExitStack() as held:
+        for _ in range(4):  # 기본 동시 호출 수 4를 모두 점유
+            held.enter_context(gemini.limit())
+        real_work = threading.Thread(target=call_gemini)
+        real_work.start()  # 실제 작업이 한도를 기다리는 상태
+
+        assert stopped.wait(5)
+    real_work.join(5)
+
+    assert speculator.snapshot()['preempted'] == 1
+    assert speculator.take(1, "plan", "spec") is None
+    speculator.shutdown()
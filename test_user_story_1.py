@@ -44,18 +44,19 @@ def test_github_webhook():
         headers=headers
     )
     
-    if response.status_code == 200:
+    if response.status_code == 202:
         result = response.json()
         print("✅ 워크플로우 시작 성공!")
         print(f"   상태: {result['status']}")
         print(f"   메시지: {result['message']}")
+        print(f"   작업 ID: {result['job_id']} (GET /api/jobs/{result['job_id']})")
         print(f"\n📂 생성된 파일을 확인하세요:")
         print(f"   specs/{payload['issue']['number']}-테스트-기능-구현/spec.md")
     else:
         print(f"❌ 오류 발생: {response.status_code}")
         print(f"   {response.text}")
     
-    return response.status_code == 200
+    return response.status_code == 202
 
 
 def test_manual_approval(issue_number: int):
@@ -65,7 +66,7 @@ def test_manual_approval(issue_number: int):
     
     response = requests.post(f"{BASE_URL}/api/approve/{issue_number}")
     
-    if response.status_code == 200:
+    if response.status_code == 202:
         result = response.json()
         print(f"✅ 승인 성공!")
         print(f"   상태: {result['status']}")
@@ -73,7 +74,7 @@ def test_manual_approval(issue_number: int):
         print(f"❌ 오류 발생: {response.status_code}")
         print(f"   {response.text}")
     
-    return response.status_code == 200
+    return response.status_code == 202
 
 
 if __name__ == "__main__":